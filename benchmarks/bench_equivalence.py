@@ -0,0 +1,485 @@
+"""
+Harness golden output: bukti bahwa engine/mode baru menghasilkan error yang sama.
+
+Acuan (golden) adalah script sebelum rewrite: salinan persis di
+benchmarks/legacy/ (loop iterrows + tqdm, membaca extract dari folder script).
+Setiap validator dijalankan (proses Python baru per run) dengan script lama itu
+dan setiap varian di VARIANTS, atas extract contoh hasil generator atau extract
+asli yang dianonimkan. Isi setiap sheet output dibandingkan persis (multiset
+baris) dengan acuan. Terhadap script lama hanya sheet yang bisa dihasilkan
+script lama yang dibandingkan (tanpa RINGKASAN, sheet cek referensi REF_*, dan
+sheet rule plugin). Validator tanpa script lama (konsistensi) memakai `--engine rows`
+sebagai acuan.
+
+Dilaporkan juga waktu total proses, waktu cek rule (dari --metrics, tanpa baca
+extract dan tulis Excel), speedup cek rule terhadap `--engine rows` (script lama
+tidak mencatat waktu per stage), dan selisih puncak memori terhadap acuan.
+
+    python benchmarks/bench_equivalence.py [--rows 20000] [--seed 1]
+    python benchmarks/bench_equivalence.py --data D:/extract/202410 --anonymize
+    python benchmarks/bench_equivalence.py --variant "baru=--engine unique --no-checkpoint"
+
+Exit code 1 bila ada varian yang hasilnya berbeda atau gagal dijalankan.
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import os
+import random
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from validasi.plugins import load_plugin_rules  # noqa: E402
+from validasi.rules import sheet_names_of  # noqa: E402
+from validasi.scripts import FIXTURE_FILES, load_validator, required_columns  # noqa: E402
+from validasi.scripts import VALIDATORS as RULE_VALIDATORS  # noqa: E402
+
+VALIDATORS = RULE_VALIDATORS + ['konsistensi']
+
+LEGACY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'legacy')
+
+# Varian yang dibandingkan: nama -> (argumen CLI, CHUNK_ROWS checkpoint atau None = default).
+# Engine/mode baru cukup ditambahkan di sini (atau lewat --variant).
+# LEGACY = script lama di LEGACY_DIR, dijalankan apa adanya (tanpa argumen).
+LEGACY = 'legacy'
+BASELINE = LEGACY
+FALLBACK_BASELINE = 'rows'  # acuan untuk validator yang tidak punya script lama
+TIMING_BASELINE = 'rows'  # acuan speedup cek rule (script lama tidak punya --metrics)
+VARIANTS = {
+    LEGACY: (None, None),
+    'rows': (['--engine', 'rows', '--no-checkpoint'], None),
+    'unique': (['--engine', 'unique', '--no-checkpoint'], None),
+    'unique-chunk': (['--engine', 'unique'], 1_000),
+}
+
+# Validator tanpa checkpoint: varian dengan CHUNK_ROWS tidak berarti apa-apa di sini
+NOT_RESUMABLE = ('konsistensi',)
+
+# Sheet yang isinya bergantung pada run sebelumnya, bukan pada engine
+SKIPPED_SHEETS = ('PERUBAHAN',)
+
+# Sheet laporan yang baru ada setelah rewrite (tidak pernah dihasilkan script lama)
+REPORT_SHEETS = ('RINGKASAN',)
+
+# Kolom identitas yang disamarkan oleh --anonymize (huruf -> huruf, angka -> angka)
+ANONYMIZE_COLUMNS = {
+    'CUST_NO', 'AGRMNT_NO', 'PARTNER_AGRMNT_NO', 'CUST_NAME', 'NPWP_NO', 'ID_NO', 'SPOUSE_ID_NO',
+    'MOBILE_PHN', 'CUST_ADDR', 'MNGMNT_ADDR', 'MOTHER_MAIDEN_NAME', 'SPOUSE_NAME',
+}
+
+# Dijalankan di proses baru: satu validator, satu varian; hasil (waktu, memori) ke stdout sebagai JSON
+RUNNER = """
+import contextlib, io, json, sys, time
+config = json.loads(sys.argv[1])
+sys.path.insert(0, config['root'])
+import validasi.checkpoint
+if config['chunk_rows']:
+    validasi.checkpoint.CHUNK_ROWS = config['chunk_rows']
+from validasi.progress import peak_memory_bytes
+from validasi.scripts import load_validator
+module = load_validator(config['validator'], config['root'])
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    module.run_validation(module.parse_args(config['argv']))
+sys.stdout.write(json.dumps({'seconds': time.perf_counter() - started, 'peak_memory_bytes': peak_memory_bytes()}))
+"""
+
+# Sama untuk script lama: dijalankan sebagai __main__ dari folder kerja (pandas & tqdm dimuat sebelum timer)
+LEGACY_RUNNER = """
+import contextlib, io, json, runpy, sys, time
+config = json.loads(sys.argv[1])
+sys.path.insert(0, config['root'])
+import pandas, tqdm
+from validasi.progress import peak_memory_bytes
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    runpy.run_path(config['script'], run_name='__main__')
+sys.stdout.write(json.dumps({'seconds': time.perf_counter() - started, 'peak_memory_bytes': peak_memory_bytes()}))
+"""
+
+
+# ==========================================
+# EXTRACT CONTOH (GENERATOR)
+# ==========================================
+
+NAMES = ['BUDI', 'SITI', 'ANI', 'JOKO', 'DEWI S', 'A-B', '', '12', 'KEL@1', 'JL. MAWAR NO 5']
+
+
+def _digits(rng, n):
+    return ''.join(rng.choice('0123456789') for _ in range(n))
+
+
+def _date(rng):
+    return f'{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-19{rng.randint(50, 99):02d}'
+
+
+def fake_value(rng, column):
+    """Nilai contoh untuk `column`: campuran nilai valid dan nilai yang sengaja salah format."""
+    c = column.upper()
+    if c.endswith('_DT') or c.startswith('TGL_'):
+        return rng.choice([_date(rng), _date(rng).replace('-', '/'), '', '12345', '1990'])
+    if 'ZIPCODE' in c:
+        return rng.choice([_digits(rng, 5), _digits(rng, 5), _digits(rng, 4), 'A1234', ''])
+    if 'NPWP' in c:
+        return rng.choice([_digits(rng, 15), _digits(rng, 16), _digits(rng, 17), '1.234,5', ''])
+    if c.endswith('ID_NO'):
+        return rng.choice([_digits(rng, 16), _digits(rng, 10), '12-3', ''])
+    if 'PHN' in c or 'PHONE' in c:
+        return rng.choice([_digits(rng, 11), '08-1', '1,000.5', ''])
+    if c.endswith('_AMT') or 'INCOME' in c or 'PORTION' in c:
+        return rng.choice(['0', '50', '5000', '10.5', '1,5', 'abc', ''])
+    if 'YEAR' in c:
+        return rng.choice(['1999', '99', 'abcd', ''])
+    if c in ('CUST_TYPE', 'SHAREHOLDER_TYPE'):
+        return rng.choice(['P', 'C', 'X', ''])
+    if c in ('SEX', 'MR_GENDER'):
+        return rng.choice(['M', 'F', 'X', ''])
+    if c == 'MARITAL_STAT':
+        return rng.choice(['S', 'M', 'D', 'X'])
+    if c == 'CONTRACT_STATUS':
+        return rng.choice(['EXP', 'LIV', ''])
+    if c == 'DEFAULT_STATUS':
+        return rng.choice(['NM', 'NA', 'WO'])
+    if c == 'DATI_II':
+        return rng.choice([_digits(rng, 4), '12', '12a4'])
+    if c == 'BRANCH_CODE':
+        return rng.choice(['001', '002', ''])
+    if c == 'PARTNER_NAME':
+        return rng.choice(['PARTNER A', 'PARTNER B', ''])
+    if c == 'ID_TYPE':
+        return rng.choice(['NIK', 'KTP', 'PASPOR'])
+    if any(part in c for part in ('NAME', 'ADDR', 'KEL', 'KEC', 'CITY', 'PLACE')):
+        return rng.choice(NAMES)
+    return rng.choice(['1', '5', '10', 'A', 'X1', '1-2', '12/A', ''])
+
+
+def _nik(rng, birth_dt, gender):
+    """ID_NO yang cocok dengan tanggal lahir/gender (supaya cabang valid NIK ikut teruji)."""
+    if len(birth_dt) != 10 or birth_dt[2] != '-':
+        return _digits(rng, 16)
+    day = int(birth_dt[:2]) + (40 if gender == 'F' else 0)
+    return f'{_digits(rng, 6)}{day:02d}{birth_dt[3:5]}{birth_dt[8:10]}{_digits(rng, 4)}'
+
+
+def write_fixtures(target_dir, n_customers, seed):
+    """Tulis satu set extract contoh (semua peran file) dengan relasi CUST_NO antar file."""
+    rng = random.Random(seed)
+    columns = required_columns(VALIDATORS)
+    customers = [f'C{i:07d}' for i in range(n_customers)]
+
+    def rows_for(role, cust_nos, **fixed):
+        for i, cust_no in enumerate(cust_nos):
+            row = {col: fake_value(rng, col) for col in columns[role]}
+            row['CUST_NO'] = cust_no
+            row.update({col: value(i) for col, value in fixed.items()})
+            yield row
+
+    core_customers = [rng.choice(customers[:int(n_customers * 0.95)]) for _ in range(int(n_customers * 1.2))]
+    tables = {
+        'coreaccount': list(rows_for('coreaccount', core_customers, AGRMNT_NO=lambda i: f'AG{i:08d}')),
+        'customer': list(rows_for('customer', customers)),
+        'customerpersonal': list(rows_for('customerpersonal', customers[:int(n_customers * 0.6)])),
+        'custcorporate': list(rows_for('custcorporate', customers[int(n_customers * 0.6):int(n_customers * 0.9)])),
+        'custcorpmanagement': list(rows_for(
+            'custcorpmanagement', [rng.choice(customers[int(n_customers * 0.55):]) for _ in range(n_customers // 2)])),
+    }
+    birth = {row['CUST_NO']: row.get('BIRTH_DT', '') for row in tables['customer']}
+    for row in tables['customerpersonal']:
+        if rng.random() < 0.6:
+            row['ID_NO'] = _nik(rng, birth[row['CUST_NO']], row.get('MR_GENDER', ''))
+    # Beberapa baris duplikat, seperti extract asli
+    tables['customer'].append(dict(tables['customer'][3]))
+    tables['customerpersonal'].append(dict(tables['customerpersonal'][0]))
+
+    for role, rows in tables.items():
+        with open(os.path.join(target_dir, FIXTURE_FILES[role]), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns[role], delimiter='|', lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
+
+# ==========================================
+# ANONIMISASI EXTRACT ASLI
+# ==========================================
+
+def _mask(value, key):
+    """Samarkan nilai dengan hash berkunci: panjang dan jenis karakter tetap, nilai sama -> hasil sama."""
+    if not value:
+        return value
+    stream = hashlib.shake_256(key + value.encode('utf-8', 'surrogateescape')).digest(len(value))
+    masked = []
+    for ch, b in zip(value, stream):
+        if ch.isdigit():
+            masked.append(chr(48 + b % 10))
+        elif 'A' <= ch <= 'Z':
+            masked.append(chr(65 + b % 26))
+        elif 'a' <= ch <= 'z':
+            masked.append(chr(97 + b % 26))
+        else:
+            masked.append(ch)
+    return ''.join(masked)
+
+
+def anonymize_extracts(source_dir, target_dir):
+    """
+    Salin semua extract .txt dengan kolom identitas disamarkan. Kunci acak per run,
+    jadi hasil tidak bisa dipetakan balik; relasi CUST_NO antar file tetap utuh.
+    Error yang bergantung pada isi nilai (misal NIK vs tanggal lahir) bisa berbeda
+    dari data asli, tetapi semua varian dibandingkan atas salinan yang sama.
+    """
+    key = os.urandom(16)
+    for path in sorted(glob.glob(os.path.join(source_dir, '*.txt'))):
+        with open(path, encoding='utf-8', errors='surrogateescape', newline='') as src, \
+                open(os.path.join(target_dir, os.path.basename(path)), 'w', encoding='utf-8',
+                     errors='surrogateescape', newline='') as dst:
+            reader = csv.reader(src, delimiter='|')
+            writer = csv.writer(dst, delimiter='|', lineterminator='\n')
+            header = next(reader, None)
+            if header is None:
+                continue
+            writer.writerow(header)
+            masked = [i for i, col in enumerate(header) if col.strip().upper() in ANONYMIZE_COLUMNS]
+            for row in reader:
+                for i in masked:
+                    if i < len(row):
+                        row[i] = _mask(row[i], key)
+                writer.writerow(row)
+
+# ==========================================
+# MENJALANKAN VARIAN & MEMBANDINGKAN OUTPUT
+# ==========================================
+
+def legacy_script(validator):
+    return os.path.join(LEGACY_DIR, f'validasi-data-{validator}.py')
+
+
+def run_variant(validator, data_dir, work_dir, argv, chunk_rows, extra_argv):
+    """
+    Jalankan satu validator atas salinan `data_dir` di `work_dir`; kembalikan (hasil JSON, pesan error).
+    `argv` None = script lama, disalin ke `work_dir` karena membaca extract dari folder script-nya.
+    """
+    os.makedirs(work_dir)
+    for path in glob.glob(os.path.join(data_dir, '*.txt')):
+        target = os.path.join(work_dir, os.path.basename(path))
+        try:
+            os.link(path, target)
+        except OSError:
+            shutil.copy2(path, target)
+
+    if argv is None:
+        script = shutil.copy2(legacy_script(validator), work_dir)
+        run, error = _execute(LEGACY_RUNNER, {'root': ROOT_DIR, 'script': script})
+        if run is not None:
+            run['rule_seconds'] = None
+        return run, error
+
+    metrics_path = os.path.join(work_dir, 'metrics.jsonl')
+    config = {
+        'root': ROOT_DIR,
+        'validator': validator,
+        'chunk_rows': chunk_rows,
+        'argv': ['--dir', work_dir, '--riwayat', os.path.join(work_dir, 'riwayat'),
+                 '--metrics', metrics_path] + extra_argv + argv,
+    }
+    run, error = _execute(RUNNER, config)
+    if run is not None:
+        run['rule_seconds'] = rule_seconds(metrics_path)
+    return run, error
+
+
+def _execute(runner, config):
+    out = subprocess.run([sys.executable, '-c', runner, json.dumps(config)], capture_output=True, text=True, cwd=ROOT_DIR)
+    if out.returncode != 0:
+        return None, (out.stderr.strip().splitlines() or ['(tanpa pesan)'])[-1]
+    return json.loads(out.stdout.strip().splitlines()[-1]), None
+
+
+def rule_seconds(metrics_path):
+    """Total waktu cek rule (jumlah RuleCosts) dari snapshot metrik terakhir; None bila tidak ada."""
+    if not os.path.exists(metrics_path):
+        return None
+    with open(metrics_path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    if not lines:
+        return None
+    return sum(cost['seconds'] for cost in json.loads(lines[-1])['rule_costs'])
+
+
+def read_output_sheets(work_dir):
+    """Semua sheet di file output DATA_*_TIDAK_VALID.xlsx (kosong bila tidak ada error)."""
+    import pandas as pd
+
+    sheets = {}
+    for path in glob.glob(os.path.join(work_dir, 'DATA_*_TIDAK_VALID.xlsx')):
+        for name, df in pd.read_excel(path, sheet_name=None, dtype=str).items():
+            if name not in SKIPPED_SHEETS:
+                sheets[name] = df.fillna('<NA>')
+    return sheets
+
+
+def new_sheets(validator, plugin_dir):
+    """
+    Sheet yang tidak bisa dihasilkan script lama `validator`: laporan (RINGKASAN),
+    cek referensi (REF_*), dan rule plugin di `plugin_dir`. Tidak dibandingkan
+    bila salah satu sisi adalah script lama.
+    """
+    sheets = set(REPORT_SHEETS)
+    sheets.update(check[0] for check in getattr(load_validator(validator), 'REFERENCE_CHECKS', ()))
+    if plugin_dir:
+        sheets.update(sheet_names_of(load_plugin_rules(plugin_dir, validator)))
+    return sheets
+
+
+def compare_sheets(expected, actual, ignored=()):
+    """
+    Bandingkan sheet per sheet sebagai multiset baris (sheet di `ignored` dilewati).
+    Mengembalikan daftar perbedaan (kosong = sama persis) dan daftar sheet yang
+    isinya sama tetapi urutannya beda.
+    """
+    problems, reordered = [], []
+    for name in dict.fromkeys(list(expected) + list(actual)):
+        if name in ignored:
+            continue
+        if name not in actual:
+            problems.append(f'{name}: sheet tidak ada ({len(expected[name])} baris di baseline)')
+            continue
+        if name not in expected:
+            problems.append(f'{name}: sheet tambahan ({len(actual[name])} baris)')
+            continue
+        exp, act = expected[name], actual[name]
+        if list(exp.columns) != list(act.columns):
+            problems.append(f'{name}: kolom berbeda')
+            continue
+        exp_rows = Counter(map(tuple, exp.itertuples(index=False)))
+        act_rows = Counter(map(tuple, act.itertuples(index=False)))
+        missing, extra = exp_rows - act_rows, act_rows - exp_rows
+        if missing or extra:
+            problems.append(f'{name}: {sum(missing.values())} baris hilang, {sum(extra.values())} baris tambahan')
+        elif not exp.equals(act):
+            reordered.append(name)
+    return problems, reordered
+
+
+def _mb(value):
+    return value / 1024 ** 2 if value is not None else float('nan')
+
+
+def _seconds(value):
+    return f'{value:8.2f}s' if value is not None else f'{"-":>9}'
+
+
+def _speedup(value):
+    return f'{value:7.2f}x' if value is not None else f'{"-":>8}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20_000, help="Jumlah CUST_NO di extract contoh (default 20000).")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--data', default=None, help="Folder extract asli (.txt) sebagai pengganti extract contoh.")
+    parser.add_argument('--anonymize', action='store_true', help="Samarkan kolom identitas extract --data sebelum dipakai.")
+    parser.add_argument('--referensi', default=None,
+                        help="Folder tabel referensi yang diteruskan ke validator (default: folder kosong, tanpa cek referensi).")
+    parser.add_argument('--plugin', default=None,
+                        help="Folder rule plugin yang diteruskan ke validator (default: folder kosong, tanpa rule plugin).")
+    parser.add_argument('--validator', action='append', choices=VALIDATORS, help="Validator yang diuji (default: semua).")
+    parser.add_argument('--baseline', default=BASELINE,
+                        help=f"Varian acuan (default: {BASELINE}, atau {FALLBACK_BASELINE} bila validator tidak punya script lama).")
+    parser.add_argument('--variant', action='append', default=[], metavar='NAMA=ARGUMEN',
+                        help="Varian tambahan, misal \"baru=--engine unique --no-checkpoint\".")
+    parser.add_argument('--json', default=None, help="Simpan hasil lengkap ke file JSON.")
+    opts = parser.parse_args(argv)
+
+    variants = dict(VARIANTS)
+    for spec in opts.variant:
+        name, _, args = spec.partition('=')
+        variants[name] = (shlex.split(args), None)
+    if opts.baseline not in variants:
+        parser.error(f"varian baseline '{opts.baseline}' tidak dikenal")
+
+    def available(name, validator):
+        argv_variant, chunk_rows = variants[name]
+        if argv_variant is None:
+            return os.path.exists(legacy_script(validator))
+        return not (chunk_rows and validator in NOT_RESUMABLE)
+
+    results, failed = [], False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'data')
+        os.makedirs(data_dir)
+        if opts.data and opts.anonymize:
+            anonymize_extracts(opts.data, data_dir)
+        elif opts.data:
+            data_dir = opts.data
+        else:
+            write_fixtures(data_dir, opts.rows, opts.seed)
+        # Tanpa --referensi/--plugin validator memakai folder kosong, bukan folder referensi/ dan
+        # plugin/ di samping script, supaya hasil tidak bergantung pada isi folder produksi
+        empty_dir = os.path.join(tmp_dir, 'kosong')
+        os.makedirs(empty_dir)
+        extra_argv = ['--referensi', opts.referensi or empty_dir, '--plugin', opts.plugin or empty_dir]
+
+        print(f"{'validator':<20} {'varian':<14} {'hasil':<10} {'waktu':>9} {'cek rule':>9} {'speedup':>8} "
+              f"{'memori':>9} {'selisih':>9}")
+        for validator in opts.validator or VALIDATORS:
+            names = [name for name in variants if available(name, validator)]
+            golden = opts.baseline if opts.baseline in names else FALLBACK_BASELINE
+            # Acuan dulu, lalu acuan speedup, supaya keduanya sudah ada saat varian lain dicetak
+            order = list(dict.fromkeys([golden, TIMING_BASELINE] + names))
+            baseline = timing = None
+            legacy_ignored = new_sheets(validator, opts.plugin) if LEGACY in order else ()
+            for name in order:
+                argv_variant, chunk_rows = variants[name]
+                work_dir = os.path.join(tmp_dir, validator, name)
+                run, error = run_variant(validator, data_dir, work_dir, argv_variant, chunk_rows, extra_argv)
+                row = {'validator': validator, 'variant': name, 'problems': [], 'reordered': []}
+                if run is None:
+                    row.update(status='GAGAL', problems=[error])
+                elif baseline is None:
+                    row.update(run, status='BASELINE', sheets=read_output_sheets(work_dir))
+                else:
+                    ignored = legacy_ignored if LEGACY in (golden, name) else ()
+                    problems, reordered = compare_sheets(baseline['sheets'], read_output_sheets(work_dir), ignored)
+                    row.update(run, status='BERBEDA' if problems else 'SAMA', problems=problems, reordered=reordered)
+                results.append(row)
+                failed |= row['status'] in ('GAGAL', 'BERBEDA')
+
+                if run is None:
+                    print(f"{validator:<20} {name:<14} GAGAL      {error}")
+                    if name == golden:
+                        break  # tanpa baseline varian lain tidak bisa dibandingkan
+                    continue
+                if name == golden:
+                    baseline = row
+                if name == TIMING_BASELINE:
+                    timing = row
+                # Speedup dihitung dari waktu cek rule saja; baca extract & tulis Excel sama di semua varian
+                speedup = None
+                if timing is not None and timing['rule_seconds'] is not None and row['rule_seconds']:
+                    speedup = round(timing['rule_seconds'] / row['rule_seconds'], 3)
+                delta = _mb(row['peak_memory_bytes']) - _mb(baseline['peak_memory_bytes'])
+                row.update(speedup=speedup, memory_delta_mb=round(delta, 1))
+                print(f"{validator:<20} {name:<14} {row['status']:<10} {_seconds(row['seconds'])} "
+                      f"{_seconds(row['rule_seconds'])} {_speedup(speedup)} "
+                      f"{_mb(row['peak_memory_bytes']):7.0f}MB {delta:+7.0f}MB")
+                for problem in row['problems']:
+                    print(f"    - {problem}")
+                if row['reordered']:
+                    print(f"    (isi sama, urutan baris beda: {', '.join(row['reordered'])})")
+
+    if opts.json:
+        with open(opts.json, 'w', encoding='utf-8') as f:
+            json.dump([{k: v for k, v in row.items() if k != 'sheets'} for row in results], f, indent=2)
+    print("Semua varian menghasilkan error yang sama." if not failed else "Ada varian yang berbeda atau gagal.")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
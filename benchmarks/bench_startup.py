@@ -0,0 +1,83 @@
+"""
+Benchmark waktu startup script validasi.
+
+Mengukur `python validasi-data-<x>.py --check` (tanpa pandas) dibanding waktu
+`import pandas` saja, lalu memastikan target waktu startup tercapai.
+
+    python benchmarks/bench_startup.py [--repeat 5] [--target 0.25]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from validasi.scripts import FIXTURE_FILES, VALIDATORS, required_columns, script_path  # noqa: E402
+
+# Target median detik untuk satu `--check` (proses Python baru, tanpa pandas)
+STARTUP_TARGET_SECONDS = 0.25
+
+
+def write_header_fixtures(target_dir):
+    """Tulis file extract berisi header saja dari gabungan REQUIRED_COLUMNS semua script."""
+    columns = required_columns()
+    for role, file_name in FIXTURE_FILES.items():
+        with open(os.path.join(target_dir, file_name), 'w', encoding='utf-8') as f:
+            f.write('|'.join(columns[role]) + '\n')
+
+
+def time_command(cmd, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def imports_pandas(script, data_dir):
+    """Jalankan --check di proses baru dan laporkan apakah pandas ikut ter-import."""
+    code = (
+        "import runpy, sys\n"
+        f"sys.argv = [{script!r}, '--check', '--dir', {data_dir!r}]\n"
+        "try:\n"
+        f"    runpy.run_path({script!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.__stdout__.write(str('pandas' in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=ROOT_DIR)
+    return out.stdout.strip().endswith('True')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--target', type=float, default=STARTUP_TARGET_SECONDS)
+    opts = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_header_fixtures(data_dir)
+
+        baseline = time_command([sys.executable, '-c', 'import pandas'], opts.repeat)
+        print(f"{'import pandas':<28} {baseline:7.3f} s")
+
+        failed = False
+        for name in VALIDATORS:
+            script = script_path(name)
+            elapsed = time_command([sys.executable, script, '--check', '--dir', data_dir], opts.repeat)
+            loads_pandas = imports_pandas(script, data_dir)
+            ok = elapsed <= opts.target and not loads_pandas
+            failed |= not ok
+            print(f"{name + ' --check':<28} {elapsed:7.3f} s  pandas={'ya' if loads_pandas else 'tidak'}  "
+                  f"{'OK' if ok else 'GAGAL'} (target {opts.target:.2f} s)")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,4 +4,6 @@ python "%~dp0validasi-data-customer.py"
 python "%~dp0validasi-data-customerpersonal.py"
 python "%~dp0validasi-data-custcorporate.py"
 python "%~dp0validasi-data-custcorpmanagement.py"
+python "%~dp0validasi-data-duplikat.py"
+python "%~dp0validasi-data-konsistensi.py"
 pause
\ No newline at end of file
@@ -1,6 +1,9 @@
-import pandas as pd
 import os
-from tqdm import tqdm
+import sys
+
+from validasi.cli import parse_args
+from validasi.rules import rule
+from validasi.schema import check_schema
 
 # ==========================================
 # STEP 1: FUNGSI VALIDASI MODULAR (UNIT)
@@ -11,15 +14,13 @@ def validate_not_blank(value):
     val_str = str(value).strip()
     return val_str != "" and val_str.lower() != 'nan'
 
-def validate_lunas(row):
+def validate_lunas(contract_status, default_status, os_principal, os_interest):
     """
     Memvalidasi logika pelunasan berdasarkan CONTRACT_STATUS, DEFAULT_STATUS, dan sisa kewajiban.
     Mengembalikan tuple (is_valid, message).
     """
-    contract_status = str(row.get('CONTRACT_STATUS', '')).strip().upper()
-    default_status = str(row.get('DEFAULT_STATUS', '')).strip().upper()
-    os_principal = row.get('OS_PRINCIPAL_AMT', 0)
-    os_interest = row.get('OS_INTEREST_AMT', 0)
+    contract_status = str(contract_status).strip().upper()
+    default_status = str(default_status).strip().upper()
 
     # Kondisi error 1: Seharusnya sudah lunas tapi status kontrak belum EXP
     if contract_status != 'EXP' and os_principal < 100 and os_interest < 100:
@@ -32,28 +33,84 @@ def validate_lunas(row):
     # Jika tidak ada kondisi error yang terpenuhi, maka data dianggap valid.
     return (True, None)
 
+def check_lunas(*values):
+    return validate_lunas(*values)[0]
+
+def lunas_message(*values):
+    return validate_lunas(*values)[1]
+
 # ==========================================
 # STEP 2: PROSES UTAMA VALIDASI
 # ==========================================
 
-def run_validation():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+# Daftar kolom yang akan divalidasi tidak boleh kosong
+COLUMNS_TO_VALIDATE_NOT_BLANK = [
+    "GENERATED_DT", "PARTNER_CODE", "PARTNER_NAME", "PARTNER_AGRMNT_NO", "AGRMNT_NO",
+    "ASSET_CATEGORY_CODE", "ASSET_NAME", "ASSET_PRICE_AMT", "CURR_CODE", "CUST_NAME",
+    "CUST_NO", "LAST_INST_DT", "EFFECTIVE_DT", "EFFECTIVE_RATE_PRCNT", "FIRST_INST_DT",
+    "FIRST_INST_TYPE", "FLAT_RATE_PRCNT", "OPRT_BATCH_NO", "INCOME_RECOG_AMT", "INST_AMT",
+    "DRAWDOWN_DT", "NEXT_INST_DUE_DT", "NTF_AMT", "OS_DENDA_CUST", "OS_DENDA_OPRT",
+    "OS_INTEREST_AMT", "OS_INTEREST_UNDUE_AMT", "OS_PRINCIPAL_AMT", "OS_PRINCIPAL_UNDUE_AMT",
+    "PROD_OFFERING_CODE", "BRANCH_CODE", "RRD_DT", "TENOR", "DOWN_PAYMENT", "INST_SEQ_NO",
+    "OVERDUE_DAYS", "CONTRACT_STATUS", "DEFAULT_STATUS", "PROD_OFFERING_NAME",
+    "PURPOSE_OF_FINANCING", "COLLECTIBILITY_STAT", "TANGGAL_MACET", "UNPAID_ACCRUE_INTEREST",
+    "NEXT_INST_DUE_OS_PRINCIPAL", "NEXT_INST_DUE_OS_INTEREST", "KODE_CABANG_PARTNER",
+    "COST_OF_FUND_PERCENTAGE", "RISK_PREMIUM_PERCENTAGE", "SUBSIDY_DAYS",
+    "OS_PRINCIPAL_DUE_AMT", "OS_INTEREST_DUE_AMT"
+]
+
+LUNAS_COLUMNS = ('CONTRACT_STATUS', 'DEFAULT_STATUS', 'OS_PRINCIPAL_AMT', 'OS_INTEREST_AMT')
+
+# Rule per nilai unik; cek relasi CUST_NO ditambahkan saat run karena butuh data file lain.
+# DATA_ORIGINAL logika lunas diisi kolom LUNAS_CONTEXT yang dibentuk saat penyimpanan.
+RULES = [
+    rule('INVALID_LUNAS_LOGIC', LUNAS_COLUMNS, check_lunas, lunas_message, report_column='LUNAS_CONTEXT'),
+] + [
+    rule(f'BLANK_{col.upper()}', col, validate_not_blank, "Kolom tidak boleh kosong atau 'nan'")
+    for col in COLUMNS_TO_VALIDATE_NOT_BLANK
+]
+
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas)
+REQUIRED_COLUMNS = {
+    'coreaccount': COLUMNS_TO_VALIDATE_NOT_BLANK,
+    'customer': ['CUST_NO'],
+    'customerpersonal': ['CUST_NO'],
+    'custcorporate': ['CUST_NO'],
+}
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'coreaccount': next((f for f in files if 'coraccount' in f.lower() and f.endswith('.txt')), None),
+        'customer': next((f for f in files if f.lower().startswith('customer_') and f.endswith('.txt')), None),
+        'customerpersonal': next((f for f in files if f.lower().startswith('customerpersonal_') and f.endswith('.txt')), None),
+        'custcorporate': next((f for f in files if f.lower().startswith('custcorporate_') and f.endswith('.txt')), None),
+    }
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
 
     # Cari file-file yang diperlukan
-    try:
-        file_core = next(f for f in os.listdir(current_dir) if 'coraccount' in f.lower() and f.endswith('.txt'))
-        file_cust = next(f for f in os.listdir(current_dir) if f.lower().startswith('customer_') and f.endswith('.txt'))
-        file_pers = next(f for f in os.listdir(current_dir) if f.lower().startswith('customerpersonal_') and f.endswith('.txt'))
-        file_corp = next(f for f in os.listdir(current_dir) if f.lower().startswith('custcorporate_') and f.endswith('.txt'))
-    except StopIteration:
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS)
+    if not all(input_files.values()):
         print("Error: Salah satu atau lebih file .txt (coraccount, customer, customerpersonal, custcorporate) tidak ditemukan.")
-        return
+        return 1
+    file_core = input_files['coreaccount']
+    file_cust = input_files['customer']
+    file_pers = input_files['customerpersonal']
+    file_corp = input_files['custcorporate']
+
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    import pandas as pd
+
+    from validasi.extracts import key_set, read_extract
+    from validasi.pipeline import ValidationRun
 
     print("Membaca data...")
-    df_core = pd.read_csv(os.path.join(current_dir, file_core), sep='|', dtype=str)
-    df_cust = pd.read_csv(os.path.join(current_dir, file_cust), sep='|', dtype=str)
-    df_pers = pd.read_csv(os.path.join(current_dir, file_pers), sep='|', dtype=str)
-    df_corp = pd.read_csv(os.path.join(current_dir, file_corp), sep='|', dtype=str)
+    df_core = read_extract(os.path.join(current_dir, file_core))
 
     # --- Pra-pemrosesan untuk efisiensi ---
     # Konversi kolom jumlah ke numerik untuk perbandingan
@@ -62,97 +119,52 @@ def run_validation():
         df_core['OS_INTEREST_AMT'] = pd.to_numeric(df_core['OS_INTEREST_AMT'], errors='coerce').fillna(0)
     except KeyError as e:
         print(f"Error: Kolom {e} tidak ditemukan di file coreaccount. Pastikan nama kolom sudah benar.")
-        return
+        return 1
 
-    # Buat set CUST_NO untuk pengecekan relasi yang cepat
-    cust_no_in_customer = set(df_cust['CUST_NO'])
-    cust_no_in_personal = set(df_pers['CUST_NO'])
-    cust_no_in_corporate = set(df_corp['CUST_NO'])
+    # Buat set CUST_NO untuk pengecekan relasi yang cepat (hanya kolom CUST_NO yang dibaca)
+    cust_no_in_customer = key_set(os.path.join(current_dir, file_cust), 'CUST_NO')
+    cust_no_in_personal = key_set(os.path.join(current_dir, file_pers), 'CUST_NO')
+    cust_no_in_corporate = key_set(os.path.join(current_dir, file_corp), 'CUST_NO')
     valid_cust_no_relation = cust_no_in_personal.union(cust_no_in_corporate)
 
-    # Daftar kolom yang akan divalidasi tidak boleh kosong
-    columns_to_validate_not_blank = [
-        "GENERATED_DT", "PARTNER_CODE", "PARTNER_NAME", "PARTNER_AGRMNT_NO", "AGRMNT_NO",
-        "ASSET_CATEGORY_CODE", "ASSET_NAME", "ASSET_PRICE_AMT", "CURR_CODE", "CUST_NAME",
-        "CUST_NO", "LAST_INST_DT", "EFFECTIVE_DT", "EFFECTIVE_RATE_PRCNT", "FIRST_INST_DT",
-        "FIRST_INST_TYPE", "FLAT_RATE_PRCNT", "OPRT_BATCH_NO", "INCOME_RECOG_AMT", "INST_AMT",
-        "DRAWDOWN_DT", "NEXT_INST_DUE_DT", "NTF_AMT", "OS_DENDA_CUST", "OS_DENDA_OPRT",
-        "OS_INTEREST_AMT", "OS_INTEREST_UNDUE_AMT", "OS_PRINCIPAL_AMT", "OS_PRINCIPAL_UNDUE_AMT",
-        "PROD_OFFERING_CODE", "BRANCH_CODE", "RRD_DT", "TENOR", "DOWN_PAYMENT", "INST_SEQ_NO",
-        "OVERDUE_DAYS", "CONTRACT_STATUS", "DEFAULT_STATUS", "PROD_OFFERING_NAME",
-        "PURPOSE_OF_FINANCING", "COLLECTIBILITY_STAT", "TANGGAL_MACET", "UNPAID_ACCRUE_INTEREST",
-        "NEXT_INST_DUE_OS_PRINCIPAL", "NEXT_INST_DUE_OS_INTEREST", "KODE_CABANG_PARTNER",
-        "COST_OF_FUND_PERCENTAGE", "RISK_PREMIUM_PERCENTAGE", "SUBSIDY_DAYS",
-        "OS_PRINCIPAL_DUE_AMT", "OS_INTEREST_DUE_AMT"
+    # Daftar sheet error (urutan = urutan sheet di file Excel)
+    sheet_names = [
+        'INVALID_LUNAS_LOGIC',
+        'CUST_NO_NOT_IN_CUSTOMER',
+        'CUST_NO_NOT_IN_PERS_OR_CORP'
+    ]
+    # Buat sheet untuk setiap kolom yang akan divalidasi blank
+    for col in COLUMNS_TO_VALIDATE_NOT_BLANK:
+        sheet_names.append(f'BLANK_{col.upper()}')
+
+    input_paths = [os.path.join(current_dir, f) for f in (file_core, file_cust, file_pers, file_corp) if f]
+    run = ValidationRun(args, current_dir, 'COREACCOUNT', df_core, sheet_names, input_paths, __file__)
+
+    # Cek relasi CUST_NO dijalankan vektor (isin ke set CUST_NO file lain)
+    rules = RULES + [
+        rule('CUST_NO_NOT_IN_CUSTOMER', 'CUST_NO', lambda cust_no: cust_no.isin(cust_no_in_customer),
+             "CUST_NO tidak ditemukan di file master customer", vectorized=True),
+        rule('CUST_NO_NOT_IN_PERS_OR_CORP', 'CUST_NO', lambda cust_no: cust_no.isin(valid_cust_no_relation),
+             "CUST_NO tidak ditemukan di file customerpersonal maupun custcorporate", vectorized=True),
     ]
-
-    # Inisialisasi dictionary untuk menampung data error per sheet
-    sheets_data = {
-        'INVALID_LUNAS_LOGIC': [],
-        'CUST_NO_NOT_IN_CUSTOMER': [],
-        'CUST_NO_NOT_IN_PERS_OR_CORP': []
-    }
-    # Buat key untuk setiap kolom yang akan divalidasi blank
-    for col in columns_to_validate_not_blank:
-        sheets_data[f'BLANK_{col.upper()}'] = []
-
-    def add_to_error(sheet_name, row, col_name, message):
-        sheets_data[sheet_name].append({
-            'PARTNER_NAME': row.get('PARTNER_NAME'),
-            'PARTNER_AGRMNT_NO': row.get('PARTNER_AGRMNT_NO'),
-            'AGRMNT_NO': row.get('AGRMNT_NO'),
-            'CUST_NO': row.get('CUST_NO'),
-            'CUST_NAME': row.get('CUST_NAME'),
-            'DATA_ORIGINAL': row.get(col_name),
-            'KETERANGAN_ERROR': message
-        })
-
     print("Memulai validasi data coreaccount...")
-    # Terapkan tqdm untuk progress bar
-    for _, row in tqdm(df_core.iterrows(), total=df_core.shape[0], desc="Validasi Baris", bar_format="{l_bar}{bar:25}{r_bar}", colour='green'):
-        cust_no = row.get('CUST_NO')
-
-        # Validasi 1: Semua kolom tidak boleh blank
-        for col_name in columns_to_validate_not_blank:
-            if col_name in row and not validate_not_blank(row[col_name]):
-                add_to_error(f'BLANK_{col_name.upper()}', row, col_name, "Kolom tidak boleh kosong atau 'nan'")
-
-        # Validasi 2: Logika Lunas
-        is_valid, message = validate_lunas(row)
-        if not is_valid:
-            # Buat string yang lebih informatif untuk kolom DATA_ORIGINAL
-            original_data_str = (
-                f"CONTRACT_STATUS: {row.get('CONTRACT_STATUS')}, "
-                f"DEFAULT_STATUS: {row.get('DEFAULT_STATUS')}, "
-                f"OS_PRINCIPAL: {row.get('OS_PRINCIPAL_AMT')}, "
-                f"OS_INTEREST: {row.get('OS_INTEREST_AMT')}"
+    run.check_rules(rules)
+
+    # Buat string yang lebih informatif untuk kolom DATA_ORIGINAL, hanya untuk baris yang error logika lunas
+    if args.output == 'xlsx':
+        store = run.store
+        lunas_rows = store.rows[store.rules == store.sheet_names.index('INVALID_LUNAS_LOGIC')]
+        if len(lunas_rows):
+            ctx = df_core.iloc[lunas_rows]
+            df_core.loc[ctx.index, 'LUNAS_CONTEXT'] = (
+                "CONTRACT_STATUS: " + ctx['CONTRACT_STATUS'].map(str) +
+                ", DEFAULT_STATUS: " + ctx['DEFAULT_STATUS'].map(str) +
+                ", OS_PRINCIPAL: " + ctx['OS_PRINCIPAL_AMT'].map(str) +
+                ", OS_INTEREST: " + ctx['OS_INTEREST_AMT'].map(str)
             )
-            # Tambahkan data konteks ke baris sementara untuk pelaporan
-            row['LUNAS_CONTEXT'] = original_data_str
-            add_to_error('INVALID_LUNAS_LOGIC', row, 'LUNAS_CONTEXT', message)
-
-        # Validasi 3: CUST_NO harus ada di customer.txt
-        if cust_no not in cust_no_in_customer:
-            add_to_error('CUST_NO_NOT_IN_CUSTOMER', row, 'CUST_NO', "CUST_NO tidak ditemukan di file master customer")
-
-        # Validasi 4: CUST_NO harus ada di customerpersonal.txt atau custcorporate.txt
-        if cust_no not in valid_cust_no_relation:
-            add_to_error('CUST_NO_NOT_IN_PERS_OR_CORP', row, 'CUST_NO', "CUST_NO tidak ditemukan di file customerpersonal maupun custcorporate")
 
     # --- STEP 3: PENYIMPANAN HASIL ---
-    output_path = os.path.join(current_dir, 'DATA_COREACCOUNT_TIDAK_VALID.xlsx')
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        found_any_error = False
-        for sheet_name, data in sheets_data.items():
-            if data:
-                df_error = pd.DataFrame(data)
-                df_error.to_excel(writer, sheet_name=sheet_name, index=False)
-                found_any_error = True
-
-    if found_any_error:
-        print(f"Selesai! File detail error tersimpan di: {output_path}")
-    else:
-        print("Luar biasa! Tidak ditemukan data yang tidak valid.")
+    run.write_results('DATA_COREACCOUNT_TIDAK_VALID.xlsx', "Luar biasa! Tidak ditemukan data yang tidak valid.")
 
 if __name__ == "__main__":
-    run_validation()
\ No newline at end of file
+    sys.exit(run_validation(parse_args(description="Validasi data coreaccount")))
\ No newline at end of file
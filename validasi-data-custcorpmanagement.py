@@ -1,7 +1,10 @@
-import pandas as pd
 import os
 import re
-from tqdm import tqdm
+import sys
+
+from validasi.cli import parse_args
+from validasi.rules import rule
+from validasi.schema import check_schema
 
 # ==========================================
 # STEP 1: FUNGSI VALIDASI MODULAR
@@ -34,7 +37,8 @@ def validate_no_special_chars(value):
     return not bool(re.search(pattern, str(value).strip()))
 
 def get_cell_value(value):
-    if pd.isna(value) or str(value).lower() == 'nan':
+    # Sel kosong dari extract berupa None atau float NaN (satu-satunya nilai yang != dirinya sendiri)
+    if value is None or value != value or str(value).lower() == 'nan':
         return ""
     return str(value).strip()
 
@@ -54,149 +58,192 @@ def validate_relasi_IDNO_BIRTHDATE(id_no, birth_date, gender):
         return False
     except: return False
 
+# ==========================================
+# DAFTAR RULE (DICEK SEKALI PER NILAI UNIK)
+# ==========================================
+# Kolom kosong dilewati; yang dicek hanya isi kolom yang terisi.
+
+def check_shareholder_type(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or val.upper() in ['P', 'C']
+
+def check_sex(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or val.upper() in ['F', 'M']
+
+def check_no_special_chars(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or validate_no_special_chars(val)
+
+def check_rt_rw(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or (val.isdigit() and len(val) <= 3)
+
+def check_zipcode(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or (val.isdigit() and len(val) == 5)
+
+def validate_id_no(id_no, id_type, birth_dt, sex):
+    """Validasi ID_NO (karakter khusus dan relasi NIK). Mengembalikan tuple (is_valid, message)."""
+    id_no = get_cell_value(id_no)
+    id_type = get_cell_value(id_type).upper()
+    b_date = get_cell_value(birth_dt)
+    sex = get_cell_value(sex)
+    if validate_not_blank(id_no):
+        if not validate_no_special_chars(id_no):
+            return (False, "Ada karakter khusus")
+        elif len(id_no) == 16 and id_type in ['NIK', 'KTP', 'ID NO']:
+            if not validate_relasi_IDNO_BIRTHDATE(id_no, b_date, sex):
+                return (False, f"NIK tidak sinkron dengan Birth Date ({b_date})")
+    return (True, None)
+
+def check_id_no(*values):
+    return validate_id_no(*values)[0]
+
+def id_no_message(*values):
+    return validate_id_no(*values)[1]
+
+def check_birth_dt(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or validate_date_format(val)
+
+def check_npwp(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or (val.isdigit() and len(val) == 16)
+
+def check_share_portion(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or validate_is_decimal(val)
+
+def check_code(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or val.isdigit()
+
+def check_year(value):
+    val = get_cell_value(value)
+    return not validate_not_blank(val) or (val.isdigit() and len(val) == 4)
+
+# Urutan rule mengikuti urutan cek per baris versi lama
+RULES = [
+    # Master Corporate Check: CUST_NAME kosong setelah merge = CUST_NO tidak ada di custcorporate
+    rule('INVALID_CUST_NOT_FOUND', 'CUST_NAME', lambda cust_name: cust_name.notna(),
+         "CUST_NO tidak ada di master corporate", report_column='CUST_NO', vectorized=True),
+    rule('INVALID_SHAREHOLDER_TYPE', 'SHAREHOLDER_TYPE', check_shareholder_type, "Wajib P atau C"),
+    rule('INVALID_SEX', 'SEX', check_sex, "Wajib F atau M"),
+    rule('INVALID_MNGMNT_ADDR', 'MNGMNT_ADDR', check_no_special_chars, "Terdapat karakter khusus"),
+    rule('INVALID_MNGMNT_KEL', 'MNGMNT_KEL', check_no_special_chars, "Terdapat karakter khusus"),
+    rule('INVALID_MNGMNT_KEC', 'MNGMNT_KEC', check_no_special_chars, "Terdapat karakter khusus"),
+    rule('INVALID_MNGMNT_CITY', 'MNGMNT_CITY', check_no_special_chars, "Terdapat karakter khusus"),
+    rule('INVALID_MNGMNT_BIRTH_PLACE', 'MNGMNT_BIRTH_PLACE', check_no_special_chars, "Terdapat karakter khusus"),
+    rule('INVALID_MNGMNT_RT', 'MNGMNT_RT', check_rt_rw, "Harus angka & maks 3 digit"),
+    rule('INVALID_MNGMNT_RW', 'MNGMNT_RW', check_rt_rw, "Harus angka & maks 3 digit"),
+    rule('INVALID_MNGMNT_ZIPCODE', 'MNGMNT_ZIPCODE', check_zipcode, "Harus 5 digit angka"),
+    rule('INVALID_MNGMNT_ID_NO', ('ID_NO', 'ID_TYPE', 'BIRTH_DT', 'SEX'), check_id_no, id_no_message),
+    rule('INVALID_MNGMNT_BIRTH_DATE', 'BIRTH_DT', check_birth_dt, "Format wajib DD-MM-YYYY"),
+    rule('INVALID_MNGMNT_BIRTH_PLACE', 'BIRTH_PLACE', check_no_special_chars, "Terdapat karakter khusus"),
+    rule('INVALID_NPWP', 'NPWP_NO', check_npwp, "Wajib 16 digit angka"),
+    rule('INVALID_SHARE_PORTION', 'SHARE_PORTION', check_share_portion, "Harus format angka/desimal"),
+    rule('INVALID_JABATAN', 'JABATAN', check_code, "Harus kode angka"),
+    rule('INVALID_PROVINSI', 'PROVINSI', check_code, "Harus kode angka"),
+    rule('INVALID_ESTABLISHMENT_YEAR', 'ESTABLISHMENT_YEAR', check_year, "Harus 4 digit tahun"),
+]
+
 # ==========================================
 # STEP 2: PROSES VALIDASI PER SHEET PER KOLOM
 # ==========================================
 
-def run_validation():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas)
+REQUIRED_COLUMNS = {
+    'custcorporate': ['CUST_NO', 'CUST_NAME'],
+    'custcorpmanagement': ['CUST_NO', 'SHAREHOLDER_TYPE', 'SEX', 'MNGMNT_ADDR', 'MNGMNT_RT', 'MNGMNT_RW',
+                           'MNGMNT_KEL', 'MNGMNT_KEC', 'MNGMNT_CITY', 'MNGMNT_ZIPCODE', 'MNGMNT_BIRTH_PLACE',
+                           'ID_NO', 'ID_TYPE', 'BIRTH_DT', 'BIRTH_PLACE', 'NPWP_NO', 'SHARE_PORTION',
+                           'JABATAN', 'PROVINSI', 'ESTABLISHMENT_YEAR'],
+    'coreaccount': ['CUST_NO', 'PARTNER_NAME', 'AGRMNT_NO'],
+}
+
+# Cek kode ke tabel referensi (lihat validasi/master_data.py), dijalankan vektor setelah cek per baris:
+# (sheet, kolom, tabel, kolom tabel, pesan); kolom berupa tuple = cek konsistensi pasangan kolom
+REFERENCE_CHECKS = [
+    ('REF_MNGMNT_ZIPCODE', 'MNGMNT_ZIPCODE', 'zipcode', None, "Kode pos tidak terdaftar di tabel referensi"),
+    ('REF_MNGMNT_KECAMATAN', ('MNGMNT_ZIPCODE', 'MNGMNT_KEC'), 'zipcode', ('ZIPCODE', 'KECAMATAN'), "Kecamatan tidak sesuai dengan kode pos"),
+    ('REF_MNGMNT_KELURAHAN', ('MNGMNT_ZIPCODE', 'MNGMNT_KEL'), 'zipcode', ('ZIPCODE', 'KELURAHAN'), "Kelurahan tidak sesuai dengan kode pos"),
+    ('REF_JABATAN', 'JABATAN', 'jabatan', None, "Kode jabatan tidak terdaftar di tabel referensi"),
+    ('REF_PROVINSI', 'PROVINSI', 'provinsi', None, "Kode provinsi tidak terdaftar di tabel referensi"),
+]
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'custcorporate': next((f for f in files if 'custcorporate' in f.lower() and f.endswith('.txt')), None),
+        'custcorpmanagement': next((f for f in files if f.lower().startswith('custcorpmanagement_') and f.endswith('.txt')), None),
+        'coreaccount': next((f for f in files if 'account' in f.lower() and f.endswith('.txt')), None),
+    }
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
     
-    f_corp = next((f for f in os.listdir(current_dir) if 'custcorporate' in f.lower() and f.endswith('.txt')), None)
-    f_mngt = next((f for f in os.listdir(current_dir) if f.lower().startswith('custcorpmanagement_') and f.endswith('.txt')), None)
-    f_acc = next((f for f in os.listdir(current_dir) if 'account' in f.lower() and f.endswith('.txt')), None)
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS, optional=('coreaccount',))
+    f_corp = input_files['custcorporate']
+    f_mngt = input_files['custcorpmanagement']
+    f_acc = input_files['coreaccount']
 
     if not f_corp or not f_mngt:
         print("Error: File .txt tidak lengkap.")
-        return
+        return 1
 
-    df_a = pd.read_csv(os.path.join(current_dir, f_corp), sep='|', dtype=str)
-    df_b = pd.read_csv(os.path.join(current_dir, f_mngt), sep='|', dtype=str)
-    df_c = pd.read_csv(os.path.join(current_dir, f_acc), sep='|', dtype=str) if f_acc else pd.DataFrame()
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    import pandas as pd
 
-    df_merged = pd.merge(df_b, df_a[['CUST_NO', 'CUST_NAME']].drop_duplicates('CUST_NO'), on='CUST_NO', how='left')
-    if not df_c.empty:
-        df_merged = pd.merge(df_merged, df_c[['CUST_NO', 'PARTNER_NAME', 'AGRMNT_NO']].drop_duplicates('CUST_NO'), on='CUST_NO', how='left')
-
-    # Inisialisasi Dictionary untuk Sheet yang sangat spesifik
-    sheets_data = {
-        'INVALID_CUST_NOT_FOUND': [],
-        'INVALID_SHAREHOLDER_TYPE': [],
-        'INVALID_SEX': [],
-        'INVALID_MNGMNT_ADDR': [],
-        'INVALID_MNGMNT_RT': [],
-        'INVALID_MNGMNT_RW': [],
-        'INVALID_MNGMNT_KEL': [],
-        'INVALID_MNGMNT_KEC': [],
-        'INVALID_MNGMNT_CITY': [],
-        'INVALID_MNGMNT_ZIPCODE': [],
-        'INVALID_MNGMNT_ID_NO': [],
-        'INVALID_MNGMNT_BIRTH_DATE': [],
-        'INVALID_MNGMNT_BIRTH_PLACE': [],
-        'INVALID_NPWP': [],
-        'INVALID_SHARE_PORTION': [],
-        'INVALID_JABATAN': [],
-        'INVALID_PROVINSI': [],
-        'INVALID_ESTABLISHMENT_YEAR': []
-    }
+    from validasi.extracts import read_extract
+    from validasi.pipeline import ValidationRun
 
-    def add_to_error(sheet, row, col, msg):
-        sheets_data[sheet].append({
-            'CUST_NO': row.get('CUST_NO'),
-            'CUST_NAME': row.get('CUST_NAME', 'TIDAK DITEMUKAN'),
-            'PARTNER_NAME': row.get('PARTNER_NAME', 'N/A'),
-            'AGRMNT_NO': row.get('AGRMNT_NO', 'N/A'),
-            'DATA_ORIGINAL': row.get(col),
-            'KETERANGAN': msg
-        })
+    df_a = read_extract(os.path.join(current_dir, f_corp))
+    df_b = read_extract(os.path.join(current_dir, f_mngt))
+    df_c = read_extract(os.path.join(current_dir, f_acc)) if f_acc else pd.DataFrame()
 
+    df_merged = pd.merge(df_b, df_a[['CUST_NO', 'CUST_NAME']].drop_duplicates('CUST_NO'), on='CUST_NO', how='left')
+    if not df_c.empty:
+        # BRANCH_CODE hanya dipakai untuk ringkasan per cabang; extract lama tanpa kolom ini tetap bisa divalidasi
+        partner_columns = ['CUST_NO', 'PARTNER_NAME', 'AGRMNT_NO'] + [c for c in ['BRANCH_CODE'] if c in df_c.columns]
+        df_merged = pd.merge(df_merged, df_c[partner_columns].drop_duplicates('CUST_NO'), on='CUST_NO', how='left')
+
+    # Daftar sheet yang sangat spesifik (urutan = urutan sheet di file Excel)
+    sheet_names = [
+        'INVALID_CUST_NOT_FOUND',
+        'INVALID_SHAREHOLDER_TYPE',
+        'INVALID_SEX',
+        'INVALID_MNGMNT_ADDR',
+        'INVALID_MNGMNT_RT',
+        'INVALID_MNGMNT_RW',
+        'INVALID_MNGMNT_KEL',
+        'INVALID_MNGMNT_KEC',
+        'INVALID_MNGMNT_CITY',
+        'INVALID_MNGMNT_ZIPCODE',
+        'INVALID_MNGMNT_ID_NO',
+        'INVALID_MNGMNT_BIRTH_DATE',
+        'INVALID_MNGMNT_BIRTH_PLACE',
+        'INVALID_NPWP',
+        'INVALID_SHARE_PORTION',
+        'INVALID_JABATAN',
+        'INVALID_PROVINSI',
+        'INVALID_ESTABLISHMENT_YEAR'
+    ]
+
+    input_paths = [os.path.join(current_dir, f) for f in (f_corp, f_mngt, f_acc) if f]
+    run = ValidationRun(
+        args, current_dir, 'CUSTCORPMANAGEMENT', df_merged, sheet_names, input_paths, __file__,
+        reference_checks=REFERENCE_CHECKS,
+        identity_columns=['CUST_NO', 'CUST_NAME', 'PARTNER_NAME', 'AGRMNT_NO'],
+        defaults={'CUST_NAME': 'TIDAK DITEMUKAN', 'PARTNER_NAME': 'N/A', 'AGRMNT_NO': 'N/A'},
+        message_column='KETERANGAN',
+    )
     print("Memulai validasi...")
-
-    for _, row in tqdm(df_merged.iterrows(), total=df_merged.shape[0], desc="Validasi Baris", bar_format="{l_bar}{bar:25}{r_bar}", colour='green'):
-        # 0. Master Corporate Check
-        if pd.isna(row['CUST_NAME']):
-            add_to_error('INVALID_CUST_NOT_FOUND', row, 'CUST_NO', "CUST_NO tidak ada di master corporate")
-
-        # 1. Shareholder Type (P/C)
-        val = get_cell_value(row.get('SHAREHOLDER_TYPE'))
-        if validate_not_blank(val) and val.upper() not in ['P', 'C']:
-            add_to_error('INVALID_SHAREHOLDER_TYPE', row, 'SHAREHOLDER_TYPE', "Wajib P atau C")
-
-        # 2. Sex (F/M)
-        val = get_cell_value(row.get('SEX'))
-        if validate_not_blank(val) and val.upper() not in ['F', 'M']:
-            add_to_error('INVALID_SEX', row, 'SEX', "Wajib F atau M")
-
-        # 3. Alamat & Karakter Khusus (Satu sheet per kolom)
-        for col, sheet in [('MNGMNT_ADDR', 'INVALID_MNGMNT_ADDR'), ('MNGMNT_KEL', 'INVALID_MNGMNT_KEL'), 
-                           ('MNGMNT_KEC', 'INVALID_MNGMNT_KEC'), ('MNGMNT_CITY', 'INVALID_MNGMNT_CITY'),
-                           ('MNGMNT_BIRTH_PLACE', 'INVALID_MNGMNT_BIRTH_PLACE')]:
-            val = get_cell_value(row.get(col))
-            if validate_not_blank(val) and not validate_no_special_chars(val):
-                add_to_error(sheet, row, col, "Terdapat karakter khusus")
-
-        # 4. RT & RW
-        for col, sheet in [('MNGMNT_RT', 'INVALID_MNGMNT_RT'), ('MNGMNT_RW', 'INVALID_MNGMNT_RW')]:
-            val = get_cell_value(row.get(col))
-            if validate_not_blank(val) and (not val.isdigit() or len(val) > 3):
-                add_to_error(sheet, row, col, "Harus angka & maks 3 digit")
-
-        # 5. Zipcode
-        val = get_cell_value(row.get('MNGMNT_ZIPCODE'))
-        if validate_not_blank(val) and (not val.isdigit() or len(val) != 5):
-            add_to_error('INVALID_MNGMNT_ZIPCODE', row, 'MNGMNT_ZIPCODE', "Harus 5 digit angka")
-
-        # 6. ID No (Relasi NIK)
-        id_no = get_cell_value(row.get('ID_NO'))
-        id_type = get_cell_value(row.get('ID_TYPE')).upper()
-        b_date = get_cell_value(row.get('BIRTH_DT'))
-        sex = get_cell_value(row.get('SEX'))
-        if validate_not_blank(id_no):
-            if not validate_no_special_chars(id_no):
-                add_to_error('INVALID_MNGMNT_ID_NO', row, 'ID_NO', "Ada karakter khusus")
-            elif len(id_no) == 16 and id_type in ['NIK', 'KTP', 'ID NO']:
-                if not validate_relasi_IDNO_BIRTHDATE(id_no, b_date, sex):
-                    add_to_error('INVALID_MNGMNT_ID_NO', row, 'ID_NO', f"NIK tidak sinkron dengan Birth Date ({b_date})")
-
-        # 7. Birth Date
-        if validate_not_blank(b_date) and not validate_date_format(b_date):
-            add_to_error('INVALID_MNGMNT_BIRTH_DATE', row, 'BIRTH_DT', "Format wajib DD-MM-YYYY")
-
-        # 7.b. Birth Place (Karakter Khusus)
-        val = get_cell_value(row.get('BIRTH_PLACE'))
-        if validate_not_blank(val) and not validate_no_special_chars(val):
-            add_to_error('INVALID_MNGMNT_BIRTH_PLACE', row, 'BIRTH_PLACE', "Terdapat karakter khusus")
-
-        # 8. NPWP
-        val = get_cell_value(row.get('NPWP_NO'))
-        if validate_not_blank(val) and (not val.isdigit() or len(val) != 16):
-            add_to_error('INVALID_NPWP', row, 'NPWP_NO', "Wajib 16 digit angka")
-
-        # 9. Share Portion
-        val = get_cell_value(row.get('SHARE_PORTION'))
-        if validate_not_blank(val) and not validate_is_decimal(val):
-            add_to_error('INVALID_SHARE_PORTION', row, 'SHARE_PORTION', "Harus format angka/desimal")
-
-        # 10. Jabatan, Provinsi, Est Year
-        for col, sheet in [('JABATAN', 'INVALID_JABATAN'), ('PROVINSI', 'INVALID_PROVINSI')]:
-            val = get_cell_value(row.get(col))
-            if validate_not_blank(val) and not val.isdigit():
-                add_to_error(sheet, row, col, "Harus kode angka")
-
-        val = get_cell_value(row.get('ESTABLISHMENT_YEAR'))
-        if validate_not_blank(val) and (not val.isdigit() or len(val) != 4):
-            add_to_error('INVALID_ESTABLISHMENT_YEAR', row, 'ESTABLISHMENT_YEAR', "Harus 4 digit tahun")
-
-    # --- SIMPAN KE EXCEL ---
-    output_path = os.path.join(current_dir, 'DATA_CUSTOMERMANAGEMENT_TIDAK_VALID.xlsx')
-    valid_sheets = {name: data for name, data in sheets_data.items() if data}
-
-    if valid_sheets:
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            for name, data in valid_sheets.items():
-                pd.DataFrame(data).to_excel(writer, sheet_name=name, index=False)
-        print(f"Selesai! File detail error per sheet: {output_path}")
-    else:
-        print("Data Management Bersih!")
+    run.check_rules(RULES)
+    run.write_results('DATA_CUSTOMERMANAGEMENT_TIDAK_VALID.xlsx', "Data Management Bersih!")
 
 if __name__ == "__main__":
-    run_validation()
\ No newline at end of file
+    sys.exit(run_validation(parse_args(description="Validasi data custcorpmanagement")))
\ No newline at end of file
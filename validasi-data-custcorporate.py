@@ -1,7 +1,10 @@
-import pandas as pd
 import os
 import re
-from tqdm import tqdm
+import sys
+
+from validasi.cli import parse_args
+from validasi.rules import rule, sheet_names_of
+from validasi.schema import check_schema
 
 # ==========================================
 # STEP 1: FUNGSI VALIDASI MODULAR (UNIT)
@@ -32,116 +35,115 @@ def validate_is_exactly_5_digits(value):
 
 def validate_is_exactly_16_digits(value): 
     return len(str(value).strip()) == 16 and str(value).strip().isdigit()
+
+# ==========================================
+# DAFTAR RULE (DICEK SEKALI PER NILAI UNIK)
+# ==========================================
+
+def check_year(value):
+    value = str(value)
+    return validate_is_exactly_4_digits(value) and validate_is_numeric(value) and validate_not_blank(value)
+
+def check_deed_text(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_no_special_chars(value) and validate_not_only_numeric(value)
+
+def check_filled(value):
+    return validate_not_blank(str(value))
+
+def check_place(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_no_special_chars(value)
+
+def check_business_type(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_not_two_digits(value)
+
+# Urutan rule = urutan sheet di file Excel
+RULES = [
+    rule('INVALID_ESTABLISHMENT_YEAR', 'ESTABLISHMENT_YEAR', check_year, "Bukan 4 digit angka"),
+    rule('INVALID_DEED_PLACE', 'DEED_PLACE', check_deed_text, "Kosong atau ada karakter khusus"),
+    rule('INVALID_DEED_NO', 'DEED_NO', check_deed_text, "Kosong atau ada karakter khusus"),
+    # Kolom file bernama DEET_DT, dilaporkan sebagai DEED_DT
+    rule('INVALID_DEED_DT', 'DEET_DT', check_filled, "Kosong", report_column='DEED_DT'),
+    rule('INVALID_TGL_AKTEAWAL', 'TGL_AKTEAWAL', check_filled, "Kosong"),
+    rule('INVALID_NO_AKTEAKHIR', 'NO_AKTEAKHIR', check_deed_text, "Kosong atau ada karakter khusus"),
+    rule('INVALID_TEMPAT_PENDIRIAN_PERUSAHAAN', 'TEMPAT_PENDIRIAN_PERUSAHAAN', check_place, "Kosong atau ada karakter khusus"),
+    rule('INVALID_KODE_JENIS_BADAN_USAHA', 'KODE_JENIS_BADAN_USAHA', check_business_type, "Kosong, 2 digit, atau bukan angka"),
+    rule('INVALID_TGL_AKTA_AKHIR', 'TGL_AKTA_AKHIR', check_filled, "Kosong"),
+]
 # ==========================================
 # STEP 2, 3, & 4: PROSES DAN PENYIMPANAN
 # ==========================================
 
-def run_validation():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas)
+REQUIRED_COLUMNS = {
+    'coreaccount': ['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO'],
+    'custcorporate': ['CUST_NO', 'CUST_NAME', 'ESTABLISHMENT_YEAR', 'DEED_PLACE', 'DEED_NO', 'DEET_DT',
+                      'TGL_AKTEAWAL', 'NO_AKTEAKHIR', 'TEMPAT_PENDIRIAN_PERUSAHAAN',
+                      'KODE_JENIS_BADAN_USAHA', 'TGL_AKTA_AKHIR'],
+}
+
+# Cek kode ke tabel referensi (lihat validasi/master_data.py), dijalankan vektor setelah cek per baris:
+# (sheet, kolom, tabel, kolom tabel, pesan); kolom berupa tuple = cek konsistensi pasangan kolom
+REFERENCE_CHECKS = [
+    ('REF_KODE_JENIS_BADAN_USAHA', 'KODE_JENIS_BADAN_USAHA', 'jenis_badan_usaha', None, "Kode jenis badan usaha tidak terdaftar di tabel referensi"),
+]
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'coreaccount': next((f for f in files if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None),
+        'custcorporate': next((f for f in files if f.lower().startswith('custcorporate_') and f.endswith('.txt')), None),
+    }
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
     
-    file_a = next((f for f in os.listdir(current_dir) if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None)
-    file_b = next((f for f in os.listdir(current_dir) if f.lower().startswith('custcorporate_') and f.endswith('.txt')), None)
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS)
+    file_a, file_b = input_files['coreaccount'], input_files['custcorporate']
 
     if not file_a or not file_b:
         print("Error: File .txt tidak ditemukan di folder.")
-        return
+        return 1
+
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    import pandas as pd
+
+    from validasi.extracts import read_extract
+    from validasi.pipeline import ValidationRun
 
     print(f"Membaca data...")
-    df_a = pd.read_csv(os.path.join(current_dir, file_a), sep='|', dtype=str)
-    df_b = pd.read_csv(os.path.join(current_dir, file_b), sep='|', dtype=str)
+    df_a = read_extract(os.path.join(current_dir, file_a))
+    df_b = read_extract(os.path.join(current_dir, file_b))
 
     # Step 3: Kelengkapan (Filter B yang ada di A)
     df_b1 = df_b[df_b['CUST_NO'].isin(df_a['CUST_NO'])].copy()
     
     # Gabungkan dengan info Partner dari File A
+    # BRANCH_CODE hanya dipakai untuk ringkasan per cabang; extract lama tanpa kolom ini tetap bisa divalidasi
+    partner_columns = ['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO'] + [c for c in ['BRANCH_CODE'] if c in df_a.columns]
     df_merged = pd.merge(
         df_b1, 
-        df_a[['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO']].drop_duplicates('CUST_NO'), 
+        df_a[partner_columns].drop_duplicates('CUST_NO'), 
         on='CUST_NO', 
         how='left'
     )
 
-    # Dictionary untuk menampung data per sheet
-    sheets_data = {
-        'INVALID_ESTABLISHMENT_YEAR': [],
-        'INVALID_DEED_PLACE': [],
-        'INVALID_DEED_NO': [],
-        'INVALID_DEED_DT': [],
-        'INVALID_TGL_AKTEAWAL': [],
-        'INVALID_NO_AKTEAKHIR': [],
-        'INVALID_TEMPAT_PENDIRIAN_PERUSAHAAN': [],
-        'INVALID_KODE_JENIS_BADAN_USAHA': [],
-        'INVALID_TGL_AKTA_AKHIR': []
-    }
+    # Daftar sheet error (urutan = urutan sheet di file Excel)
+    sheet_names = sheet_names_of(RULES)
 
-    def add_to_error(sheet_name, row, col_name, message):
-        sheets_data[sheet_name].append({
-            'PARTNER_NAME': row.get('PARTNER_NAME'),
-            'PARTNER_AGRMNT_NO': row.get('PARTNER_AGRMNT_NO'),
-            'AGRMNT_NO': row.get('AGRMNT_NO'),
-            'CUST_NO': row['CUST_NO'],
-            'CUST_NAME': row['CUST_NAME'],
-            'DATA_ORIGINAL': row.get(col_name), # Mengambil data asli yang salah
-            'KETERANGAN_ERROR': message
-        })
-
-    print("Sedang melakukan validasi per baris...")
-    for _, row in tqdm(df_merged.iterrows(), total=df_merged.shape[0], desc="Validasi Baris", bar_format="{l_bar}{bar:25}{r_bar}", colour='green'):
-     
-        # 2. Validasi Establishment Year
-        val_est_year = str(row['ESTABLISHMENT_YEAR'])
-        if not validate_is_exactly_4_digits(val_est_year) or not validate_is_numeric(val_est_year) or not validate_not_blank(val_est_year):
-            add_to_error('INVALID_ESTABLISHMENT_YEAR', row, 'ESTABLISHMENT_YEAR', "Bukan 4 digit angka")
-        # 3. Validasi Deed Place
-        val_deed_place = str(row['DEED_PLACE'])
-        if not validate_not_blank(val_deed_place) or not validate_no_special_chars(val_deed_place) or not validate_not_only_numeric(val_deed_place):
-            add_to_error('INVALID_DEED_PLACE', row, 'DEED_PLACE', "Kosong atau ada karakter khusus")
-        # 4. Validasi Deed No
-        val_deed_no = str(row['DEED_NO'])
-        if not validate_not_blank(val_deed_no) or not validate_no_special_chars(val_deed_no) or not validate_not_only_numeric(val_deed_no):
-            add_to_error('INVALID_DEED_NO', row, 'DEED_NO', "Kosong atau ada karakter khusus")
-        # 5. Validasi Deed Date
-        val_deed_dt = str(row['DEET_DT'])
-        if not validate_not_blank(val_deed_dt):
-            add_to_error('INVALID_DEED_DT', row, 'DEED_DT', "Kosong")
-        # 6. Validasi Tgl Akte Awal
-        val_tgl_akteawal = str(row['TGL_AKTEAWAL'])
-        if not validate_not_blank(val_tgl_akteawal):
-            add_to_error('INVALID_TGL_AKTEAWAL', row, 'TGL_AKTEAWAL', "Kosong")
-        # 7. Validasi No Akte Akhir
-        val_no_akteakhir = str(row['NO_AKTEAKHIR'])
-        if not validate_not_blank(val_no_akteakhir) or not validate_no_special_chars(val_no_akteakhir) or not validate_not_only_numeric(val_no_akteakhir):
-            add_to_error('INVALID_NO_AKTEAKHIR', row, 'NO_AKTEAKHIR', "Kosong atau ada karakter khusus")
-        # 8. Validasi Tempat Pendirian Perusahaan
-        val_tempat_pendirian = str(row['TEMPAT_PENDIRIAN_PERUSAHAAN'])
-        if not validate_not_blank(val_tempat_pendirian) or not validate_no_special_chars(val_tempat_pendirian):
-            add_to_error('INVALID_TEMPAT_PENDIRIAN_PERUSAHAAN', row, 'TEMPAT_PENDIRIAN_PERUSAHAAN', "Kosong atau ada karakter khusus")
-        # 9. Validasi Kode Jenis Badan Usaha
-        val_kode_jenis_badan = str(row['KODE_JENIS_BADAN_USAHA'])
-        if not validate_not_blank(val_kode_jenis_badan) or not validate_not_two_digits(val_kode_jenis_badan):
-            add_to_error('INVALID_KODE_JENIS_BADAN_USAHA', row, 'KODE_JENIS_BADAN_USAHA', "Kosong, 2 digit, atau bukan angka")
-        # 10. Validasi Tgl Akta Akhir
-        val_tgl_akta_akhir = str(row['TGL_AKTA_AKHIR'])
-        if not validate_not_blank(val_tgl_akta_akhir):
-            add_to_error('INVALID_TGL_AKTA_AKHIR', row, 'TGL_AKTA_AKHIR', "Kosong")
-
-
-    # Simpan ke satu file Excel dengan banyak sheet
-    output_path = os.path.join(current_dir, 'DATA_CUSCORPORATE_TIDAK_VALID.xlsx')
-    
-    # Gunakan writer untuk membuat file dengan banyak sheet
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        found_any_error = False
-        for sheet_name, data in sheets_data.items():
-            if data:
-                df_error = pd.DataFrame(data)
-                df_error.to_excel(writer, sheet_name=sheet_name, index=False)
-                found_any_error = True
-        
-    if found_any_error:
-        print(f"Selesai! File detail error tersimpan di: {output_path}")
-    else:
-        print("Luar biasa! Tidak ditemukan data yang tidak valid.")
+    input_paths = [os.path.join(current_dir, f) for f in (file_a, file_b) if f]
+    run = ValidationRun(
+        args, current_dir, 'CUSTCORPORATE', df_merged, sheet_names, input_paths, __file__,
+        reference_checks=REFERENCE_CHECKS,
+    )
+    print("Sedang melakukan validasi per rule...")
+    run.check_rules(RULES)
+    run.write_results('DATA_CUSCORPORATE_TIDAK_VALID.xlsx', "Luar biasa! Tidak ditemukan data yang tidak valid.")
 
 if __name__ == "__main__":
-    run_validation()
\ No newline at end of file
+    sys.exit(run_validation(parse_args(description="Validasi data custcorporate")))
\ No newline at end of file
@@ -1,7 +1,10 @@
-import pandas as pd
 import os
 import re
-from tqdm import tqdm
+import sys
+
+from validasi.cli import parse_args
+from validasi.rules import rule, sheet_names_of
+from validasi.schema import check_schema
 
 # ==========================================
 # STEP 1: FUNGSI VALIDASI MODULAR (UNIT)
@@ -30,127 +33,136 @@ def validate_is_exactly_4_digits(value):
 def validate_is_exactly_5_digits(value):
     return len(str(value).strip()) == 5
 
+# ==========================================
+# DAFTAR RULE (DICEK SEKALI PER NILAI UNIK)
+# ==========================================
+
+def check_npwp(value):
+    value = str(value)
+    return validate_is_numeric(value) and len(value.strip()) <= 16
+
+def check_cust_type(value):
+    return validate_not_blank(value) and str(value).strip().upper() in ['C', 'P']
+
+def check_area_name(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_not_two_digits(value) and validate_not_only_numeric(value)
+
+def check_zipcode(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_is_numeric(value) and validate_is_exactly_5_digits(value)
+
+def check_mobile(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_is_numeric(value)
+
+def check_dati_ii(value):
+    value = str(value)
+    return (validate_not_blank(value) and validate_is_numeric(value)
+            and validate_is_exactly_4_digits(value) and validate_no_special_chars(value))
+
+def is_personal(cust_type):
+    return str(cust_type).strip().upper() == 'P'
+
+def check_birth_place(value, cust_type):
+    value = str(value)
+    return not is_personal(cust_type) or (
+        validate_not_blank(value) and validate_not_only_numeric(value) and validate_no_special_chars(value))
+
+def check_birth_dt(value, cust_type):
+    value = str(value)
+    return not is_personal(cust_type) or (validate_not_blank(value) and validate_not_only_numeric(value))
+
+# Urutan rule = urutan sheet di file Excel; sheet yang sama boleh dipakai beberapa rule
+RULES = [
+    rule('INVALID_NPWP', 'NPWP_NO', check_npwp, "Bukan angka atau > 16 digit"),
+    rule('INVALID_CUST_TYPE', 'CUST_TYPE', check_cust_type, "Wajib C atau P"),
+    rule('INVALID_ADDRESS', 'CUST_ADDR', check_area_name, "Blank / Hanya 2 digit / Hanya angka"),
+    rule('INVALID_KELURAHAN', 'CUST_KEL', check_area_name, "Blank / Hanya 2 digit / Hanya angka"),
+    rule('INVALID_KECAMATAN', 'CUST_KEC', check_area_name, "Blank / Hanya 2 digit / Hanya angka"),
+    rule('INVALID_ZIPCODE', 'CUST_ZIPCODE', check_zipcode, "Bukan angka atau tidak 5 digit"),
+    rule('INVALID_MOBILE', 'MOBILE_PHN', check_mobile, "Harus angka dan tidak boleh blank"),
+    rule('INVALID_DATI_II', 'DATI_II', check_dati_ii, "Bukan 4 digit angka atau ada special char"),
+    # Khusus customer P
+    rule('INVALID_BIRTH_INFO', ('BIRTH_PLACE', 'CUST_TYPE'), check_birth_place, "Format tempat lahir salah"),
+    rule('INVALID_BIRTH_INFO', ('BIRTH_DT', 'CUST_TYPE'), check_birth_dt, "Format tanggal lahir salah (harus numeric)"),
+]
+
 # ==========================================
 # STEP 2, 3, & 4: PROSES DAN PENYIMPANAN
 # ==========================================
 
-def run_validation():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas)
+REQUIRED_COLUMNS = {
+    'coreaccount': ['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO'],
+    'customer': ['CUST_NO', 'CUST_NAME', 'CUST_TYPE', 'NPWP_NO', 'CUST_ADDR', 'CUST_KEL', 'CUST_KEC',
+                 'CUST_ZIPCODE', 'MOBILE_PHN', 'DATI_II', 'BIRTH_PLACE', 'BIRTH_DT'],
+}
+
+# Cek kode ke tabel referensi (lihat validasi/master_data.py), dijalankan vektor setelah cek per baris:
+# (sheet, kolom, tabel, kolom tabel, pesan); kolom berupa tuple = cek konsistensi pasangan kolom
+REFERENCE_CHECKS = [
+    ('REF_ZIPCODE', 'CUST_ZIPCODE', 'zipcode', None, "Kode pos tidak terdaftar di tabel referensi"),
+    ('REF_DATI_II', 'DATI_II', 'dati_ii', None, "Kode DATI II tidak terdaftar di tabel referensi"),
+    ('REF_ZIPCODE_DATI_II', ('CUST_ZIPCODE', 'DATI_II'), 'zipcode', ('ZIPCODE', 'KODE_DATI_II'), "Kode pos tidak berada di DATI II tersebut"),
+    ('REF_KECAMATAN', ('CUST_ZIPCODE', 'CUST_KEC'), 'zipcode', ('ZIPCODE', 'KECAMATAN'), "Kecamatan tidak sesuai dengan kode pos"),
+    ('REF_KELURAHAN', ('CUST_ZIPCODE', 'CUST_KEL'), 'zipcode', ('ZIPCODE', 'KELURAHAN'), "Kelurahan tidak sesuai dengan kode pos"),
+]
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'coreaccount': next((f for f in files if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None),
+        'customer': next((f for f in files if f.lower().startswith('customer_') and f.endswith('.txt')), None),
+    }
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
     
-    file_a = next((f for f in os.listdir(current_dir) if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None)
-    file_b = next((f for f in os.listdir(current_dir) if f.lower().startswith('customer_') and f.endswith('.txt')), None)
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS)
+    file_a, file_b = input_files['coreaccount'], input_files['customer']
 
     if not file_a or not file_b:
         print("Error: File .txt tidak ditemukan di folder.")
-        return
+        return 1
+
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    import pandas as pd
+
+    from validasi.extracts import read_extract
+    from validasi.pipeline import ValidationRun
 
     print(f"Membaca data...")
-    df_a = pd.read_csv(os.path.join(current_dir, file_a), sep='|', dtype=str)
-    df_b = pd.read_csv(os.path.join(current_dir, file_b), sep='|', dtype=str)
+    df_a = read_extract(os.path.join(current_dir, file_a))
+    df_b = read_extract(os.path.join(current_dir, file_b))
 
     # Step 3: Kelengkapan (Filter B yang ada di A)
     df_b1 = df_b[df_b['CUST_NO'].isin(df_a['CUST_NO'])].copy()
     
     # Gabungkan dengan info Partner dari File A
+    # BRANCH_CODE hanya dipakai untuk ringkasan per cabang; extract lama tanpa kolom ini tetap bisa divalidasi
+    partner_columns = ['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO'] + [c for c in ['BRANCH_CODE'] if c in df_a.columns]
     df_merged = pd.merge(
         df_b1, 
-        df_a[['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO']].drop_duplicates('CUST_NO'), 
+        df_a[partner_columns].drop_duplicates('CUST_NO'), 
         on='CUST_NO', 
         how='left'
     )
 
-    # Dictionary untuk menampung data per sheet
-    sheets_data = {
-        'INVALID_NPWP': [],
-        'INVALID_CUST_TYPE': [],
-        'INVALID_ADDRESS': [],
-        'INVALID_KELURAHAN': [],
-        'INVALID_KECAMATAN': [],
-        'INVALID_ZIPCODE': [],
-        'INVALID_MOBILE': [],
-        'INVALID_DATI_II': [],
-        'INVALID_BIRTH_INFO': []
-    }
+    # Daftar sheet error (urutan = urutan sheet di file Excel)
+    sheet_names = sheet_names_of(RULES)
 
-    def add_to_error(sheet_name, row, col_name, message):
-        sheets_data[sheet_name].append({
-            'PARTNER_NAME': row.get('PARTNER_NAME'),
-            'PARTNER_AGRMNT_NO': row.get('PARTNER_AGRMNT_NO'),
-            'AGRMNT_NO': row.get('AGRMNT_NO'),
-            'CUST_NO': row['CUST_NO'],
-            'CUST_NAME': row['CUST_NAME'],
-            'DATA_ORIGINAL': row.get(col_name), # Mengambil data asli yang salah
-            'KETERANGAN_ERROR': message
-        })
-
-    print("Sedang melakukan validasi per baris...")
-    for _, row in tqdm(df_merged.iterrows(), total=df_merged.shape[0], desc="Validasi Baris", bar_format="{l_bar}{bar:25}{r_bar}", colour='green'):
-        c_type = str(row['CUST_TYPE']).strip().upper()
-
-        # 1. Validasi NPWP
-        val_npwp = str(row['NPWP_NO'])
-        if not validate_is_numeric(val_npwp) or len(val_npwp.strip()) > 16:
-            add_to_error('INVALID_NPWP', row, 'NPWP_NO', "Bukan angka atau > 16 digit")
-
-        # 2. Validasi Cust Type
-        if not validate_not_blank(row['CUST_TYPE']) or c_type not in ['C', 'P']:
-            add_to_error('INVALID_CUST_TYPE', row, 'CUST_TYPE', "Wajib C atau P")
-
-        # 3. Validasi Address
-        val_addr = str(row['CUST_ADDR'])
-        if not validate_not_blank(val_addr) or not validate_not_two_digits(val_addr) or not validate_not_only_numeric(val_addr):
-            add_to_error('INVALID_ADDRESS', row, 'CUST_ADDR', "Blank / Hanya 2 digit / Hanya angka")
-
-        # 4. Validasi Kelurahan
-        val_kel = str(row['CUST_KEL'])
-        if not validate_not_blank(val_kel) or not validate_not_two_digits(val_kel) or not validate_not_only_numeric(val_kel):
-            add_to_error('INVALID_KELURAHAN', row, 'CUST_KEL', "Blank / Hanya 2 digit / Hanya angka")
-
-        # 5. Validasi Kecamatan
-        val_kec = str(row['CUST_KEC'])
-        if not validate_not_blank(val_kec) or not validate_not_two_digits(val_kec) or not validate_not_only_numeric(val_kec):
-            add_to_error('INVALID_KECAMATAN', row, 'CUST_KEC', "Blank / Hanya 2 digit / Hanya angka")
-
-        # 6. Validasi Zipcode
-        val_zip = str(row['CUST_ZIPCODE'])
-        if not validate_not_blank(val_zip) or not validate_is_numeric(val_zip) or not validate_is_exactly_5_digits(val_zip):
-            add_to_error('INVALID_ZIPCODE', row, 'CUST_ZIPCODE', "Bukan angka atau tidak 5 digit")
-
-        # 7. Validasi Mobile
-        val_mob = str(row['MOBILE_PHN'])
-        if not validate_not_blank(val_mob) or not validate_is_numeric(val_mob):
-            add_to_error('INVALID_MOBILE', row, 'MOBILE_PHN', "Harus angka dan tidak boleh blank")
-
-        # 8. Validasi DATI II
-        val_dati = str(row['DATI_II'])
-        if not validate_not_blank(val_dati) or not validate_is_numeric(val_dati) or not validate_is_exactly_4_digits(val_dati) or not validate_no_special_chars(val_dati):
-            add_to_error('INVALID_DATI_II', row, 'DATI_II', "Bukan 4 digit angka atau ada special char")
-
-        # 9. Validasi Birth Info (Khusus P)
-        if c_type == 'P':
-            bp = str(row['BIRTH_PLACE'])
-            bd = str(row['BIRTH_DT'])
-            if not validate_not_blank(bp) or not validate_not_only_numeric(bp) or not validate_no_special_chars(bp):
-                add_to_error('INVALID_BIRTH_INFO', row, 'BIRTH_PLACE', "Format tempat lahir salah")
-            if not validate_not_blank(bd) or not validate_not_only_numeric(bd):
-                add_to_error('INVALID_BIRTH_INFO', row, 'BIRTH_DT', "Format tanggal lahir salah (harus numeric)")
-
-    # Simpan ke satu file Excel dengan banyak sheet
-    output_path = os.path.join(current_dir, 'DATA_CUSTOMER_TIDAK_VALID.xlsx')
-    
-    # Gunakan writer untuk membuat file dengan banyak sheet
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        found_any_error = False
-        for sheet_name, data in sheets_data.items():
-            if data:
-                df_error = pd.DataFrame(data)
-                df_error.to_excel(writer, sheet_name=sheet_name, index=False)
-                found_any_error = True
-        
-    if found_any_error:
-        print(f"Selesai! File detail error tersimpan di: {output_path}")
-    else:
-        print("Luar biasa! Tidak ditemukan data yang tidak valid.")
+    input_paths = [os.path.join(current_dir, f) for f in (file_a, file_b) if f]
+    run = ValidationRun(
+        args, current_dir, 'CUSTOMER', df_merged, sheet_names, input_paths, __file__,
+        reference_checks=REFERENCE_CHECKS,
+    )
+    print("Sedang melakukan validasi per rule...")
+    run.check_rules(RULES)
+    run.write_results('DATA_CUSTOMER_TIDAK_VALID.xlsx', "Luar biasa! Tidak ditemukan data yang tidak valid.")
 
 if __name__ == "__main__":
-    run_validation()
\ No newline at end of file
+    sys.exit(run_validation(parse_args(description="Validasi data customer")))
\ No newline at end of file
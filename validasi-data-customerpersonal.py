@@ -1,7 +1,10 @@
-import pandas as pd
 import os
 import re
-from tqdm import tqdm
+import sys
+
+from validasi.cli import parse_args
+from validasi.rules import rule
+from validasi.schema import check_schema
 
 # ==========================================
 # STEP 1: FUNGSI VALIDASI MODULAR (UNIT)
@@ -98,25 +101,160 @@ def validate_relasi_IDNO_BIRTHDATE(id_no, birth_date, gender):
     except ValueError:
         return False # Jika ID_NO digit 7-8 bukan angka
 
+# ==========================================
+# DAFTAR RULE (DICEK SEKALI PER NILAI UNIK)
+# ==========================================
+
+def check_npwp(value):
+    value = str(value)
+    return validate_is_numeric(value) and len(value.strip()) <= 16
+
+def check_area_name(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_not_two_digits(value) and validate_not_only_numeric(value)
+
+def check_zipcode(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_is_numeric(value) and validate_is_exactly_5_digits(value)
+
+def check_numeric(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_is_numeric(value)
+
+def check_filled(value):
+    return validate_not_blank(str(value))
+
+def check_id_no(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_is_numeric(value) and validate_is_exactly_16_digits(value)
+
+def check_id_no_relation(id_no, birth_dt, gender):
+    # Relasi hanya dicek bila format dasar ID_NO sudah benar (format salah dilaporkan check_id_no)
+    return not check_id_no(id_no) or validate_relasi_IDNO_BIRTHDATE(str(id_no), str(birth_dt), str(gender))
+
+def id_no_relation_message(id_no, birth_dt, gender):
+    return f"Relasi NIK dengan Birth Date ({birth_dt}) atau Gender ({gender}) tidak sinkron"
+
+def check_gender(value):
+    value = str(value)
+    return validate_not_blank(value) and value in ['F', 'M']
+
+def check_marital_stat(value):
+    value = str(value)
+    return validate_not_blank(value) and value in ['S', 'M', 'D']
+
+def is_married(marital_stat):
+    return str(marital_stat) == 'M'
+
+def check_spouse_name(value, marital_stat):
+    return not is_married(marital_stat) or check_filled(value)
+
+def check_spouse_id_no(value, marital_stat):
+    return not is_married(marital_stat) or check_id_no(value)
+
+def check_spouse_id_no_relation(value, marital_stat, birth_dt, gender):
+    return not is_married(marital_stat) or check_id_no_relation(value, birth_dt, gender)
+
+def spouse_id_no_relation_message(value, marital_stat, birth_dt, gender):
+    return id_no_relation_message(value, birth_dt, gender)
+
+def check_spouse_birth_dt(value, marital_stat):
+    value = str(value)
+    return not is_married(marital_stat) or (validate_not_blank(value) and validate_not_only_numeric(value))
+
+def check_income_source(value):
+    value = str(value)
+    return validate_not_blank(value) and value in ['1', '2', '3', '4']
+
+def check_pendidikan(value):
+    value = str(value)
+    return validate_not_blank(value) and validate_is_numeric(value) and validate_no_special_chars(value)
+
+# Urutan rule mengikuti urutan cek per baris versi lama (BIRTH_DT diambil dari file customer)
+RULES = [
+    rule('INVALID_NPWP', 'NPWP_NO', check_npwp, "Bukan angka atau > 16 digit"),
+    rule('INVALID_ADDRESS', 'CUST_ADDR', check_area_name, "Blank / Hanya 2 digit / Hanya angka"),
+    rule('INVALID_KELURAHAN', 'CUST_KEL', check_area_name, "Blank / Hanya 2 digit / Hanya angka"),
+    rule('INVALID_KECAMATAN', 'CUST_KEC', check_area_name, "Blank / Hanya 2 digit / Hanya angka"),
+    rule('INVALID_ZIPCODE', 'CUST_ZIPCODE', check_zipcode, "Bukan angka atau tidak 5 digit"),
+    rule('INVALID_MOBILE', 'MOBILE_PHN', check_numeric, "Harus angka dan tidak boleh blank"),
+    rule('INVALID_ID_NO', 'ID_NO', check_id_no, "Bukan angka atau tidak 16 digit"),
+    rule('INVALID_ID_NO', ('ID_NO', 'BIRTH_DT', 'MR_GENDER'), check_id_no_relation, id_no_relation_message),
+    rule('INVALID_MOTHER_MAIDEN_NAME', 'MOTHER_MAIDEN_NAME', check_filled, "Blank"),
+    rule('INVALID_GENDER', 'MR_GENDER', check_gender, "Wajib F atau M", report_column='GENDER'),
+    rule('INVALID_MR_JOB_POSITION', 'MR_JOB_POSITION', check_numeric, "Blank"),
+    rule('INVALID_MARITAL_STAT', 'MARITAL_STAT', check_marital_stat, "Wajib S,M,D"),
+    rule('INVALID_YEARLY_INCOME', 'YEARLY_INCOME', check_numeric, "Harus angka"),
+    # Data pasangan hanya dicek untuk status kawin (M)
+    rule('INVALID_SPOUSE_NAME', ('SPOUSE_NAME', 'MARITAL_STAT'), check_spouse_name, "Blank"),
+    rule('INVALID_SPOUSE_ID_NO', ('SPOUSE_ID_NO', 'MARITAL_STAT'), check_spouse_id_no, "Bukan angka atau tidak 16 digit"),
+    rule('INVALID_SPOUSE_ID_NO', ('SPOUSE_ID_NO', 'MARITAL_STAT', 'BIRTH_DT', 'MR_GENDER'),
+         check_spouse_id_no_relation, spouse_id_no_relation_message),
+    rule('INVALID_SPOUSE_BIRTH_DT', ('SPOUSE_BIRTH_DT', 'MARITAL_STAT'), check_spouse_birth_dt, "Format tanggal lahir salah (harus numeric)"),
+    rule('INVALID_CUST_CITY', 'CUST_CITY', check_filled, "Blank"),
+    rule('INVALID_KODE_SUMBER_PENGHASILAN', 'KODE_SUMBER_PENGHASILAN', check_income_source, "Wajib 1,2,3,4"),
+    # Pendapatan tahunan memang dicek dua kali (cek 15 dan 21 versi lama); tetap dipertahankan
+    rule('INVALID_YEARLY_INCOME', 'YEARLY_INCOME', check_numeric, "Harus angka"),
+    rule('INVALID_PENDIDIKAN', 'PENDIDIKAN', check_pendidikan, "Wajib Numeric"),
+]
+
 # ==========================================
 # STEP 2, 3, & 4: PROSES DAN PENYIMPANAN
 # ==========================================
 
-def run_validation():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas)
+REQUIRED_COLUMNS = {
+    'coreaccount': ['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO'],
+    'customerpersonal': ['CUST_NO', 'CUST_NAME', 'NPWP_NO', 'CUST_ADDR', 'CUST_KEL', 'CUST_KEC', 'CUST_ZIPCODE',
+                         'MOBILE_PHN', 'ID_NO', 'MR_GENDER', 'MOTHER_MAIDEN_NAME', 'MR_JOB_POSITION',
+                         'MARITAL_STAT', 'YEARLY_INCOME', 'SPOUSE_NAME', 'SPOUSE_ID_NO', 'SPOUSE_BIRTH_DT',
+                         'CUST_CITY', 'KODE_SUMBER_PENGHASILAN', 'PENDIDIKAN'],
+    'customer': ['CUST_NO', 'BIRTH_DT'],
+}
+
+# Cek kode ke tabel referensi (lihat validasi/master_data.py), dijalankan vektor setelah cek per baris:
+# (sheet, kolom, tabel, kolom tabel, pesan); kolom berupa tuple = cek konsistensi pasangan kolom
+REFERENCE_CHECKS = [
+    ('REF_ZIPCODE', 'CUST_ZIPCODE', 'zipcode', None, "Kode pos tidak terdaftar di tabel referensi"),
+    ('REF_KECAMATAN', ('CUST_ZIPCODE', 'CUST_KEC'), 'zipcode', ('ZIPCODE', 'KECAMATAN'), "Kecamatan tidak sesuai dengan kode pos"),
+    ('REF_KELURAHAN', ('CUST_ZIPCODE', 'CUST_KEL'), 'zipcode', ('ZIPCODE', 'KELURAHAN'), "Kelurahan tidak sesuai dengan kode pos"),
+    ('REF_MR_JOB_POSITION', 'MR_JOB_POSITION', 'jabatan', None, "Kode jabatan tidak terdaftar di tabel referensi"),
+    ('REF_PENDIDIKAN', 'PENDIDIKAN', 'pendidikan', None, "Kode pendidikan tidak terdaftar di tabel referensi"),
+]
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'coreaccount': next((f for f in files if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None),
+        'customerpersonal': next((f for f in files if f.lower().startswith('customerpersonal_') and f.endswith('.txt')), None),
+        'customer': next((f for f in files if f.lower().startswith('customer_') and f.endswith('.txt')), None),
+    }
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
     
-    file_coreaccount = next((f for f in os.listdir(current_dir) if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None)
-    file_customerpersonal = next((f for f in os.listdir(current_dir) if f.lower().startswith('customerpersonal_') and f.endswith('.txt')), None)
-    file_customer=next((f for f in os.listdir(current_dir) if f.lower().startswith('customer_') and f.endswith('.txt')), None)
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS)
+    file_coreaccount = input_files['coreaccount']
+    file_customerpersonal = input_files['customerpersonal']
+    file_customer = input_files['customer']
     
     if not file_coreaccount or not file_customerpersonal:
         print("Error: File .txt coreaccount dan customerpersonal tidak ditemukan di folder.")
-        return
+        return 1
+
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    import pandas as pd
+
+    from validasi.extracts import read_extract
+    from validasi.pipeline import ValidationRun
 
     print(f"Membaca data...")
-    df_a = pd.read_csv(os.path.join(current_dir, file_coreaccount), sep='|', dtype=str)
-    df_b = pd.read_csv(os.path.join(current_dir, file_customerpersonal), sep='|', dtype=str)
-    df_c = pd.read_csv(os.path.join(current_dir, file_customer), sep='|', dtype=str)
+    df_a = read_extract(os.path.join(current_dir, file_coreaccount))
+    df_b = read_extract(os.path.join(current_dir, file_customerpersonal))
+    df_c = read_extract(os.path.join(current_dir, file_customer))
 
     # Convert "YEARLY_INCOME" column to numeric
     df_b['YEARLY_INCOME'] = pd.to_numeric(df_b['YEARLY_INCOME'], errors='coerce')
@@ -134,184 +272,49 @@ def run_validation():
         how='left'
     )
     # Gabungkan dengan info Partner dari File coreaccount untuk memudahkan identifikasi error per customer
+    # BRANCH_CODE hanya dipakai untuk ringkasan per cabang; extract lama tanpa kolom ini tetap bisa divalidasi
+    partner_columns = ['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO'] + [c for c in ['BRANCH_CODE'] if c in df_a.columns]
     df_merged = pd.merge(
         df_merged,
-        df_a[['CUST_NO', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO']].drop_duplicates('CUST_NO'), 
+        df_a[partner_columns].drop_duplicates('CUST_NO'), 
         on='CUST_NO', 
         how='left'
     )
 
-    # Dictionary untuk menampung data per sheet
-    sheets_data = {
-        'INVALID_NPWP': [],
-        'INVALID_CUST_TYPE': [],
-        'INVALID_ADDRESS': [],
-        'INVALID_KELURAHAN': [],
-        'INVALID_KECAMATAN': [],
-        'INVALID_ZIPCODE': [],
-        'INVALID_MOBILE': [],
-        'INVALID_DATI_II': [],
-        'INVALID_BIRTH_INFO': [],
-        'INVALID_ID_NO': [],
-        'INVALID_MOTHER_MAIDEN_NAME': [],
-        'INVALID_GENDER': [],
-        'INVALID_MR_JOB_POSITION': [],
-        'INVALID_MARITAL_STAT': [],
-        'INVALID_TOTAL_INCOME': [],
-        'INVALID_SPOUSE_NAME': [],
-        'INVALID_SPOUSE_ID_NO': [],
-        'INVALID_SPOUSE_BIRTH_DT': [],
-        'INVALID_CUST_CITY': [],
-        'INVALID_KODE_SUMBER_PENGHASILAN': [],
-        'INVALID_YEARLY_INCOME': [],
-        'INVALID_PENDIDIKAN': []
-
-    }
-
-    def add_to_error(sheet_name, row, col_name, message):
-        sheets_data[sheet_name].append({
-            'PARTNER_NAME': row.get('PARTNER_NAME'),
-            'PARTNER_AGRMNT_NO': row.get('PARTNER_AGRMNT_NO'),
-            'AGRMNT_NO': row.get('AGRMNT_NO'),
-            'CUST_NO': row['CUST_NO'],
-            'CUST_NAME': row['CUST_NAME'],
-            'DATA_ORIGINAL': row.get(col_name), # Mengambil data asli yang salah
-            'KETERANGAN_ERROR': message
-        })
-
-    print("Sedang melakukan validasi per baris...")
-    for _, row in tqdm(df_merged.iterrows(), total=df_merged.shape[0], desc="Validasi Baris", bar_format="{l_bar}{bar:25}{r_bar}", colour='green'):
-       
-        # 1. Validasi NPWP
-        val_npwp = str(row['NPWP_NO'])
-        if not validate_is_numeric(val_npwp) or len(val_npwp.strip()) > 16:
-            add_to_error('INVALID_NPWP', row, 'NPWP_NO', "Bukan angka atau > 16 digit")
-
-        # 3. Validasi Address
-        val_addr = str(row['CUST_ADDR'])
-        if not validate_not_blank(val_addr) or not validate_not_two_digits(val_addr) or not validate_not_only_numeric(val_addr):
-            add_to_error('INVALID_ADDRESS', row, 'CUST_ADDR', "Blank / Hanya 2 digit / Hanya angka")
-
-        # 4. Validasi Kelurahan
-        val_kel = str(row['CUST_KEL'])
-        if not validate_not_blank(val_kel) or not validate_not_two_digits(val_kel) or not validate_not_only_numeric(val_kel):
-            add_to_error('INVALID_KELURAHAN', row, 'CUST_KEL', "Blank / Hanya 2 digit / Hanya angka")
-
-        # 5. Validasi Kecamatan
-        val_kec = str(row['CUST_KEC'])
-        if not validate_not_blank(val_kec) or not validate_not_two_digits(val_kec) or not validate_not_only_numeric(val_kec):
-            add_to_error('INVALID_KECAMATAN', row, 'CUST_KEC', "Blank / Hanya 2 digit / Hanya angka")
-
-        # 6. Validasi Zipcode
-        val_zip = str(row['CUST_ZIPCODE'])
-        if not validate_not_blank(val_zip) or not validate_is_numeric(val_zip) or not validate_is_exactly_5_digits(val_zip):
-            add_to_error('INVALID_ZIPCODE', row, 'CUST_ZIPCODE', "Bukan angka atau tidak 5 digit")
-
-        # 7. Validasi Mobile
-        val_mob = str(row['MOBILE_PHN'])
-        if not validate_not_blank(val_mob) or not validate_is_numeric(val_mob):
-            add_to_error('INVALID_MOBILE', row, 'MOBILE_PHN', "Harus angka dan tidak boleh blank")
-
-        # 10 validasi ID No
-        val_id = str(row['ID_NO'])
-        val_birth_dt = str(row['BIRTH_DT']) # Diambil dari df_c hasil merge
-        val_gender = str(row['MR_GENDER'])
-        # Cek format dasar ID_NO dulu
-        if not validate_not_blank(val_id) or not validate_is_numeric(val_id) or not validate_is_exactly_16_digits(val_id):
-            add_to_error('INVALID_ID_NO', row, 'ID_NO', "Bukan angka atau tidak 16 digit")
-        
-        # Cek Relasi NIK dengan Tanggal Lahir dan Gender
-        else:
-            # Jika format dasar sudah benar, baru cek relasi isinya
-            is_relation_valid = validate_relasi_IDNO_BIRTHDATE(val_id, val_birth_dt, val_gender)
-            if not is_relation_valid:
-                add_to_error('INVALID_ID_NO', row, 'ID_NO', f"Relasi NIK dengan Birth Date ({val_birth_dt}) atau Gender ({val_gender}) tidak sinkron")
-
-         # 11. Validasi Nama ibu kandung
-        val_mother = str(row['MOTHER_MAIDEN_NAME'])
-        if not validate_not_blank(val_mother):
-            add_to_error('INVALID_MOTHER_MAIDEN_NAME', row, 'MOTHER_MAIDEN_NAME', "Blank")
-
-        # 12. Validasi Gender
-        val_gender = str(row['MR_GENDER'])
-        if not validate_not_blank(val_gender) or val_gender not in ['F', 'M']:
-            add_to_error('INVALID_GENDER', row, 'GENDER', "Wajib F atau M")
-
-        # 13. Validasi Jabatan
-        val_job = str(row['MR_JOB_POSITION'])
-        if not validate_not_blank(val_job) or not validate_is_numeric(val_job):
-            add_to_error('INVALID_MR_JOB_POSITION', row, 'MR_JOB_POSITION', "Blank")
-
-        # 14. Validasi Status Perkawinan
-        val_marital = str(row['MARITAL_STAT'])
-        if not validate_not_blank(val_marital) or val_marital not in ['S', 'M', 'D']:
-            add_to_error('INVALID_MARITAL_STAT', row, 'MARITAL_STAT', "Wajib S,M,D")
-
-        # 15. Validasi Pendapatan
-        val_income = str(row['YEARLY_INCOME'])
-        if not validate_not_blank(val_income) or not validate_is_numeric(val_income):
-            add_to_error('INVALID_YEARLY_INCOME', row, 'YEARLY_INCOME', "Harus angka")
-
-        # 16. Validasi Nama Pasangan
-        if val_marital == 'M':
-            val_spouse = str(row['SPOUSE_NAME'])
-            if not validate_not_blank(val_spouse):
-                add_to_error('INVALID_SPOUSE_NAME', row, 'SPOUSE_NAME', "Blank")
-
-        # 17. Validasi ID Pasangan
-            val_spouse_id = str(row['SPOUSE_ID_NO'])
-            if not validate_not_blank(val_spouse_id) or not validate_is_numeric(val_spouse_id) or not validate_is_exactly_16_digits(val_spouse_id):
-                add_to_error('INVALID_SPOUSE_ID_NO', row, 'SPOUSE_ID_NO', "Bukan angka atau tidak 16 digit")
-
-            # Cek Relasi NIK dengan Tanggal Lahir dan Gender
-            else:
-                # Jika format dasar sudah benar, baru cek relasi isinya
-                is_relation_valid = validate_relasi_IDNO_BIRTHDATE(val_spouse_id, val_birth_dt, val_gender)
-                if not is_relation_valid:
-                    add_to_error('INVALID_SPOUSE_ID_NO', row, 'SPOUSE_ID_NO', f"Relasi NIK dengan Birth Date ({val_birth_dt}) atau Gender ({val_gender}) tidak sinkron")
-
-        # 18. Validasi Tanggal Lahir Pasangan
-            val_spouse_bd = str(row['SPOUSE_BIRTH_DT'])
-            if not validate_not_blank(val_spouse_bd) or not validate_not_only_numeric(val_spouse_bd):
-                add_to_error('INVALID_SPOUSE_BIRTH_DT', row, 'SPOUSE_BIRTH_DT', "Format tanggal lahir salah (harus numeric)")
-
-        # 19. Validasi Kota
-        val_city = str(row['CUST_CITY'])
-        if not validate_not_blank(val_city):
-            add_to_error('INVALID_CUST_CITY', row, 'CUST_CITY', "Blank")
-
-        # 20. Validasi Kode Sumber Pendapatan
-        val_kode = str(row['KODE_SUMBER_PENGHASILAN'])
-        if not validate_not_blank(val_kode) or val_kode not in ['1', '2', '3', '4']:
-            add_to_error('INVALID_KODE_SUMBER_PENGHASILAN', row, 'KODE_SUMBER_PENGHASILAN', "Wajib 1,2,3,4")
-
-        # 21. Validasi Pendapatan Tahunan
-        val_yearly = str(row['YEARLY_INCOME'])
-        if not validate_not_blank(val_yearly) or not validate_is_numeric(val_yearly):
-            add_to_error('INVALID_YEARLY_INCOME', row, 'YEARLY_INCOME', "Harus angka")
-
-        # 22. Validasi Pendidikan
-        val_pendidikan = str(row['PENDIDIKAN'])
-        if not validate_not_blank(val_pendidikan) or not validate_is_numeric(val_pendidikan) or not validate_no_special_chars(val_pendidikan):
-            add_to_error('INVALID_PENDIDIKAN', row, 'PENDIDIKAN', "Wajib Numeric")
-
-
-    # Simpan ke satu file Excel dengan banyak sheet
-    output_path = os.path.join(current_dir, 'DATA_CUSTOMERPERSONAL_TIDAK_VALID.xlsx')
-    
-    # Gunakan writer untuk membuat file dengan banyak sheet
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        found_any_error = False
-        for sheet_name, data in sheets_data.items():
-            if data:
-                df_error = pd.DataFrame(data)
-                df_error.to_excel(writer, sheet_name=sheet_name, index=False)
-                found_any_error = True
-        
-    if found_any_error:
-        print(f"Selesai! File detail error tersimpan di: {output_path}")
-    else:
-        print("Luar biasa! Tidak ditemukan data yang tidak valid.")
+    # Daftar sheet error (urutan = urutan sheet di file Excel)
+    sheet_names = [
+        'INVALID_NPWP',
+        'INVALID_CUST_TYPE',
+        'INVALID_ADDRESS',
+        'INVALID_KELURAHAN',
+        'INVALID_KECAMATAN',
+        'INVALID_ZIPCODE',
+        'INVALID_MOBILE',
+        'INVALID_DATI_II',
+        'INVALID_BIRTH_INFO',
+        'INVALID_ID_NO',
+        'INVALID_MOTHER_MAIDEN_NAME',
+        'INVALID_GENDER',
+        'INVALID_MR_JOB_POSITION',
+        'INVALID_MARITAL_STAT',
+        'INVALID_TOTAL_INCOME',
+        'INVALID_SPOUSE_NAME',
+        'INVALID_SPOUSE_ID_NO',
+        'INVALID_SPOUSE_BIRTH_DT',
+        'INVALID_CUST_CITY',
+        'INVALID_KODE_SUMBER_PENGHASILAN',
+        'INVALID_YEARLY_INCOME',
+        'INVALID_PENDIDIKAN'
+    ]
+
+    input_paths = [os.path.join(current_dir, f) for f in (file_coreaccount, file_customerpersonal, file_customer) if f]
+    run = ValidationRun(
+        args, current_dir, 'CUSTOMERPERSONAL', df_merged, sheet_names, input_paths, __file__,
+        reference_checks=REFERENCE_CHECKS,
+    )
+    print("Sedang melakukan validasi per rule...")
+    run.check_rules(RULES)
+    run.write_results('DATA_CUSTOMERPERSONAL_TIDAK_VALID.xlsx', "Luar biasa! Tidak ditemukan data yang tidak valid.")
 
 if __name__ == "__main__":
-    run_validation()
\ No newline at end of file
+    sys.exit(run_validation(parse_args(description="Validasi data customerpersonal")))
\ No newline at end of file
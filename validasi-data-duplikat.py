@@ -0,0 +1,96 @@
+import os
+import sys
+
+from validasi.cli import parse_args
+from validasi.schema import check_schema
+
+# ==========================================
+# DAFTAR PENGECEKAN DUPLIKAT
+# ==========================================
+
+# (peran file, kolom key): key harus unik di file tersebut
+DUPLICATE_KEY_CHECKS = [
+    ('coreaccount', ['AGRMNT_NO']),
+    ('customer', ['CUST_NO']),
+    ('customerpersonal', ['CUST_NO']),
+    ('custcorporate', ['CUST_NO']),
+]
+
+# (peran file, kolom nilai, kolom pemilik): satu nilai tidak boleh dipakai banyak pemilik
+SHARED_VALUE_CHECKS = [
+    ('customerpersonal', 'ID_NO', 'CUST_NO'),
+]
+
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas)
+REQUIRED_COLUMNS = {
+    'coreaccount': ['AGRMNT_NO'],
+    'customer': ['CUST_NO'],
+    'customerpersonal': ['CUST_NO', 'ID_NO'],
+    'custcorporate': ['CUST_NO'],
+}
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'coreaccount': next((f for f in files if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None),
+        'customer': next((f for f in files if f.lower().startswith('customer_') and f.endswith('.txt')), None),
+        'customerpersonal': next((f for f in files if f.lower().startswith('customerpersonal_') and f.endswith('.txt')), None),
+        'custcorporate': next((f for f in files if f.lower().startswith('custcorporate_') and f.endswith('.txt')), None),
+    }
+
+# ==========================================
+# PROSES DETEKSI DUPLIKAT
+# ==========================================
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
+
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS, optional=tuple(REQUIRED_COLUMNS))
+    if not any(input_files.values()):
+        print("Error: File .txt tidak ditemukan di folder.")
+        return 1
+
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    import pandas as pd
+
+    from validasi.duplicates import find_duplicate_keys, find_shared_values
+
+    exact_parts, conflict_parts, shared_parts = [], [], []
+    for role, key_cols in DUPLICATE_KEY_CHECKS:
+        if not input_files[role]:
+            print(f"Info: file {role} tidak ditemukan, cek duplikat {'+'.join(key_cols)} dilewati.")
+            continue
+        print(f"Cek duplikat {'+'.join(key_cols)} di {input_files[role]}...")
+        exact, conflicts = find_duplicate_keys(os.path.join(current_dir, input_files[role]), role.upper(), key_cols)
+        exact_parts.append(exact)
+        conflict_parts.append(conflicts)
+
+    for role, value_col, owner_col in SHARED_VALUE_CHECKS:
+        if not input_files[role]:
+            continue
+        print(f"Cek {value_col} yang dipakai lebih dari satu {owner_col} di {input_files[role]}...")
+        shared_parts.append(find_shared_values(os.path.join(current_dir, input_files[role]), role.upper(), value_col, owner_col))
+
+    sheets = {
+        'DUPLIKAT_PERSIS': pd.concat(exact_parts, ignore_index=True) if exact_parts else pd.DataFrame(),
+        'KONFLIK_KEY': pd.concat(conflict_parts, ignore_index=True) if conflict_parts else pd.DataFrame(),
+        'ID_NO_BANYAK_CUST': pd.concat(shared_parts, ignore_index=True) if shared_parts else pd.DataFrame(),
+    }
+    valid_sheets = {name: df for name, df in sheets.items() if not df.empty}
+
+    output_path = os.path.join(current_dir, 'DATA_DUPLIKAT_TIDAK_VALID.xlsx')
+    if valid_sheets:
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            for name, df in valid_sheets.items():
+                df.to_excel(writer, sheet_name=name, index=False)
+        for name, df in valid_sheets.items():
+            print(f"  {name}: {len(df)} key")
+        print(f"Selesai! File detail duplikat tersimpan di: {output_path}")
+    else:
+        print("Luar biasa! Tidak ditemukan data duplikat.")
+
+if __name__ == "__main__":
+    sys.exit(run_validation(parse_args(description="Deteksi duplikat dan konflik key di semua file extract")))
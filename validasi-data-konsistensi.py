@@ -0,0 +1,152 @@
+import os
+import sys
+
+from validasi.cli import parse_args
+from validasi.rules import rule, sheet_names_of
+from validasi.schema import check_schema
+
+# ==========================================
+# STEP 1: CEK KONSISTENSI ANTAR FILE (VEKTOR)
+# ==========================================
+# Setiap fungsi menerima kolom (Series) dari index CUST_NO gabungan dan
+# mengembalikan mask True = konsisten. Kolom bantu (TIPE_*, *_BEDA,
+# NPWP_PENGURUS_SAMA) sudah dinormalisasi di run_validation, jadi fungsi
+# di sini cukup operasi boolean.
+
+def check_personal_registered(is_personal, in_personal):
+    return ~is_personal.to_numpy(dtype=bool) | in_personal.to_numpy(dtype=bool)
+
+def check_corporate_registered(is_corporate, in_corporate):
+    return ~is_corporate.to_numpy(dtype=bool) | in_corporate.to_numpy(dtype=bool)
+
+def check_single_type(in_personal, in_corporate):
+    return ~(in_personal.to_numpy(dtype=bool) & in_corporate.to_numpy(dtype=bool))
+
+def check_same_name(different_core_name):
+    return different_core_name.isna().to_numpy()
+
+def check_own_npwp(uses_corporate_npwp):
+    return ~uses_corporate_npwp.to_numpy(dtype=bool)
+
+# ==========================================
+# STEP 2: DAFTAR PENGECEKAN
+# ==========================================
+
+# (file opsional yang dibutuhkan, rule); rule dilewati bila salah satu file tidak ada.
+# Kolom <KOLOM>_<FILE> berasal dari baris pertama CUST_NO di file tersebut;
+# CUST_NAME_COREACCOUNT_BEDA dicari di semua baris coreaccount.
+CONSISTENCY_CHECKS = [
+    (('customerpersonal',), rule('PERSONAL_TIDAK_ADA', ('TIPE_PERSONAL', 'ADA_CUSTOMERPERSONAL'),
+        check_personal_registered, "CUST_TYPE P tetapi CUST_NO tidak ada di file customerpersonal",
+        report_column='CUST_TYPE_CUSTOMER', vectorized=True)),
+    (('custcorporate',), rule('CORPORATE_TIDAK_ADA', ('TIPE_CORPORATE', 'ADA_CUSTCORPORATE'),
+        check_corporate_registered, "CUST_TYPE C tetapi CUST_NO tidak ada di file custcorporate",
+        report_column='CUST_TYPE_CUSTOMER', vectorized=True)),
+    (('customerpersonal', 'custcorporate'), rule('PERSONAL_DAN_CORPORATE', ('ADA_CUSTOMERPERSONAL', 'ADA_CUSTCORPORATE'),
+        check_single_type, "CUST_NO ada di customerpersonal dan custcorporate sekaligus", report_column='CUST_TYPE_CUSTOMER', vectorized=True)),
+    ((), rule('NAMA_TIDAK_SAMA', 'CUST_NAME_COREACCOUNT_BEDA',
+        check_same_name, "CUST_NAME di coreaccount berbeda dengan file customer", vectorized=True)),
+    (('custcorpmanagement',), rule('NPWP_PENGURUS_SAMA_PERUSAHAAN', 'NPWP_PENGURUS_SAMA',
+        check_own_npwp, "Ada pengurus dengan NPWP sama dengan NPWP perusahaan", report_column='NPWP_NO_CUSTOMER', vectorized=True)),
+]
+
+# Kolom yang dibaca dari setiap file (hanya kolom ini yang diparse)
+COLUMNS = {
+    'coreaccount': ['CUST_NO', 'CUST_NAME', 'PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO', 'BRANCH_CODE'],
+    'customer': ['CUST_NO', 'CUST_NAME', 'CUST_TYPE', 'NPWP_NO'],
+    'customerpersonal': ['CUST_NO'],
+    'custcorporate': ['CUST_NO'],
+}
+
+# Kolom yang dipakai dari setiap file (dicek oleh --check tanpa memuat pandas);
+# BRANCH_CODE opsional, hanya untuk ringkasan per cabang
+REQUIRED_COLUMNS = dict(
+    COLUMNS,
+    coreaccount=[c for c in COLUMNS['coreaccount'] if c != 'BRANCH_CODE'],
+    custcorpmanagement=['CUST_NO', 'NPWP_NO'],
+)
+
+OPTIONAL_FILES = ('customerpersonal', 'custcorporate', 'custcorpmanagement')
+
+def find_input_files(current_dir):
+    files = os.listdir(current_dir)
+    return {
+        'coreaccount': next((f for f in files if ('coraccount' in f.lower() or 'coreaccount' in f.lower()) and f.endswith('.txt')), None),
+        'customer': next((f for f in files if f.lower().startswith('customer_') and f.endswith('.txt')), None),
+        'customerpersonal': next((f for f in files if f.lower().startswith('customerpersonal_') and f.endswith('.txt')), None),
+        'custcorporate': next((f for f in files if f.lower().startswith('custcorporate_') and f.endswith('.txt')), None),
+        'custcorpmanagement': next((f for f in files if f.lower().startswith('custcorpmanagement_') and f.endswith('.txt')), None),
+    }
+
+# ==========================================
+# STEP 3: PROSES DAN PENYIMPANAN
+# ==========================================
+
+def run_validation(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
+
+    input_files = find_input_files(current_dir)
+    if args.check:
+        return check_schema(current_dir, input_files, REQUIRED_COLUMNS, optional=OPTIONAL_FILES)
+    if not input_files['coreaccount'] or not input_files['customer']:
+        print("Error: File .txt coreaccount dan customer tidak ditemukan di folder.")
+        return 1
+
+    # Modul berat baru dimuat setelah --check, supaya cek skema tidak menunggu import pandas
+    from validasi.consistency import build_key_index, first_value_differing, keys_with_value_of
+    from validasi.extracts import read_columns
+    from validasi.master_data import normalize
+    from validasi.pipeline import ValidationRun
+
+    input_paths = [os.path.join(current_dir, f) for f in input_files.values() if f]
+    print("Membaca data...")
+    frames = {
+        role: read_columns(os.path.join(current_dir, input_files[role]), columns)
+        for role, columns in COLUMNS.items() if input_files[role]
+    }
+
+    # Satu index CUST_NO untuk semua file; yang dicek hanya CUST_NO yang ada di coreaccount
+    df_index = build_key_index(frames)
+    df_index = df_index[df_index['ADA_COREACCOUNT']].reset_index(drop=True)
+
+    # Kolom identitas untuk sheet error, ringkasan, dan row status
+    for col in ['PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO', 'BRANCH_CODE']:
+        if f'{col}_COREACCOUNT' in df_index.columns:
+            df_index[col] = df_index[f'{col}_COREACCOUNT']
+    df_index['CUST_NAME'] = df_index['CUST_NAME_CUSTOMER'].fillna(df_index['CUST_NAME_COREACCOUNT'])
+
+    # Kolom bantu untuk fungsi cek: tipe customer yang sudah dinormalisasi
+    cust_type = normalize(df_index['CUST_TYPE_CUSTOMER'])
+    df_index['TIPE_PERSONAL'] = (cust_type == 'P').fillna(False).astype(bool)
+    df_index['TIPE_CORPORATE'] = (cust_type == 'C').fillna(False).astype(bool)
+
+    # Nama dibandingkan di semua baris coreaccount (satu CUST_NO bisa punya banyak agreement),
+    # sama seperti NPWP pengurus di bawah; kolom berisi nama coreaccount pertama yang berbeda
+    customer_name = frames['customer'].drop_duplicates('CUST_NO').set_index('CUST_NO')['CUST_NAME']
+    df_index['CUST_NAME_COREACCOUNT_BEDA'] = df_index['CUST_NO'].map(
+        first_value_differing(frames['coreaccount'], customer_name, 'CUST_NAME'))
+
+    # NPWP pengurus dibandingkan dengan NPWP perusahaan di file customer
+    if input_files['custcorpmanagement']:
+        df_mngmnt = read_columns(os.path.join(current_dir, input_files['custcorpmanagement']), REQUIRED_COLUMNS['custcorpmanagement'])
+        corporate_npwp = frames['customer'].drop_duplicates('CUST_NO').set_index('CUST_NO')['NPWP_NO']
+        df_index['NPWP_PENGURUS_SAMA'] = df_index['CUST_NO'].isin(keys_with_value_of(df_mngmnt, corporate_npwp, 'NPWP_NO'))
+
+    rules = []
+    for roles, check in CONSISTENCY_CHECKS:
+        missing = [role for role in roles if not input_files[role]]
+        if missing:
+            print(f"Info: file {', '.join(missing)} tidak ditemukan, cek {check.sheet} dilewati.")
+            continue
+        rules.append(check)
+
+    # Cek konsistensi dihitung ulang dari awal setiap run (tanpa checkpoint)
+    run = ValidationRun(args, current_dir, 'KONSISTENSI', df_index, sheet_names_of(rules), input_paths, __file__,
+                        resumable=False)
+    print("Memulai cek konsistensi antar file...")
+    run.check_rules(rules)
+    run.write_results('DATA_KONSISTENSI_TIDAK_VALID.xlsx', "Luar biasa! Semua file konsisten satu sama lain.")
+
+if __name__ == "__main__":
+    sys.exit(run_validation(parse_args(description="Cek konsistensi data antar file extract")))
@@ -0,0 +1,23 @@
+import os
+import sys
+
+from validasi.cli import parse_args
+from validasi.row_status import combine_row_status
+
+# ==========================================
+# GABUNGKAN ROW STATUS DARI KELIMA VALIDATOR
+# ==========================================
+
+def run_combine(args=None):
+    args = args or parse_args([])
+    current_dir = args.dir or os.path.dirname(os.path.abspath(__file__))
+    fmt = 'csv' if args.output == 'xlsx' else args.output
+
+    path = combine_row_status(current_dir, fmt)
+    if path is None:
+        print("Error: Belum ada file ROW_STATUS_*. Jalankan validasi dengan --output csv atau --output parquet.")
+        return 1
+    print(f"Selesai! Status gabungan per CUST_NO tersimpan di: {path}")
+
+if __name__ == "__main__":
+    sys.exit(run_combine(parse_args(description="Gabungkan ROW_STATUS_* dari semua validator")))
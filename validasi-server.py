@@ -0,0 +1,147 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from validasi import scripts
+from validasi.cli import parse_args
+from validasi.extracts import MAX_CACHED_DIRS, cache_info, enable_cache
+from validasi.scripts import VALIDATORS
+
+# ==========================================
+# SERVER VALIDASI LOKAL (CACHE TETAP HANGAT)
+# ==========================================
+#
+# Jalankan sekali:   python validasi-server.py --port 8765
+# Lalu kirim request: curl -X POST localhost:8765/validate \
+#                          -d '{"validator": "customerpersonal", "dir": "D:/data/2024-10"}'
+#
+# pandas dan script validasi hanya diimport sekali, file extract yang tidak
+# berubah (mtime & ukuran sama) tidak diparse ulang di request berikutnya.
+#
+# Selain "validator" dan "dir", request hanya boleh berisi opsi di REQUEST_OPTIONS,
+# misal {"validator": "customer", "dir": "...", "output": "csv", "engine": "rows"}.
+# --plugin sengaja tidak bisa dikirim: file .py di folder plugin dieksekusi, jadi
+# folder plugin hanya bisa diatur di server sendiri (folder 'plugin' di samping script).
+
+REQUEST_OPTIONS = ('output', 'engine', 'referensi', 'riwayat', 'metrics')
+
+_modules = {}
+
+
+def load_validator(name):
+    """Import validasi-data-<name>.py sekali saja; request berikutnya memakai modul yang sama."""
+    if name not in _modules:
+        _modules[name] = scripts.load_validator(name)
+    return _modules[name]
+
+
+def handle_validate(payload):
+    name = str(payload.get('validator', '')).lower()
+    if name not in VALIDATORS:
+        return 400, {'status': 'error', 'message': f"validator harus salah satu dari {VALIDATORS}"}
+
+    unknown = sorted(set(payload) - {'validator', 'dir'} - set(REQUEST_OPTIONS))
+    if unknown:
+        return 400, {'status': 'error', 'message': f"field tidak dikenal: {', '.join(unknown)} "
+                                                   f"(yang boleh: validator, dir, {', '.join(REQUEST_OPTIONS)})"}
+    data_dir = payload.get('dir')
+    if data_dir and not os.path.isdir(str(data_dir)):
+        return 422, {'status': 'error', 'validator': name, 'message': f"folder data tidak ditemukan: {data_dir}"}
+
+    # Bentuk --opsi=nilai supaya nilai yang diawali '--' tidak dibaca sebagai opsi lain
+    argv = [f'--dir={data_dir}'] if data_dir else []
+    argv += [f'--{option}={payload[option]}' for option in REQUEST_OPTIONS if payload.get(option) is not None]
+    try:
+        args = parse_args(argv)
+    except SystemExit:
+        return 400, {'status': 'error', 'message': f"argumen tidak valid: {argv}"}
+
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            result = load_validator(name).run_validation(args)
+    except Exception:
+        return 500, {'status': 'error', 'message': traceback.format_exc(), 'log': log.getvalue()}
+    if result:
+        # Validasi dibatalkan (file/kolom tidak ditemukan) atau --check menemukan masalah skema
+        lines = log.getvalue().strip().splitlines()
+        return 422, {
+            'status': 'error',
+            'validator': name,
+            'message': lines[-1] if lines else f"validasi berhenti dengan kode {result}",
+            'log': log.getvalue(),
+        }
+    return 200, {
+        'status': 'ok',
+        'validator': name,
+        'seconds': round(time.perf_counter() - start, 3),
+        'log': log.getvalue(),
+    }
+
+
+class ValidationHandler(BaseHTTPRequestHandler):
+
+    def _send(self, code, body):
+        data = json.dumps(body, indent=2).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/status':
+            self._send(200, {'status': 'ok', 'validators_loaded': sorted(_modules), 'cache': cache_info()})
+        else:
+            self._send(404, {'status': 'error', 'message': 'Gunakan GET /status atau POST /validate'})
+
+    def do_POST(self):
+        if self.path != '/validate':
+            self._send(404, {'status': 'error', 'message': 'Gunakan GET /status atau POST /validate'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            self._send(400, {'status': 'error', 'message': 'Body harus objek JSON'})
+            return
+        code, body = handle_validate(payload)
+        self._send(code, body)
+
+
+def run_server(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Server validasi lokal dengan cache extract")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--max-folder', type=int, default=MAX_CACHED_DIRS,
+                        help=f"Jumlah folder data yang extract-nya disimpan di cache (default: {MAX_CACHED_DIRS}).")
+    opts = parser.parse_args(argv)
+
+    enable_cache(opts.max_folder)
+    # Script validasi memuat pandas secara lazy; di server dimuat sekali di awal
+    import pandas  # noqa: F401
+    for name in VALIDATORS:
+        load_validator(name)
+
+    # HTTPServer (bukan Threading) sengaja dipakai: request diproses berurutan
+    # supaya cache extract tidak diakses bersamaan oleh dua validasi.
+    server = HTTPServer((opts.host, opts.port), ValidationHandler)
+    print(f"Server validasi siap di http://{opts.host}:{opts.port} (POST /validate, GET /status)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Server dihentikan.")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    sys.exit(run_server())
@@ -0,0 +1,6 @@
+"""
+Modul bersama untuk script validasi-data-*.py.
+
+Setiap script tetap berdiri sendiri (bisa dijalankan langsung dengan python),
+modul di sini hanya berisi bagian yang dipakai bersama oleh kelima validator.
+"""
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+# ==========================================
+# CHECKPOINT UNTUK RUN YANG BISA DILANJUTKAN
+# ==========================================
+#
+# Hasil error setiap chunk baris dan setiap stage yang selesai disimpan di
+# <folder data>/.validasi_state/<VALIDATOR>/ (satu file .npz per bagian +
+# state.json). Run ulang dengan file input yang isinya sama (dicek lewat hash
+# isi file, script, dan tabel referensi) memuat bagian yang sudah selesai lalu
+# lanjut dari chunk/stage berikutnya. State dihapus setelah output tertulis.
+#
+# Dengan by_stat=True (dipakai server, lihat pipeline.py) yang di-hash hanya
+# mtime & ukuran file, sama seperti cache extract, supaya request berikutnya
+# tidak membaca ulang seluruh extract hanya untuk menghitung hash.
+
+STATE_DIR = '.validasi_state'
+CHUNK_ROWS = 250_000
+HASH_BLOCK_BYTES = 8 * 1024 ** 2
+
+
+def fingerprint(paths, extra=(), by_stat=False):
+    """
+    Hash isi semua file di `paths` (folder = semua file di dalamnya) ditambah nilai `extra`.
+    Bila `by_stat` True hanya (mtime, ukuran) setiap file yang di-hash, tanpa membaca isinya.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for value in extra:
+        digest.update(f'{value}\0'.encode())
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(path, name) for name in os.listdir(path))
+        elif os.path.exists(path):
+            files = [path]
+        else:
+            files = []
+        for file_path in files:
+            if not os.path.isfile(file_path):
+                continue
+            digest.update(f'{os.path.basename(file_path)}\0'.encode())
+            if by_stat:
+                stat = os.stat(file_path)
+                digest.update(f'{stat.st_mtime_ns}:{stat.st_size}\0'.encode())
+                continue
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b''):
+                    digest.update(block)
+    return digest.hexdigest()
+
+
+class Checkpoint:
+    """
+    Penyimpan progres satu validator. Bila `enabled` False semua method tetap
+    bisa dipanggil tetapi tidak ada yang disimpan (perilaku lama).
+    """
+
+    def __init__(self, current_dir, validator, paths, store, extra=(), enabled=True,
+                 chunk_rows=None, by_stat=False):
+        self.store = store
+        self.enabled = enabled
+        # CHUNK_ROWS dibaca saat run (bukan saat import) supaya bisa diubah, misal oleh benchmark
+        chunk_rows = chunk_rows or CHUNK_ROWS
+        self.chunk_rows = chunk_rows
+        self.directory = os.path.join(current_dir, STATE_DIR, validator)
+        self.state = {'fingerprint': None, 'parts': []}
+        if not enabled:
+            return
+        # Kode rule (script + package validasi) ikut di-hash: rule berubah = hasil lama tidak dipakai
+        self.state['fingerprint'] = fingerprint(
+            list(paths) + [os.path.dirname(os.path.abspath(__file__))], extra, by_stat)
+        state_path = os.path.join(self.directory, 'state.json')
+        if os.path.exists(state_path):
+            with open(state_path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('fingerprint') == self.state['fingerprint'] and saved.get('chunk_rows') == chunk_rows:
+                self.state = saved
+                print(f"Melanjutkan run sebelumnya: {len(saved['parts'])} bagian sudah selesai ({self.directory})")
+            else:
+                print("Info: file input berubah sejak run terakhir, checkpoint lama dibuang.")
+                shutil.rmtree(self.directory, ignore_errors=True)
+        self.state['chunk_rows'] = chunk_rows
+
+    def _part_path(self, name):
+        return os.path.join(self.directory, f'{name}.npz')
+
+    def _restore(self, name):
+        """Muat bagian `name` bila sudah selesai di run sebelumnya; True bila dimuat."""
+        if not self.enabled or name not in self.state['parts']:
+            return False
+        with np.load(self._part_path(name)) as part:
+            self.store.extend(dict(part))
+        return True
+
+    def _save(self, name, start):
+        if not self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._part_path(name) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **self.store.export(start))
+        os.replace(tmp_path, self._part_path(name))
+        self.state['parts'].append(name)
+        state_path = os.path.join(self.directory, 'state.json')
+        with open(state_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(state_path + '.tmp', state_path)
+
+    def chunk_count(self, n_rows):
+        return max(1, -(-n_rows // self.chunk_rows))
+
+    def chunks(self, n_rows):
+        """
+        (start, stop) setiap chunk baris yang belum selesai. Chunk yang sudah selesai
+        dimuat dari checkpoint; chunk baru disimpan setelah badan loop selesai.
+        """
+        for i in range(self.chunk_count(n_rows)):
+            name = f'chunk_{i:05d}'
+            if self._restore(name):
+                continue
+            mark = len(self.store)
+            start = i * self.chunk_rows
+            yield start, min(start + self.chunk_rows, n_rows)
+            self._save(name, mark)
+
+    def pending(self, stage):
+        """True bila `stage` masih harus dijalankan (hasil stage yang sudah selesai langsung dimuat)."""
+        if self._restore(stage):
+            return False
+        self._stage_mark = len(self.store)
+        return True
+
+    def complete(self, stage):
+        self._save(stage, self._stage_mark)
+
+    def finish(self):
+        """Output sudah tertulis: state tidak diperlukan lagi."""
+        if self.enabled:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            parent = os.path.dirname(self.directory)
+            if os.path.isdir(parent) and not os.listdir(parent):
+                os.rmdir(parent)
@@ -0,0 +1,56 @@
+import argparse
+
+# ==========================================
+# ARGUMEN COMMAND LINE BERSAMA
+# ==========================================
+
+OUTPUT_CHOICES = ['xlsx', 'csv', 'parquet']
+
+
+def parse_args(argv=None, description=None):
+    """
+    Argumen yang sama untuk semua script validasi.
+    Tanpa argumen perilakunya sama seperti sebelumnya (file Excel per sheet).
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--dir', default=None,
+        help="Folder berisi file extract .txt dan tempat hasil disimpan (default: folder script).",
+    )
+    parser.add_argument(
+        '--referensi', default=None,
+        help="Folder tabel referensi kode (default: folder 'referensi' di samping script).",
+    )
+    parser.add_argument(
+        '--plugin', default=None,
+        help="Folder file .py berisi rule tambahan (lihat validasi/plugins.py; default: folder 'plugin' di samping script).",
+    )
+    parser.add_argument(
+        '--output', choices=OUTPUT_CHOICES, default='xlsx',
+        help="xlsx: file Excel per sheet error (default). "
+             "csv/parquet: satu baris status per record (ROW_STATUS_<VALIDATOR>) untuk join.",
+    )
+    parser.add_argument(
+        '--engine', choices=['unique', 'rows'], default='unique',
+        help="unique: cek rule sekali per nilai unik lalu disebar ke semua baris (default). "
+             "rows: cek baris per baris seperti loop lama (pembanding).",
+    )
+    parser.add_argument(
+        '--no-checkpoint', dest='checkpoint', action='store_false',
+        help="Jangan simpan/lanjutkan progres di folder .validasi_state (default: run yang terputus "
+             "dilanjutkan dari chunk terakhir bila file input sama persis).",
+    )
+    parser.add_argument(
+        '--riwayat', default=None,
+        help="Folder snapshot error untuk laporan perubahan vs extract sebelumnya (default: folder 'riwayat' di folder data).",
+    )
+    parser.add_argument(
+        '--metrics', default=None,
+        help="File metrik progres per chunk/stage: *.prom = textfile Prometheus, lainnya = JSON lines. "
+             "'{validator}' di path diganti nama validator.",
+    )
+    parser.add_argument(
+        '--check', action='store_true',
+        help="Hanya cek keberadaan file dan kolom wajib (tanpa memuat pandas), lalu keluar.",
+    )
+    return parser.parse_args(argv)
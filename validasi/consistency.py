@@ -0,0 +1,60 @@
+import pandas as pd
+
+from validasi.master_data import normalize
+
+# ==========================================
+# INDEX KEY GABUNGAN ANTAR FILE EXTRACT
+# ==========================================
+#
+# Semua extract digabung sekali ke satu tabel per CUST_NO (join hash lewat
+# index), lalu relasi antar file dicek sebagai operasi kolom di tabel itu.
+
+KEY_COLUMN = 'CUST_NO'
+
+
+def build_key_index(frames, key=KEY_COLUMN):
+    """
+    Satu baris per CUST_NO dari semua file di `frames` ({peran file: DataFrame}).
+    Setiap file menyumbang kolom `<KOLOM>_<FILE>` dari baris pertama CUST_NO
+    tersebut (sama seperti drop_duplicates('CUST_NO') di script validasi) dan
+    kolom ADA_<FILE> yang bernilai True bila CUST_NO ada di file itu.
+    """
+    parts = []
+    for role, frame in frames.items():
+        suffix = role.upper()
+        part = frame[frame[key].notna()].drop_duplicates(key).set_index(key).add_suffix(f'_{suffix}')
+        part[f'ADA_{suffix}'] = True
+        parts.append(part)
+    index = pd.concat(parts, axis=1, join='outer', sort=False)
+    for role in frames:
+        index[f'ADA_{role.upper()}'] = index[f'ADA_{role.upper()}'].notna()
+    return index.rename_axis(key).reset_index()
+
+
+def filled(values):
+    return normalize(values).notna().to_numpy()
+
+
+def same_text(a, b):
+    """True bila kedua nilai terisi dan sama (tanpa beda spasi/huruf besar)."""
+    return (normalize(a) == normalize(b)).fillna(False).to_numpy(dtype=bool)
+
+
+def keys_with_value_of(detail, lookup, column, key=KEY_COLUMN):
+    """
+    CUST_NO yang salah satu baris `detail`-nya memiliki nilai `column` sama dengan
+    `lookup` (Series nilai per CUST_NO) untuk CUST_NO yang sama.
+    """
+    same = same_text(detail[column], detail[key].map(lookup))
+    return pd.Index(detail.loc[same, key].unique())
+
+
+def first_value_differing(detail, lookup, column, key=KEY_COLUMN):
+    """
+    Per CUST_NO: nilai `column` pertama di baris `detail` yang terisi tetapi berbeda
+    dengan `lookup` (Series nilai per CUST_NO). Semua baris detail ikut dicek, bukan
+    hanya baris pertama per CUST_NO; CUST_NO tanpa perbedaan tidak ada di hasil.
+    """
+    expected = detail[key].map(lookup)
+    differs = filled(detail[column]) & filled(expected) & ~same_text(detail[column], expected)
+    return detail.loc[differs].drop_duplicates(key).set_index(key)[column]
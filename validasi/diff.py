@@ -0,0 +1,144 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# PERUBAHAN ERROR DIBANDING RUN SEBELUMNYA
+# ==========================================
+#
+# Setiap run menyimpan snapshot ringkas error: hash uint64 dari
+# (RULE, CUST_NO, AGRMNT_NO) yang sudah diurutkan, beserta nilai aslinya.
+# Perbandingan dengan snapshot sebelumnya cukup merge dua array hash terurut
+# (BARU = hanya di run ini, SELESAI = hanya di run lalu, MASIH = di keduanya).
+#
+# riwayat/SNAPSHOT_<VALIDATOR>.npz             snapshot terakhir
+# riwayat/SNAPSHOT_<VALIDATOR>_SEBELUMNYA.npz  snapshot extract sebelumnya
+# Bila extract yang sama dijalankan ulang, pembandingnya tetap extract sebelumnya.
+
+KEY_COLUMNS = ['CUST_NO', 'AGRMNT_NO']
+STATUS_NEW, STATUS_RESOLVED, STATUS_PERSISTING = 'BARU', 'SELESAI', 'MASIH'
+MAX_SHEET_ROWS = 1_048_575  # batas baris sheet Excel (tanpa header)
+
+
+def input_signature(paths):
+    """Identitas extract yang murah dihitung: nama, ukuran, dan waktu ubah file."""
+    signature = []
+    for path in sorted(paths):
+        stat = os.stat(path)
+        signature.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def build_snapshot(df, rule_names, rows, rule_ids, key_cols=KEY_COLUMNS):
+    """Snapshot error unik per (rule, key), terurut menurut hash."""
+    rows = np.asarray(rows, dtype=np.int64)
+    keys = pd.DataFrame({'RULE': np.asarray(rule_names, dtype=object)[np.asarray(rule_ids, dtype=np.int64)]})
+    for col in key_cols:
+        values = df[col].to_numpy(dtype=object)[rows] if col in df.columns else np.full(len(rows), None, dtype=object)
+        keys[col] = pd.Series(values, dtype=object).fillna('').astype(str).to_numpy()
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+    hashes, first = np.unique(hashes, return_index=True)
+    keys = keys.iloc[first]
+    return {
+        'hash': hashes,
+        'rule': keys['RULE'].to_numpy(dtype=str),
+        **{col.lower(): keys[col].to_numpy(dtype=str) for col in key_cols},
+    }
+
+
+def save_snapshot(path, snapshot, meta):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, meta=np.array(json.dumps(meta)), **snapshot)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path):
+    if not os.path.exists(path):
+        return None, None
+    with np.load(path) as data:
+        snapshot = {name: data[name] for name in data.files if name != 'meta'}
+        meta = json.loads(str(data['meta']))
+    return snapshot, meta
+
+
+def compare_snapshots(previous, current, key_cols=KEY_COLUMNS):
+    """
+    Bandingkan dua snapshot lewat merge array hash terurut.
+    Mengembalikan (detail BARU + SELESAI, jumlah BARU/SELESAI/MASIH per rule).
+    """
+    _, cur_idx, prev_idx = np.intersect1d(current['hash'], previous['hash'], assume_unique=True, return_indices=True)
+    new_mask = np.ones(len(current['hash']), dtype=bool)
+    new_mask[cur_idx] = False
+    resolved_mask = np.ones(len(previous['hash']), dtype=bool)
+    resolved_mask[prev_idx] = False
+
+    def part(snapshot, mask, status):
+        data = {'STATUS': status, 'RULE': snapshot['rule'][mask]}
+        for col in key_cols:
+            data[col] = snapshot[col.lower()][mask]
+        return pd.DataFrame(data)
+
+    detail = pd.concat([part(current, new_mask, STATUS_NEW), part(previous, resolved_mask, STATUS_RESOLVED)],
+                       ignore_index=True)
+    statuses = pd.concat([
+        detail[['STATUS', 'RULE']],
+        pd.DataFrame({'STATUS': STATUS_PERSISTING, 'RULE': current['rule'][cur_idx]}),
+    ], ignore_index=True)
+    counts = statuses.groupby(['RULE', 'STATUS']).size().unstack(fill_value=0)
+    counts = counts.reindex(columns=[STATUS_NEW, STATUS_RESOLVED, STATUS_PERSISTING], fill_value=0)
+    return detail.sort_values(['RULE', 'STATUS'], kind='stable', ignore_index=True), counts
+
+
+def run_diff(history_dir, validator, df, rule_names, rows, rule_ids, input_paths, json_path):
+    """
+    Simpan snapshot run ini, bandingkan dengan extract sebelumnya, tulis JSON perubahan.
+    Mengembalikan DataFrame detail (BARU/SELESAI) atau None bila belum ada pembanding.
+    """
+    latest_path = os.path.join(history_dir, f'SNAPSHOT_{validator}.npz')
+    previous_path = os.path.join(history_dir, f'SNAPSHOT_{validator}_SEBELUMNYA.npz')
+    signature = input_signature(input_paths)
+
+    latest, latest_meta = load_snapshot(latest_path)
+    if latest is not None and latest_meta.get('inputs') == signature:
+        # Extract yang sama dijalankan ulang: pembanding tetap extract sebelumnya
+        baseline, baseline_meta = load_snapshot(previous_path)
+    else:
+        baseline, baseline_meta = latest, latest_meta
+        if latest is not None:
+            os.replace(latest_path, previous_path)
+
+    current = build_snapshot(df, rule_names, rows, rule_ids)
+    meta = {'validator': validator, 'generated_at': datetime.now().isoformat(timespec='seconds'), 'inputs': signature}
+    save_snapshot(latest_path, current, meta)
+
+    if baseline is None:
+        print(f"Info: belum ada snapshot sebelumnya di {history_dir}, laporan perubahan dimulai run berikutnya.")
+        return None
+
+    detail, counts = compare_snapshots(baseline, current)
+    payload = {
+        'validator': validator,
+        'generated_at': meta['generated_at'],
+        'compared_to': baseline_meta.get('generated_at'),
+        'totals': {status: int(counts[status].sum()) for status in counts.columns},
+        'rules': {
+            rule: {status: int(n) for status, n in row.items()}
+            for rule, row in counts.iterrows()
+        },
+    }
+    tmp_path = json_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, json_path)
+    totals = payload['totals']
+    print(f"Perubahan vs {payload['compared_to']}: {totals[STATUS_NEW]} baru, "
+          f"{totals[STATUS_RESOLVED]} selesai, {totals[STATUS_PERSISTING]} masih ada")
+    if len(detail) > MAX_SHEET_ROWS:
+        print(f"Info: detail perubahan {len(detail)} baris, sheet PERUBAHAN dipotong {MAX_SHEET_ROWS} baris (lihat JSON untuk total).")
+        detail = detail.iloc[:MAX_SHEET_ROWS]
+    return detail
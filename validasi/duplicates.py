@@ -0,0 +1,195 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# DETEKSI DUPLIKAT BERBASIS HASH + SORT
+# ==========================================
+#
+# Pass 1 membaca file per chunk dan hanya menyimpan hash uint64 (key dan isi
+# baris), lalu grup dicari dengan lexsort. Hanya baris kandidat duplikat yang
+# dibaca ulang di pass 2 dan dibandingkan nilai aslinya (bebas dari tabrakan hash).
+# Bila file sangat besar, key dibagi ke beberapa partisi hash supaya array di
+# memori tidak melebihi MEMORY_BUDGET_BYTES; pass 2 juga dijalankan per partisi.
+
+CHUNK_ROWS = 500_000
+MEMORY_BUDGET_BYTES = 512 * 1024 ** 2
+BYTES_PER_ROW = 24  # hash key + hash isi + posisi baris (masing-masing 8 byte)
+MAX_LISTED_VALUES = 100  # nomor baris / CUST_NO yang ditulis per sel, sisanya hanya dihitung
+
+
+def _chunks(path, usecols=None):
+    return pd.read_csv(path, sep='|', dtype=str, usecols=usecols, chunksize=CHUNK_ROWS)
+
+
+def _hash(frame):
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+
+
+def plan_partitions(path):
+    """Jumlah partisi hash agar array pass 1 muat di MEMORY_BUDGET_BYTES (perkiraan dari ukuran file)."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        sample = f.read(1024 * 1024)
+    lines = max(sample.count(b'\n'), 1)
+    estimated_rows = size / (len(sample) / lines) if sample else 0
+    return max(1, math.ceil(estimated_rows * BYTES_PER_ROW / MEMORY_BUDGET_BYTES))
+
+
+def _scan_groups(path, key_cols, value_cols, partition, partitions):
+    """
+    Pass 1: kembalikan (posisi, hash key, hash nilai) untuk baris dengan key terisi
+    yang jatuh di partisi ini. `value_cols=None` berarti seluruh isi baris.
+    """
+    positions, keys, values = [], [], []
+    offset = 0
+    usecols = None if value_cols is None else list(dict.fromkeys(key_cols + value_cols))
+    for chunk in _chunks(path, usecols):
+        filled = chunk[key_cols].notna().all(axis=1).to_numpy()
+        key_hash = _hash(chunk[key_cols])
+        selected = filled & (key_hash % np.uint64(partitions) == partition)
+        if selected.any():
+            payload = chunk if value_cols is None else chunk[value_cols]
+            positions.append(np.flatnonzero(selected) + offset)
+            keys.append(key_hash[selected])
+            values.append(_hash(payload)[selected])
+        offset += len(chunk)
+    if not positions:
+        empty = np.empty(0, dtype=np.uint64)
+        return np.empty(0, dtype=np.int64), empty, empty
+    return np.concatenate(positions), np.concatenate(keys), np.concatenate(values)
+
+
+def _group_stats(keys, values):
+    """Urutkan (key, nilai) dan hitung ukuran grup serta jumlah nilai berbeda per key."""
+    order = np.lexsort((values, keys))
+    k, v = keys[order], values[order]
+    new_key = np.ones(len(k), dtype=bool)
+    new_key[1:] = k[1:] != k[:-1]
+    new_value = new_key.copy()
+    new_value[1:] |= v[1:] != v[:-1]
+    group_id = np.cumsum(new_key) - 1
+    size = np.bincount(group_id)
+    distinct = np.bincount(group_id, weights=new_value).astype(np.int64)
+    return order, group_id, size, distinct
+
+
+def _read_rows(path, positions, usecols=None):
+    """Pass 2: baca ulang hanya baris pada posisi tertentu (posisi 0 = baris data pertama)."""
+    positions = np.sort(positions)
+    parts, offset = [], 0
+    for chunk in _chunks(path, usecols):
+        local = positions[(positions >= offset) & (positions < offset + len(chunk))] - offset
+        if len(local):
+            part = chunk.iloc[local].copy()
+            part['BARIS_FILE'] = local + offset + 2  # +1 header, +1 karena nomor baris mulai 1
+            parts.append(part)
+        offset += len(chunk)
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+
+def _join_limited(frame, group_cols, column, limit=None):
+    """
+    Gabungkan nilai `column` per grup menjadi satu teks "a, b, c", maksimal `limit`
+    nilai pertama (sisanya ditulis "... (+N lainnya)") supaya sel Excel tidak melewati
+    batas 32.767 karakter. Jumlah lengkapnya ada di kolom JUMLAH_*.
+    """
+    limit = limit or MAX_LISTED_VALUES
+    grouped = frame.groupby(group_cols, sort=False)
+    total = grouped[column].size()
+    shown = frame[grouped.cumcount() < limit]
+    text = shown[column].astype(str).groupby([shown[c] for c in group_cols], sort=False).agg(', '.join)
+    more = (total - limit).clip(lower=0)
+    suffix = pd.Series(np.where(more > 0, ', ... (+' + more.astype(str) + ' lainnya)', ''), index=total.index)
+    return text.reindex(total.index) + suffix
+
+
+def _candidate_positions(path, key_cols, value_cols, partition, partitions, stat):
+    """Posisi baris di partisi ini yang grup key-nya lolos `stat` (size/distinct > 1)."""
+    positions, keys, values = _scan_groups(path, key_cols, value_cols, partition, partitions)
+    if not len(keys):
+        return positions
+    order, group_id, size, distinct = _group_stats(keys, values)
+    counts = size if stat == 'size' else distinct
+    return positions[order][counts[group_id] > 1]
+
+
+def _duplicate_key_records(rows, source, key_cols):
+    """Satu baris per key duplikat di `rows` (kandidat satu partisi), tanpa loop per key."""
+    data_cols = [c for c in rows.columns if c != 'BARIS_FILE']
+    grouped = rows.groupby(key_cols, sort=True)
+    size = grouped.size()
+    size = size[size > 1]  # grup berukuran 1 = tabrakan hash, key aslinya berbeda
+    if size.empty:
+        return pd.DataFrame()
+    # Satu groupby untuk semua kolom: kolom yang nilainya beda di dalam key yang sama
+    varying = grouped[data_cols].nunique(dropna=False).loc[size.index] > 1
+    names = pd.Series([f'{c}, ' for c in data_cols], index=data_cols, dtype=object)
+    kolom_berbeda = varying.dot(names).str[:-2]
+
+    keys = size.index.to_frame(index=False).astype(str)
+    return pd.DataFrame({
+        'SUMBER': source,
+        'KOLOM_KEY': '+'.join(key_cols),
+        'KEY': keys.agg('|'.join, axis=1).to_numpy(),
+        'JUMLAH_BARIS': size.to_numpy(),
+        'BARIS_FILE': _join_limited(rows, key_cols, 'BARIS_FILE').reindex(size.index).to_numpy(),
+        'KOLOM_BERBEDA': kolom_berbeda.to_numpy(),
+    })
+
+
+def find_duplicate_keys(path, source, key_cols, partitions=None):
+    """
+    Key yang muncul lebih dari sekali. Hasil: (duplikat persis, konflik key),
+    masing-masing satu baris per key dengan daftar nomor baris file.
+    Pass 2 dijalankan per partisi, jadi memori mengikuti kandidat satu partisi saja.
+    """
+    partitions = partitions or plan_partitions(path)
+    parts = []
+    for partition in range(partitions):
+        candidates = _candidate_positions(path, key_cols, None, partition, partitions, 'size')
+        if len(candidates):
+            parts.append(_duplicate_key_records(_read_rows(path, candidates), source, key_cols))
+    records = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    if records.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    if partitions > 1:
+        records = records.sort_values('KEY', kind='stable', ignore_index=True)
+    is_conflict = records['KOLOM_BERBEDA'] != ''
+    exact = records[~is_conflict].drop(columns='KOLOM_BERBEDA').reset_index(drop=True)
+    return exact, records[is_conflict].reset_index(drop=True)
+
+
+def _shared_value_records(rows, source, value_col, owner_col):
+    owners = rows.dropna(subset=[owner_col]).drop_duplicates([value_col, owner_col])
+    owner_count = owners.groupby(value_col, sort=True).size()
+    owner_count = owner_count[owner_count > 1]
+    if owner_count.empty:
+        return pd.DataFrame()
+    owners = owners[owners[value_col].isin(owner_count.index)].sort_values([value_col, owner_col])
+    rows = rows[rows[value_col].isin(owner_count.index)]
+    return pd.DataFrame({
+        'SUMBER': source,
+        value_col: owner_count.index.to_numpy(),
+        f'JUMLAH_{owner_col}': owner_count.to_numpy(),
+        f'DAFTAR_{owner_col}': _join_limited(owners, [value_col], owner_col).reindex(owner_count.index).to_numpy(),
+        'BARIS_FILE': _join_limited(rows, [value_col], 'BARIS_FILE').reindex(owner_count.index).to_numpy(),
+    })
+
+
+def find_shared_values(path, source, value_col, owner_col, partitions=None):
+    """Nilai `value_col` (misal ID_NO) yang dipakai oleh lebih dari satu `owner_col` (CUST_NO)."""
+    partitions = partitions or plan_partitions(path)
+    parts = []
+    for partition in range(partitions):
+        candidates = _candidate_positions(path, [value_col], [owner_col], partition, partitions, 'distinct')
+        if len(candidates):
+            rows = _read_rows(path, candidates, usecols=[value_col, owner_col])
+            parts.append(_shared_value_records(rows, source, value_col, owner_col))
+    records = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    if partitions > 1 and not records.empty:
+        records = records.sort_values(value_col, kind='stable', ignore_index=True)
+    return records
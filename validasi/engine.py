@@ -0,0 +1,167 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from validasi.rules import RESULT_CACHE
+
+# ==========================================
+# ENGINE PENGECEKAN RULE
+# ==========================================
+#
+# unique : setiap rule dievaluasi sekali per nilai (atau kombinasi nilai) unik
+#          lalu hasilnya disebar kembali ke semua baris (factorize -> cek -> broadcast).
+# rows   : rule dievaluasi baris per baris seperti loop iterrows() lama; dipakai
+#          sebagai pembanding hasil.
+
+ENGINES = ['unique', 'rows']
+
+# Rule dianggap terlalu mahal bila waktunya >= kelipatan ini dari median rule lain
+COST_WARNING_RATIO = 10
+COST_WARNING_MIN_SECONDS = 1.0
+
+
+class RuleCosts:
+    """
+    Biaya setiap rule selama satu run, dijumlahkan lintas chunk: waktu, jumlah
+    baris, jumlah pemanggilan fungsi cek, dan jumlah error. Dipakai di statistik
+    run (ProgressReporter) supaya rule baru yang lambat langsung terlihat.
+    """
+
+    def __init__(self):
+        self._costs = {}
+
+    def add(self, rule, mode, seconds, rows, calls, errors):
+        key = (rule.sheet, rule.columns, rule.check)
+        cost = self._costs.get(key)
+        if cost is None:
+            cost = self._costs[key] = {
+                'rule': rule.sheet, 'columns': '+'.join(rule.columns), 'mode': mode,
+                'seconds': 0.0, 'rows': 0, 'calls': 0, 'errors': 0,
+            }
+        cost['seconds'] += seconds
+        cost['rows'] += rows
+        cost['calls'] += calls
+        cost['errors'] += errors
+
+    def table(self):
+        """Daftar biaya per rule, termahal lebih dulu."""
+        return sorted(
+            ({**cost, 'seconds': round(cost['seconds'], 4)} for cost in self._costs.values()),
+            key=lambda cost: cost['seconds'], reverse=True,
+        )
+
+    def expensive(self):
+        """Rule yang waktunya jauh di atas median rule lain (kandidat penyebab run lambat)."""
+        costs = self.table()
+        if len(costs) < 2:
+            return []
+        median = float(np.median([cost['seconds'] for cost in costs]))
+        return [
+            cost for cost in costs
+            if cost['seconds'] >= COST_WARNING_MIN_SECONDS and cost['seconds'] >= COST_WARNING_RATIO * median
+        ]
+
+
+def _column(df, col):
+    if col in df.columns:
+        return df[col]
+    return pd.Series(np.full(len(df), None, dtype=object), index=df.index)
+
+
+def _factorize(df, columns):
+    """Kode kombinasi per baris dan daftar tuple nilai untuk setiap kombinasi unik."""
+    codes, uniques = [], []
+    for col in columns:
+        if col in df.columns:
+            c, u = pd.factorize(df[col], use_na_sentinel=False)
+            codes.append(c.astype(np.int64))
+            uniques.append(np.asarray(u, dtype=object))
+        else:
+            codes.append(np.zeros(len(df), dtype=np.int64))
+            uniques.append(np.array([None], dtype=object))
+
+    if len(columns) == 1:
+        return codes[0], [(v,) for v in uniques[0]]
+
+    sizes = [max(len(u), 1) for u in uniques]
+    if np.prod(sizes, dtype=float) < 2 ** 62:
+        key = np.zeros(len(df), dtype=np.int64)
+        for c, size in zip(codes, sizes):
+            key = key * size + c
+        combo_codes, combo_keys = pd.factorize(key)
+        parts = []
+        for size in reversed(sizes):
+            combo_keys, part = np.divmod(combo_keys, size)
+            parts.append(part)
+        parts.reverse()
+    else:
+        stacked, combo_codes = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+        parts = list(stacked.T)
+        combo_codes = combo_codes.reshape(-1)
+    combos = list(zip(*[u[p] for u, p in zip(uniques, parts)]))
+    return combo_codes, combos
+
+
+def _evaluate_unique(df, rule, cache):
+    codes, combos = _factorize(df, rule.columns)
+    valid = np.fromiter((bool(cache.lookup(rule.check, values)) for values in combos), dtype=bool, count=len(combos))
+    invalid_combos = np.flatnonzero(~valid)
+    positions = np.flatnonzero(~valid[codes]) if len(invalid_combos) else np.empty(0, dtype=np.int64)
+    if callable(rule.message) and len(positions):
+        combo_messages = np.empty(len(combos), dtype=object)
+        for i in invalid_combos:
+            combo_messages[i] = rule.message(*combos[i])
+        return positions, combo_messages[codes[positions]]
+    return positions, None
+
+
+def _evaluate_rows(df, rule):
+    arrays = [_column(df, col).to_numpy(dtype=object) for col in rule.columns]
+    positions, messages = [], []
+    for pos, values in enumerate(zip(*arrays)):
+        if not rule.check(*values):
+            positions.append(pos)
+            if callable(rule.message):
+                messages.append(rule.message(*values))
+    positions = np.asarray(positions, dtype=np.int64)
+    return positions, (np.asarray(messages, dtype=object) if callable(rule.message) else None)
+
+
+def evaluate_rule(df, rule, mode='unique', cache=RESULT_CACHE):
+    """
+    Posisi baris yang gagal rule beserta pesan per baris (None bila pesannya tetap).
+    """
+    if rule.vectorized:
+        valid = np.asarray(rule.check(*[_column(df, col) for col in rule.columns]), dtype=bool)
+        if valid.shape != (len(df),):
+            raise ValueError(f"Rule vektor {rule.sheet} harus mengembalikan mask {len(df)} baris, bukan {valid.shape}")
+        return np.flatnonzero(~valid), None
+    if mode == 'rows':
+        return _evaluate_rows(df, rule)
+    return _evaluate_unique(df, rule, cache)
+
+
+def _mode_of(rule, mode):
+    return 'vektor' if rule.vectorized else mode
+
+
+def evaluate_rules(df, rules, store, mode='unique', cache=RESULT_CACHE, offset=0, costs=None):
+    """
+    Jalankan semua rule atas `df` dan catat error ke ErrorStore.
+    `offset` ditambahkan ke posisi baris bila `df` adalah potongan (chunk) data.
+    Bila `costs` (RuleCosts) diberikan, biaya setiap rule ikut dicatat.
+    """
+    for rule in rules:
+        started, misses = time.perf_counter(), cache.misses
+        positions, messages = evaluate_rule(df, rule, mode, cache)
+        if costs is not None:
+            calls = {'vektor': 1, 'rows': len(df)}.get(_mode_of(rule, mode), cache.misses - misses)
+            costs.add(rule, _mode_of(rule, mode), time.perf_counter() - started, len(df), calls, len(positions))
+        positions = positions + offset
+        if messages is None:
+            store.add_many(rule.sheet, positions, rule.report_column, rule.message)
+            continue
+        message_codes, unique_messages = pd.factorize(messages)
+        for code, message in enumerate(unique_messages):
+            store.add_many(rule.sheet, positions[message_codes == code], rule.report_column, message)
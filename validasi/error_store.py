@@ -0,0 +1,140 @@
+from array import array
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# PENYIMPANAN ERROR RINGKAS (ARRAY INTEGER)
+# ==========================================
+
+IDENTITY_COLUMNS = ['PARTNER_NAME', 'PARTNER_AGRMNT_NO', 'AGRMNT_NO', 'CUST_NO', 'CUST_NAME']
+
+
+class ErrorStore:
+    """
+    Penampung error per sheet yang hanya mencatat (posisi baris, id rule,
+    id kolom, id pesan) dalam array integer. Kolom identitas (PARTNER_NAME,
+    CUST_NO, dst.) dan DATA_ORIGINAL baru diambil dari DataFrame sumber saat
+    sheet ditulis, sehingga data customer yang sama tidak disalin berulang kali.
+    """
+
+    def __init__(self, sheet_names, identity_columns=IDENTITY_COLUMNS, defaults=None,
+                 message_column='KETERANGAN_ERROR'):
+        self.sheet_names = list(sheet_names)
+        self.identity_columns = list(identity_columns)
+        self.defaults = defaults or {}
+        self.message_column = message_column
+        self._rule_index = {name: i for i, name in enumerate(self.sheet_names)}
+        self._column_names, self._column_index = [], {}
+        self._messages, self._message_index = [], {}
+        self._rows = array('q')
+        self._rules = array('i')
+        self._columns = array('i')
+        self._message_ids = array('i')
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _intern(self, value, names, index):
+        key = index.get(value)
+        if key is None:
+            key = index[value] = len(names)
+            names.append(value)
+        return key
+
+    def add(self, sheet_name, row_pos, col_name, message):
+        """Catat satu error untuk baris pada posisi `row_pos`."""
+        self._rows.append(row_pos)
+        self._rules.append(self._rule_index[sheet_name])
+        self._columns.append(self._intern(col_name, self._column_names, self._column_index))
+        self._message_ids.append(self._intern(message, self._messages, self._message_index))
+
+    def add_many(self, sheet_name, positions, col_name, message):
+        """Catat error yang sama untuk banyak baris sekaligus (hasil mask vektor)."""
+        positions = np.asarray(positions, dtype=np.int64)
+        n = len(positions)
+        if not n:
+            return
+        self._rows.extend(positions.tolist())
+        self._rules.extend([self._rule_index[sheet_name]] * n)
+        self._columns.extend([self._intern(col_name, self._column_names, self._column_index)] * n)
+        self._message_ids.extend([self._intern(message, self._messages, self._message_index)] * n)
+
+    @property
+    def rows(self):
+        return np.array(self._rows, dtype=np.int64)
+
+    @property
+    def rules(self):
+        return np.array(self._rules, dtype=np.int32)
+
+    def export(self, start=0):
+        """Entry mulai urutan ke-`start` dalam bentuk array (untuk disimpan ke checkpoint)."""
+        return {
+            'rows': np.array(self._rows[start:], dtype=np.int64),
+            'rules': np.array(self._rules[start:], dtype=np.int32),
+            'columns': np.array(self._columns[start:], dtype=np.int32),
+            'message_ids': np.array(self._message_ids[start:], dtype=np.int32),
+            'sheet_names': np.array(self.sheet_names, dtype=str),
+            'column_names': np.array(self._column_names, dtype=str),
+            'messages': np.array(self._messages, dtype=str),
+        }
+
+    def extend(self, exported):
+        """Tambahkan entry hasil `export` (id sheet/kolom/pesan dipetakan ulang lewat namanya)."""
+        rule_map = np.array([self._rule_index[name] for name in exported['sheet_names'].tolist()], dtype=np.int32)
+        column_map = np.array([self._intern(name, self._column_names, self._column_index)
+                               for name in exported['column_names'].tolist()], dtype=np.int32)
+        message_map = np.array([self._intern(message, self._messages, self._message_index)
+                                for message in exported['messages'].tolist()], dtype=np.int32)
+        self._rows.extend(exported['rows'].tolist())
+        self._rules.extend(rule_map[exported['rules']].tolist())
+        self._columns.extend(column_map[exported['columns']].tolist())
+        self._message_ids.extend(message_map[exported['message_ids']].tolist())
+
+    def sheet_frames(self, df):
+        """
+        Bentuk DataFrame per sheet (hanya sheet yang berisi error) dengan
+        mengindeks kolom identitas dan data asli dari `df` sesuai posisi baris.
+        """
+        rows, rules = self.rows, self.rules
+        columns = np.array(self._columns, dtype=np.int32)
+        message_ids = np.array(self._message_ids, dtype=np.int32)
+        messages = np.array(self._messages, dtype=object)
+        column_values = {}
+
+        def values_of(col):
+            if col not in column_values:
+                if col in df.columns:
+                    column_values[col] = df[col].to_numpy(dtype=object)
+                else:
+                    column_values[col] = None
+            return column_values[col]
+
+        # Urutkan per rule lalu per baris (stabil): urutan error di tiap sheet mengikuti urutan
+        # baris data, dan untuk baris yang sama mengikuti urutan pencatatan
+        order = np.lexsort((rows, rules))
+        bounds = np.searchsorted(rules[order], np.arange(len(self.sheet_names) + 1))
+
+        frames = {}
+        for rule_id, sheet_name in enumerate(self.sheet_names):
+            idx = order[bounds[rule_id]:bounds[rule_id + 1]]
+            if not len(idx):
+                continue
+            sheet_rows = rows[idx]
+            data = {}
+            for col in self.identity_columns:
+                values = values_of(col)
+                data[col] = values[sheet_rows] if values is not None else [self.defaults.get(col)] * len(idx)
+
+            original = np.full(len(idx), None, dtype=object)
+            sheet_columns = columns[idx]
+            for col_id in np.unique(sheet_columns):
+                values = values_of(self._column_names[col_id])
+                if values is not None:
+                    sel = sheet_columns == col_id
+                    original[sel] = values[sheet_rows[sel]]
+            data['DATA_ORIGINAL'] = original
+            data[self.message_column] = messages[message_ids[idx]]
+            frames[sheet_name] = pd.DataFrame(data)
+        return frames
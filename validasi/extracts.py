@@ -0,0 +1,91 @@
+import os
+from collections import OrderedDict
+
+import pandas as pd
+
+# ==========================================
+# PEMBACAAN FILE EXTRACT (+ CACHE UNTUK SERVER)
+# ==========================================
+
+# None = cache nonaktif (script dijalankan sekali lalu selesai).
+# validasi-server.py mengaktifkan cache agar extract yang tidak berubah tidak diparse ulang.
+# Cache dibatasi per folder data (LRU): folder yang paling lama tidak dipakai dibuang
+# seluruhnya saat folder baru melewati batas, supaya memori server tidak terus bertambah.
+MAX_CACHED_DIRS = 3
+_cache = None
+_max_dirs = MAX_CACHED_DIRS
+
+
+def enable_cache(max_dirs=MAX_CACHED_DIRS):
+    global _cache, _max_dirs
+    _max_dirs = max(1, max_dirs)
+    if _cache is None:
+        _cache = OrderedDict()  # folder -> {path: entry}, urutan = terakhir dipakai
+
+
+def cache_enabled():
+    return _cache is not None
+
+
+def cache_info():
+    """Daftar extract yang sedang tersimpan di cache (untuk endpoint status server)."""
+    if _cache is None:
+        return []
+    return [
+        {'path': path, 'rows': len(entry['frame']) if entry['frame'] is not None else None,
+         'keys': sorted(entry['keys'])}
+        for entries in _cache.values() for path, entry in entries.items()
+    ]
+
+
+def _entry(path):
+    """Entry cache untuk `path`, dibuat ulang bila mtime/ukuran file berubah."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    folder = os.path.dirname(path)
+    entries = _cache.get(folder)
+    if entries is None:
+        entries = _cache[folder] = {}
+        while len(_cache) > _max_dirs:
+            _cache.popitem(last=False)
+    _cache.move_to_end(folder)
+    entry = entries.get(path)
+    if entry is None or entry['signature'] != signature:
+        entry = entries[path] = {'signature': signature, 'frame': None, 'keys': {}}
+    return entry
+
+
+def read_extract(path):
+    """Baca file extract (pemisah '|', semua kolom string)."""
+    if _cache is None:
+        return pd.read_csv(path, sep='|', dtype=str)
+    entry = _entry(path)
+    if entry['frame'] is None:
+        entry['frame'] = pd.read_csv(path, sep='|', dtype=str)
+    # Script validasi mengubah kolom (to_numeric, dsb.), jadi selalu kembalikan salinan
+    return entry['frame'].copy()
+
+
+def read_columns(path, columns):
+    """Baca sebagian kolom saja; kolom yang tidak ada di file dilewati."""
+    wanted = set(columns)
+    if _cache is not None:
+        entry = _entry(path)
+        if entry['frame'] is not None:
+            return entry['frame'][[c for c in entry['frame'].columns if c in wanted]].copy()
+    return pd.read_csv(path, sep='|', dtype=str, usecols=lambda c: c in wanted)
+
+
+def key_set(path, column='CUST_NO'):
+    """Himpunan nilai unik satu kolom key; hanya kolom tersebut yang dibaca dari file."""
+    if _cache is None:
+        return set(pd.read_csv(path, sep='|', dtype=str, usecols=[column])[column])
+    entry = _entry(path)
+    if column not in entry['keys']:
+        if entry['frame'] is not None:
+            values = entry['frame'][column]
+        else:
+            values = pd.read_csv(path, sep='|', dtype=str, usecols=[column])[column]
+        entry['keys'][column] = frozenset(values)
+    return entry['keys'][column]
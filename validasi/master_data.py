@@ -0,0 +1,141 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# TABEL REFERENSI (MASTER DATA) DAN PENGECEKANNYA
+# ==========================================
+#
+# Tabel dibaca dari folder referensi (default: <folder script>/referensi),
+# format CSV dengan pemisah koma dan baris header:
+#
+#   dati_ii.csv            KODE_DATI_II[,NAMA_DATI_II,KODE_PROVINSI]
+#   zipcode.csv            ZIPCODE,KODE_DATI_II[,KECAMATAN,KELURAHAN]
+#   provinsi.csv           KODE_PROVINSI[,NAMA_PROVINSI]
+#   jabatan.csv            KODE[,KETERANGAN]      (MR_JOB_POSITION / JABATAN)
+#   pendidikan.csv         KODE[,KETERANGAN]
+#   jenis_badan_usaha.csv  KODE[,KETERANGAN]      (KODE_JENIS_BADAN_USAHA)
+#
+# Tabel yang tidak ada cukup dilewati, sehingga validasi format lama tetap jalan.
+
+REFERENCE_TABLES = {
+    'dati_ii': ('dati_ii.csv', 'KODE_DATI_II'),
+    'zipcode': ('zipcode.csv', 'ZIPCODE'),
+    'provinsi': ('provinsi.csv', 'KODE_PROVINSI'),
+    'jabatan': ('jabatan.csv', 'KODE'),
+    'pendidikan': ('pendidikan.csv', 'KODE'),
+    'jenis_badan_usaha': ('jenis_badan_usaha.csv', 'KODE'),
+}
+
+# Satu instance per folder referensi, agar server validasi tidak membaca ulang tabel
+# yang tidak berubah (tabel dibaca ulang bila mtime/ukuran file berubah, lihat MasterData.table)
+_loaded = {}
+
+
+def normalize(values):
+    """Samakan format kode/nama: string, tanpa spasi di ujung, huruf besar; blank/'nan' jadi NaN."""
+    values = pd.Series(values, copy=False).astype('string').str.strip().str.upper()
+    return values.mask(values.isin(['', 'NAN', 'NONE']))
+
+
+def _signature(path):
+    """(mtime, ukuran) file, atau None bila file tidak ada."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class MasterData:
+    """
+    Tabel referensi yang dimuat sekali, dengan hash index per kolom/pasangan kolom.
+    Tabel (dan index-nya) dibaca ulang bila file CSV-nya berubah, dibuat, atau dihapus.
+    """
+
+    def __init__(self, ref_dir):
+        self.ref_dir = ref_dir
+        self._tables = {}  # nama -> (signature file, DataFrame atau None)
+        self._indexes = {}
+
+    def table(self, name):
+        file_name, _ = REFERENCE_TABLES[name]
+        path = os.path.join(self.ref_dir, file_name)
+        signature = _signature(path)
+        cached = self._tables.get(name)
+        if cached is None or cached[0] != signature:
+            self._tables[name] = (signature, pd.read_csv(path, dtype=str) if signature is not None else None)
+            self._indexes = {key: index for key, index in self._indexes.items() if key[0] != name}
+        return self._tables[name][1]
+
+    def index(self, name, columns=None):
+        """Hash index (pd.Index / pd.MultiIndex) nilai unik kolom tabel referensi, atau None."""
+        columns = tuple(columns or (REFERENCE_TABLES[name][1],))
+        key = (name, columns)
+        table = self.table(name)
+        if key not in self._indexes:
+            if table is None or any(col not in table.columns for col in columns):
+                self._indexes[key] = None
+            elif len(columns) == 1:
+                self._indexes[key] = pd.Index(normalize(table[columns[0]]).dropna().unique())
+            else:
+                pairs = pd.DataFrame({col: normalize(table[col]) for col in columns}).dropna().drop_duplicates()
+                self._indexes[key] = pd.MultiIndex.from_frame(pairs)
+        return self._indexes[key]
+
+
+def load_master_data(ref_dir):
+    ref_dir = os.path.abspath(ref_dir)
+    if ref_dir not in _loaded:
+        _loaded[ref_dir] = MasterData(ref_dir)
+    return _loaded[ref_dir]
+
+
+def find_unknown_codes(df, column, index):
+    """Posisi baris yang kolomnya terisi tapi nilainya tidak ada di index referensi."""
+    if column not in df.columns:
+        return np.empty(0, dtype=np.int64)
+    values = normalize(df[column])
+    return np.flatnonzero((values.notna() & ~values.isin(index)).to_numpy())
+
+
+def find_inconsistent_pairs(df, columns, index):
+    """
+    Posisi baris yang semua kolomnya terisi dan kolom pertamanya (misal ZIPCODE)
+    terdaftar, tapi kombinasinya tidak ada di referensi. Kode yang tidak terdaftar
+    sudah dilaporkan oleh cek keanggotaan, jadi tidak dilaporkan dua kali di sini.
+    """
+    if any(col not in df.columns for col in columns):
+        return np.empty(0, dtype=np.int64)
+    values = pd.DataFrame({col: normalize(df[col]) for col in columns})
+    filled = values.notna().all(axis=1).to_numpy()
+    known = values[columns[0]].isin(index.levels[0]).to_numpy()
+    found = pd.MultiIndex.from_frame(values).isin(index)
+    return np.flatnonzero(filled & known & ~found)
+
+
+def run_reference_checks(df, store, master, checks):
+    """
+    Jalankan daftar cek referensi secara vektor dan catat hasilnya ke ErrorStore.
+    Setiap cek: (sheet, kolom di df, tabel, kolom di tabel, pesan); kolom boleh
+    berupa tuple untuk cek konsistensi pasangan (misal ZIPCODE & DATI_II).
+    """
+    if not os.path.isdir(master.ref_dir):
+        print(f"Info: folder referensi {master.ref_dir} tidak ditemukan, cek kode ke tabel referensi dilewati.")
+        return
+    skipped = []
+    for sheet_name, columns, table, ref_columns, message in checks:
+        index = master.index(table, ref_columns)
+        if index is None:
+            skipped.append(f"{REFERENCE_TABLES[table][0]} ({', '.join(ref_columns or (REFERENCE_TABLES[table][1],))})")
+            continue
+        if isinstance(columns, tuple):
+            positions = find_inconsistent_pairs(df, columns, index)
+            report_column = columns[-1]
+        else:
+            positions = find_unknown_codes(df, columns, index)
+            report_column = columns
+        store.add_many(sheet_name, positions, report_column, message)
+    if skipped:
+        print(f"Info: referensi tidak tersedia di {master.ref_dir}, cek dilewati: {'; '.join(dict.fromkeys(skipped))}")
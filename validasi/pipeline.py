@@ -0,0 +1,128 @@
+import os
+
+import pandas as pd
+
+from validasi.checkpoint import Checkpoint
+from validasi.diff import run_diff
+from validasi.engine import RuleCosts, evaluate_rules
+from validasi.error_store import ErrorStore
+from validasi.extracts import cache_enabled
+from validasi.master_data import load_master_data, run_reference_checks
+from validasi.plugins import VALIDATORS as PLUGIN_VALIDATORS
+from validasi.plugins import load_plugin_rules
+from validasi.progress import ProgressReporter
+from validasi.row_status import build_row_status, write_row_status
+from validasi.rules import sheet_names_of
+from validasi.summary import build_summary, write_summary_json
+
+# ==========================================
+# ALUR RUN VALIDASI BERSAMA
+# ==========================================
+#
+# Script validator hanya membaca & menyiapkan DataFrame serta daftar rule-nya,
+# sisanya sama untuk semua extract:
+#
+#   run = ValidationRun(args, current_dir, 'CUSTOMER', df_merged, sheet_names, input_paths,
+#                       __file__, reference_checks=REFERENCE_CHECKS)
+#   run.check_rules(RULES)
+#   run.write_results('DATA_CUSTOMER_TIDAK_VALID.xlsx', "Luar biasa! ...")
+
+
+class ValidationRun:
+    """
+    Satu run validator: rule plugin, ErrorStore, checkpoint, progres, ringkasan,
+    laporan perubahan, dan file hasil. `sheet_names` = sheet rule milik script
+    (urutan sheet di Excel); sheet cek referensi dan plugin ditambahkan di akhir.
+    Argumen tambahan diteruskan ke ErrorStore (kolom identitas, default, dsb).
+    """
+
+    def __init__(self, args, current_dir, validator, df, sheet_names, input_paths, script,
+                 reference_checks=(), resumable=True, **store_options):
+        self.args = args
+        self.current_dir = current_dir
+        self.validator = validator
+        self.df = df
+        self.input_paths = input_paths
+        self.reference_checks = reference_checks
+        script_dir = os.path.dirname(os.path.abspath(script))
+
+        # Rule tambahan dari folder plugin (lihat plugins.py), sheet-nya ditambahkan di akhir
+        plugin_dir = args.plugin or os.path.join(script_dir, 'plugin')
+        self.plugin_rules = load_plugin_rules(plugin_dir, validator) if validator in PLUGIN_VALIDATORS else []
+        sheet_names = list(sheet_names) + [check[0] for check in reference_checks]
+        sheet_names += [name for name in sheet_names_of(self.plugin_rules) if name not in sheet_names]
+
+        # Error disimpan sebagai (posisi baris, rule); kolom identitas diambil saat ditulis
+        self.store = ErrorStore(sheet_names, **store_options)
+
+        # Progres disimpan per chunk/stage; run yang terputus dilanjutkan bila isi input sama persis
+        paths = list(input_paths) + [os.path.abspath(script), plugin_dir]
+        self.ref_dir = None
+        if reference_checks:
+            self.ref_dir = args.referensi or os.path.join(script_dir, 'referensi')
+            paths.append(self.ref_dir)
+        # Di server (cache extract aktif) file dikenali dari mtime & ukuran seperti cache-nya;
+        # hash isi akan membaca ulang seluruh extract di setiap request
+        self.checkpoint = Checkpoint(current_dir, validator, paths, self.store,
+                                     enabled=args.checkpoint and resumable, by_stat=cache_enabled())
+        self.costs = RuleCosts()
+        self.progress = ProgressReporter(validator, len(df), self.store, args.metrics, self.costs)
+
+    def check_rules(self, rules):
+        """Cek `rules` + rule plugin per chunk baris, lalu cek referensi (bila ada)."""
+        rules = list(rules) + self.plugin_rules
+        for start, stop in self.checkpoint.chunks(len(self.df)):
+            evaluate_rules(self.df.iloc[start:stop], rules, self.store, self.args.engine,
+                           offset=start, costs=self.costs)
+            self.progress.update(stop, stop - start)
+
+        # Cek kode ke tabel referensi, vektor untuk semua baris sekaligus
+        if self.reference_checks:
+            self.progress.stage('referensi')
+            if self.checkpoint.pending('referensi'):
+                master = load_master_data(self.ref_dir)
+                run_reference_checks(self.df, self.store, master, self.reference_checks)
+                self.checkpoint.complete('referensi')
+
+    def write_results(self, output_name, clean_message):
+        """
+        Tulis ringkasan (JSON + sheet RINGKASAN), perubahan vs extract sebelumnya, dan
+        file Excel per sheet error `output_name` (atau row status bila --output csv/parquet).
+        """
+        df, store, validator = self.df, self.store, self.validator
+
+        # Ringkasan error per rule x partner x cabang (sheet RINGKASAN + JSON untuk monitoring)
+        summary = build_summary(df, store.sheet_names, store.rows, store.rules)
+        write_summary_json(os.path.join(self.current_dir, f'RINGKASAN_{validator}.json'), validator, summary, df.shape[0])
+
+        # Perubahan error dibanding extract sebelumnya (JSON + sheet PERUBAHAN)
+        changes = run_diff(
+            self.args.riwayat or os.path.join(self.current_dir, 'riwayat'), validator, df,
+            store.sheet_names, store.rows, store.rules, self.input_paths,
+            os.path.join(self.current_dir, f'PERUBAHAN_{validator}.json'),
+        )
+
+        self.progress.stage('output')
+
+        if self.args.output != 'xlsx':
+            # Mode row status: satu baris per record (bitmask + daftar rule gagal), tanpa file Excel
+            status = build_row_status(df, validator, store.sheet_names, store.rows, store.rules)
+            path = write_row_status(self.current_dir, validator, status, store.sheet_names, self.args.output)
+            print(f"Selesai! Status per baris tersimpan di: {path}")
+        else:
+            output_path = os.path.join(self.current_dir, output_name)
+            error_frames = store.sheet_frames(df)
+            if error_frames:
+                with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+                    summary.to_excel(writer, sheet_name='RINGKASAN', index=False)
+                    if changes is not None and not changes.empty:
+                        changes.to_excel(writer, sheet_name='PERUBAHAN', index=False)
+                    for sheet_name, df_error in error_frames.items():
+                        df_error.to_excel(writer, sheet_name=sheet_name, index=False)
+                print(f"Selesai! File detail error tersimpan di: {output_path}")
+            else:
+                print(clean_message)
+
+        # Output sudah tertulis: checkpoint tidak diperlukan lagi
+        self.checkpoint.finish()
+        self.progress.finish()
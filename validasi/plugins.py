@@ -0,0 +1,75 @@
+import importlib.util
+import os
+
+from validasi.rules import rule
+
+# ==========================================
+# RULE TAMBAHAN (PLUGIN) PER EXTRACT
+# ==========================================
+#
+# Rule baru cukup ditulis di file .py dalam folder plugin (default: folder
+# 'plugin' di samping script, atau --plugin), tanpa mengubah script validator:
+#
+#   from validasi.plugins import register
+#
+#   @register('customer', 'INVALID_EMAIL', 'EMAIL', "Format email salah")
+#   def check_email(value):                      # fungsi skalar: satu nilai -> True bila valid
+#       return '@' in str(value)
+#
+#   @register('coreaccount', 'INVALID_TENOR', 'TENOR', "Tenor harus 1-360", vectorized=True)
+#   def check_tenor(tenor):                      # fungsi vektor: Series -> mask (True = valid)
+#       import pandas as pd
+#       return pd.to_numeric(tenor, errors='coerce').between(1, 360).to_numpy()
+#
+# Fungsi skalar otomatis dijalankan sekali per nilai unik (lihat engine.py),
+# jadi tidak perlu ditulis ulang dalam bentuk vektor. Biaya setiap rule
+# (waktu, jumlah pemanggilan) dicatat di statistik run (lihat RuleCosts).
+
+VALIDATORS = ('COREACCOUNT', 'CUSTOMER', 'CUSTOMERPERSONAL', 'CUSTCORPORATE', 'CUSTCORPMANAGEMENT')
+RESERVED_SHEETS = ('RINGKASAN', 'PERUBAHAN')
+MAX_SHEET_NAME = 31  # batas panjang nama sheet Excel
+
+# Rule yang terdaftar selama load_plugin_rules() memuat file plugin
+_registered = []
+
+
+def register(validator, sheet, columns, message, report_column=None, vectorized=False):
+    """
+    Decorator untuk mendaftarkan fungsi cek sebagai rule validator `validator`
+    (nama extract, misal 'customer'). Argumen lain sama dengan rules.rule().
+    """
+    validator = validator.upper()
+    if validator not in VALIDATORS:
+        raise ValueError(f"Validator '{validator}' tidak dikenal, pilih salah satu: {', '.join(VALIDATORS)}")
+    if len(sheet) > MAX_SHEET_NAME or sheet.upper() in RESERVED_SHEETS:
+        raise ValueError(f"Nama sheet '{sheet}' tidak bisa dipakai (maksimal {MAX_SHEET_NAME} karakter, "
+                         f"bukan {'/'.join(RESERVED_SHEETS)})")
+
+    def decorator(check):
+        _registered.append((validator, rule(sheet, columns, check, message, report_column, vectorized)))
+        return check
+
+    return decorator
+
+
+def load_plugin_rules(plugin_dir, validator):
+    """
+    Muat semua file .py di `plugin_dir` (urut nama file) dan kembalikan rule
+    yang didaftarkan untuk `validator`. Folder yang tidak ada = tanpa rule tambahan.
+    Setiap pemanggilan memuat ulang file, jadi rule tidak terdaftar dua kali.
+    """
+    if not os.path.isdir(plugin_dir):
+        return []
+    del _registered[:]
+    for name in sorted(os.listdir(plugin_dir)):
+        if not name.endswith('.py') or name.startswith('_'):
+            continue
+        path = os.path.join(plugin_dir, name)
+        spec = importlib.util.spec_from_file_location(f'validasi_plugin_{name[:-3]}', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    rules = [r for v, r in _registered if v == validator.upper()]
+    del _registered[:]
+    if rules:
+        print(f"Info: {len(rules)} rule tambahan dari {plugin_dir}: {', '.join(dict.fromkeys(r.sheet for r in rules))}")
+    return rules
@@ -0,0 +1,200 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+# ==========================================
+# PROGRES & METRIK RUN (PER CHUNK/STAGE)
+# ==========================================
+#
+# Dipanggil sekali per chunk atau stage (bukan per baris), jadi tidak
+# menambah beban ke pengecekan vektor. Selain satu baris log di console,
+# metrik bisa ditulis ke:
+#   - file .prom : textfile Prometheus (ditimpa setiap update, untuk node_exporter)
+#   - file lain  : JSON lines (satu objek per update, ditambahkan di akhir file)
+# `{validator}` di path diganti nama validator, misal metrics/validasi_{validator}.prom.
+# Bila RuleCosts diberikan, biaya per rule ikut ditulis dan rule termahal
+# dicetak saat run selesai.
+
+
+def peak_memory_bytes():
+    """Puncak pemakaian memori proses (None bila tidak bisa dibaca di OS ini)."""
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_memory()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS byte
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _windows_peak_memory():
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize
+    except (AttributeError, OSError):
+        return None
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+class ProgressReporter:
+    """Pelapor progres satu validator: console + (opsional) file metrik."""
+
+    def __init__(self, validator, total_rows, store, metrics_path=None, costs=None):
+        self.validator = validator
+        self.total_rows = total_rows
+        self.store = store
+        self.costs = costs
+        self.metrics_path = metrics_path.replace('{validator}', validator.lower()) if metrics_path else None
+        self.stage_name = 'rules'
+        self.rows_done = 0
+        # Baris yang benar-benar dicek di run ini (chunk yang dimuat dari checkpoint tidak dihitung)
+        self.rows_checked = 0
+        self.started = time.perf_counter()
+
+    def snapshot(self):
+        elapsed = time.perf_counter() - self.started
+        counts = np.bincount(self.store.rules, minlength=len(self.store.sheet_names))
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'validator': self.validator,
+            'stage': self.stage_name,
+            'rows_done': int(self.rows_done),
+            'rows_total': int(self.total_rows),
+            'rows_checked': int(self.rows_checked),
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(self.rows_checked / elapsed, 1) if elapsed > 0 else 0.0,
+            'errors_total': int(counts.sum()),
+            'errors_per_rule': {name: int(n) for name, n in zip(self.store.sheet_names, counts) if n},
+            'memory_peak_bytes': peak_memory_bytes(),
+            'rule_costs': self.costs.table() if self.costs is not None else [],
+        }
+
+    def update(self, rows_done, rows_checked):
+        """
+        Dipanggil setelah satu chunk selesai. `rows_done` = posisi baris terakhir yang
+        sudah selesai (termasuk chunk dari checkpoint), `rows_checked` = jumlah baris
+        chunk ini; hanya yang terakhir ini dipakai untuk baris/detik.
+        """
+        self.rows_done = rows_done
+        self.rows_checked += rows_checked
+        self._emit()
+
+    def stage(self, name):
+        """Tandai awal stage berikutnya (referensi, output, ...); semua baris sudah lewat cek rule."""
+        self.stage_name = name
+        self.rows_done = self.total_rows
+        self._emit()
+
+    def finish(self):
+        self.stage_name = 'selesai'
+        self._emit()
+        if self.costs is not None:
+            self._print_costs()
+
+    def _print_costs(self, top=5):
+        costs = self.costs.table()
+        if not costs:
+            return
+        total = sum(cost['seconds'] for cost in costs) or 1.0
+        print(f"[{self.validator}] Rule termahal:")
+        for cost in costs[:top]:
+            print(f"  {cost['rule']} ({cost['columns']}, {cost['mode']}): {cost['seconds']:.2f} detik "
+                  f"({100.0 * cost['seconds'] / total:.0f}%), {cost['calls']} panggilan cek")
+        for cost in self.costs.expensive():
+            print(f"Peringatan: rule {cost['rule']} ({cost['columns']}) jauh lebih lambat dari rule lain "
+                  f"({cost['seconds']:.2f} detik); pertimbangkan versi vektor (vectorized=True).")
+
+    def _emit(self):
+        data = self.snapshot()
+        percent = 100.0 * data['rows_done'] / data['rows_total'] if data['rows_total'] else 100.0
+        print(f"[{self.validator}] {data['stage']}: {data['rows_done']}/{data['rows_total']} baris "
+              f"({percent:.1f}%), {data['rows_per_second']:.0f} baris/detik, {data['errors_total']} error")
+        if not self.metrics_path:
+            return
+        directory = os.path.dirname(self.metrics_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.metrics_path.endswith('.prom'):
+            self._write_prometheus(data)
+        else:
+            with open(self.metrics_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(data) + '\n')
+
+    def _write_prometheus(self, data):
+        v = f'validator="{_label(self.validator)}"'
+        lines = [
+            '# HELP validasi_rows_processed Jumlah baris yang sudah dicek.',
+            '# TYPE validasi_rows_processed gauge',
+            f'validasi_rows_processed{{{v}}} {data["rows_done"]}',
+            '# HELP validasi_rows_checked Jumlah baris yang dicek di run ini (tanpa chunk dari checkpoint).',
+            '# TYPE validasi_rows_checked gauge',
+            f'validasi_rows_checked{{{v}}} {data["rows_checked"]}',
+            '# HELP validasi_rows_total Jumlah baris yang akan dicek.',
+            '# TYPE validasi_rows_total gauge',
+            f'validasi_rows_total{{{v}}} {data["rows_total"]}',
+            '# HELP validasi_rows_per_second Throughput rata-rata baris yang dicek sejak run dimulai.',
+            '# TYPE validasi_rows_per_second gauge',
+            f'validasi_rows_per_second{{{v}}} {data["rows_per_second"]}',
+            '# HELP validasi_errors Jumlah error per rule.',
+            '# TYPE validasi_errors gauge',
+        ]
+        lines += [f'validasi_errors{{{v},rule="{_label(rule)}"}} {n}' for rule, n in data['errors_per_rule'].items()]
+        if data['rule_costs']:
+            lines += [
+                '# HELP validasi_rule_seconds Waktu cek per rule sejak run dimulai.',
+                '# TYPE validasi_rule_seconds gauge',
+            ]
+            lines += [
+                f'validasi_rule_seconds{{{v},rule="{_label(cost["rule"])}",columns="{_label(cost["columns"])}"}} {cost["seconds"]}'
+                for cost in data['rule_costs']
+            ]
+            lines += [
+                '# HELP validasi_rule_calls Jumlah pemanggilan fungsi cek per rule.',
+                '# TYPE validasi_rule_calls gauge',
+            ]
+            lines += [
+                f'validasi_rule_calls{{{v},rule="{_label(cost["rule"])}",columns="{_label(cost["columns"])}"}} {cost["calls"]}'
+                for cost in data['rule_costs']
+            ]
+        lines += [
+            '# HELP validasi_stage Stage yang sedang berjalan.',
+            '# TYPE validasi_stage gauge',
+            f'validasi_stage{{{v},stage="{_label(data["stage"])}"}} 1',
+            '# HELP validasi_last_update_timestamp_seconds Waktu update terakhir.',
+            '# TYPE validasi_last_update_timestamp_seconds gauge',
+            f'validasi_last_update_timestamp_seconds{{{v}}} {time.time():.0f}',
+        ]
+        if data['memory_peak_bytes'] is not None:
+            lines += [
+                '# HELP validasi_memory_peak_bytes Puncak memori proses.',
+                '# TYPE validasi_memory_peak_bytes gauge',
+                f'validasi_memory_peak_bytes{{{v}}} {data["memory_peak_bytes"]}',
+            ]
+        # Tulis ke file sementara lalu rename supaya node_exporter tidak membaca file setengah jadi
+        tmp_path = self.metrics_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.metrics_path)
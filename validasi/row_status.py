@@ -0,0 +1,132 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# OUTPUT "ROW STATUS": SATU BARIS PER RECORD
+# ==========================================
+
+KEY_COLUMNS = ['CUST_NO', 'AGRMNT_NO']
+RULES_FILE = 'ROW_STATUS_RULES.json'
+COMBINED_NAME = 'GABUNGAN'
+
+
+def build_masks(n_rows, n_rules, rows, rules):
+    """
+    Bitmask rule yang gagal per baris, dibentuk langsung dari array (baris, rule).
+    Setiap word uint64 menampung 64 rule: rule ke-i ada di word i // 64, bit i % 64.
+    """
+    n_words = max(1, -(-n_rules // 64))
+    masks = np.zeros((n_words, n_rows), dtype=np.uint64)
+    rows = np.asarray(rows, dtype=np.int64)
+    rules = np.asarray(rules, dtype=np.int64)
+    bits = np.left_shift(np.uint64(1), (rules % 64).astype(np.uint64))
+    for word in range(n_words):
+        sel = (rules // 64) == word
+        np.bitwise_or.at(masks[word], rows[sel], bits[sel])
+    return masks
+
+
+def masks_to_rules(masks, rule_names, prefix=''):
+    """Ubah bitmask menjadi daftar rule 'PREFIX:RULE;...' (dihitung sekali per kombinasi unik)."""
+    n_rows = masks.shape[1]
+    if not n_rows:
+        return np.empty(0, dtype=object)
+    combos, inverse = np.unique(masks.T, axis=0, return_inverse=True)
+    labels = []
+    for combo in combos:
+        failed = [
+            prefix + rule_names[word * 64 + bit]
+            for word, value in enumerate(combo)
+            for bit in range(64)
+            if int(value) >> bit & 1 and word * 64 + bit < len(rule_names)
+        ]
+        labels.append(';'.join(failed))
+    return np.array(labels, dtype=object)[inverse.reshape(-1)]
+
+
+def build_row_status(df, validator, rule_names, rows, rules, key_columns=KEY_COLUMNS):
+    """Satu baris per record yang divalidasi: key, bitmask, dan daftar rule yang gagal."""
+    masks = build_masks(len(df), len(rule_names), rows, rules)
+    status = pd.DataFrame({'ROW': np.arange(len(df), dtype=np.int64)})
+    for col in key_columns:
+        status[col] = df[col].to_numpy(dtype=object) if col in df.columns else None
+    status['SOURCE'] = validator
+    for word in range(masks.shape[0]):
+        status[f'RULE_MASK_{word}'] = masks[word]
+    failed = masks_to_rules(masks, rule_names)
+    status['FAILED_RULES'] = failed
+    status['JUMLAH_RULE_GAGAL'] = [label.count(';') + 1 if label else 0 for label in failed]
+    return status
+
+
+def _write(frame, path_base, fmt):
+    if fmt == 'parquet':
+        try:
+            frame.to_parquet(path_base + '.parquet', index=False)
+            return path_base + '.parquet'
+        except ImportError:
+            print("Peringatan: pyarrow/fastparquet tidak terpasang, row status disimpan sebagai CSV.")
+    frame.to_csv(path_base + '.csv', index=False)
+    return path_base + '.csv'
+
+
+def write_row_status(current_dir, validator, status, rule_names, fmt):
+    """Simpan ROW_STATUS_<VALIDATOR> dan catat urutan bit rule-nya di ROW_STATUS_RULES.json."""
+    rules_path = os.path.join(current_dir, RULES_FILE)
+    registry = {}
+    if os.path.exists(rules_path):
+        with open(rules_path, encoding='utf-8') as f:
+            registry = json.load(f)
+    registry[validator] = list(rule_names)
+    with open(rules_path, 'w', encoding='utf-8') as f:
+        json.dump(registry, f, indent=2)
+    return _write(status, os.path.join(current_dir, f'ROW_STATUS_{validator}'), fmt)
+
+
+def _read(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype={'CUST_NO': str, 'AGRMNT_NO': str, 'FAILED_RULES': str})
+
+
+def combine_row_status(current_dir, fmt='csv'):
+    """
+    Gabungkan ROW_STATUS_<VALIDATOR> dari kelima validator menjadi satu baris per CUST_NO
+    berisi bitmask per validator dan daftar semua rule yang gagal.
+    """
+    rules_path = os.path.join(current_dir, RULES_FILE)
+    if not os.path.exists(rules_path):
+        return None
+    with open(rules_path, encoding='utf-8') as f:
+        registry = json.load(f)
+
+    parts = {}
+    for validator in registry:
+        # Ambil file paling baru bila CSV dan Parquet sama-sama ada
+        paths = [os.path.join(current_dir, f'ROW_STATUS_{validator}{ext}') for ext in ('.parquet', '.csv')]
+        paths = [path for path in paths if os.path.exists(path)]
+        if paths:
+            parts[validator] = _read(max(paths, key=os.path.getmtime))
+    if not parts:
+        return None
+
+    keys = pd.Index(pd.concat([part['CUST_NO'] for part in parts.values()], ignore_index=True).dropna().unique())
+    combined = pd.DataFrame({'CUST_NO': keys})
+    labels = np.full(len(keys), '', dtype=object)
+    for validator, part in parts.items():
+        part = part[part['CUST_NO'].notna()]
+        codes = keys.get_indexer(part['CUST_NO'])
+        word_cols = sorted(c for c in part.columns if c.startswith('RULE_MASK_'))
+        masks = np.zeros((len(word_cols), len(keys)), dtype=np.uint64)
+        for word, col in enumerate(word_cols):
+            np.bitwise_or.at(masks[word], codes, part[col].to_numpy(dtype=np.uint64))
+            combined[f'{validator}_{col}'] = masks[word]
+        failed = masks_to_rules(masks, registry[validator], prefix=f'{validator}:')
+        labels = np.array([';'.join(filter(None, pair)) for pair in zip(labels, failed)], dtype=object)
+
+    combined['FAILED_RULES'] = labels
+    combined['JUMLAH_RULE_GAGAL'] = [label.count(';') + 1 if label else 0 for label in labels]
+    return _write(combined, os.path.join(current_dir, f'ROW_STATUS_{COMBINED_NAME}'), fmt)
@@ -0,0 +1,73 @@
+from collections import OrderedDict, namedtuple
+
+# ==========================================
+# DEFINISI RULE VALIDASI (TANPA PANDAS)
+# ==========================================
+#
+# Modul ini hanya memakai library standar supaya daftar RULES di setiap script
+# bisa dibuat saat import tanpa memuat pandas (lihat --check).
+
+Rule = namedtuple('Rule', ['sheet', 'columns', 'check', 'message', 'report_column', 'vectorized'])
+
+
+def rule(sheet, columns, check, message, report_column=None, vectorized=False):
+    """
+    Buat satu rule validasi.
+    - columns: kolom yang dikirim ke `check` (urutan = urutan argumen).
+    - check: fungsi nilai -> True bila valid. Bila vectorized=True, fungsi
+      menerima Series per kolom dan mengembalikan mask boolean (True = valid).
+    - message: teks KETERANGAN error, atau fungsi nilai -> teks.
+    - report_column: kolom yang ditampilkan di DATA_ORIGINAL (default kolom pertama).
+    """
+    if isinstance(columns, str):
+        columns = (columns,)
+    columns = tuple(columns)
+    return Rule(sheet, columns, check, message, report_column or columns[0], vectorized)
+
+
+def sheet_names_of(rules):
+    """Nama sheet unik sesuai urutan kemunculan rule."""
+    return list(dict.fromkeys(r.sheet for r in rules))
+
+
+class ResultCache:
+    """
+    Cache LRU berukuran terbatas untuk hasil rule per nilai unik:
+    kunci (fungsi cek, tuple nilai) -> hasil. Dipakai bersama oleh semua rule
+    dalam satu proses, jadi fungsi cek yang sama di kolom/validator lain
+    (misal alamat, kota, tempat lahir) tidak menghitung ulang nilai yang sama.
+    """
+
+    def __init__(self, maxsize=500_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def lookup(self, func, values):
+        key = (func, values)
+        try:
+            result = self._data[key]
+        except KeyError:
+            self.misses += 1
+            result = self._data[key] = func(*values)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return result
+        except TypeError:
+            # Nilai tidak bisa di-hash: hitung langsung tanpa cache
+            self.misses += 1
+            return func(*values)
+        self.hits += 1
+        self._data.move_to_end(key)
+        return result
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = 0
+
+
+RESULT_CACHE = ResultCache()
@@ -0,0 +1,42 @@
+import os
+
+# ==========================================
+# CEK SKEMA TANPA PANDAS (--check)
+# ==========================================
+#
+# Modul ini sengaja hanya memakai library standar supaya `--check` bisa
+# dijalankan tanpa menunggu import pandas/numpy.
+
+def read_header(path):
+    """Ambil nama kolom dari baris pertama file extract (pemisah '|')."""
+    with open(path, encoding='utf-8-sig', errors='replace') as f:
+        return [col.strip() for col in f.readline().rstrip('\r\n').split('|')]
+
+
+def check_schema(current_dir, input_files, required_columns, optional=()):
+    """
+    Pastikan setiap file input ditemukan dan memiliki kolom yang dibutuhkan.
+    `input_files`: {peran: nama file atau None}, `required_columns`: {peran: [kolom]}.
+    Mengembalikan 0 bila semua sesuai, 1 bila ada masalah (dipakai sebagai exit code).
+    """
+    problems = 0
+    for role, columns in required_columns.items():
+        file_name = input_files.get(role)
+        if not file_name:
+            if role in optional:
+                print(f"[SKIP] {role}: file tidak ditemukan (opsional)")
+            else:
+                print(f"[ERROR] {role}: file .txt tidak ditemukan di {current_dir}")
+                problems += 1
+            continue
+
+        header = set(read_header(os.path.join(current_dir, file_name)))
+        missing = [col for col in columns if col not in header]
+        if missing:
+            print(f"[ERROR] {file_name}: kolom tidak ditemukan: {', '.join(missing)}")
+            problems += 1
+        else:
+            print(f"[OK] {file_name}: {len(columns)} kolom wajib tersedia")
+
+    print("Skema valid." if not problems else f"Skema tidak valid ({problems} masalah).")
+    return 1 if problems else 0
@@ -0,0 +1,43 @@
+import importlib.util
+import os
+
+# ==========================================
+# MEMUAT SCRIPT VALIDATOR DARI KODE LAIN
+# ==========================================
+#
+# Dipakai oleh validasi-server.py dan benchmarks/: script validator memakai
+# nama file dengan '-', jadi tidak bisa di-import biasa. Modul ini hanya
+# memakai library standar (script validator sendiri memuat pandas secara lazy).
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VALIDATORS = ['coreaccount', 'customer', 'customerpersonal', 'custcorporate', 'custcorpmanagement']
+
+# Nama file contoh per peran, cocok dengan pola pencarian file di semua script
+FIXTURE_FILES = {
+    'coreaccount': 'coraccount_bench.txt',
+    'customer': 'customer_bench.txt',
+    'customerpersonal': 'customerpersonal_bench.txt',
+    'custcorporate': 'custcorporate_bench.txt',
+    'custcorpmanagement': 'custcorpmanagement_bench.txt',
+}
+
+
+def script_path(name, root_dir=ROOT_DIR):
+    return os.path.join(root_dir, f'validasi-data-{name}.py')
+
+
+def load_validator(name, root_dir=ROOT_DIR):
+    """Import validasi-data-<name>.py sebagai modul (setiap pemanggilan memuat ulang file)."""
+    spec = importlib.util.spec_from_file_location(f'validasi_data_{name}', script_path(name, root_dir))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def required_columns(names=VALIDATORS):
+    """Gabungan REQUIRED_COLUMNS validator `names` per peran file (urutan kolom pertama kali muncul)."""
+    columns = {role: [] for role in FIXTURE_FILES}
+    for name in names:
+        for role, cols in load_validator(name).REQUIRED_COLUMNS.items():
+            columns[role] += [c for c in cols if c not in columns[role]]
+    return columns
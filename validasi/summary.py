@@ -0,0 +1,69 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# RINGKASAN ERROR PER RULE x PARTNER x CABANG
+# ==========================================
+
+GROUP_COLUMNS = ['PARTNER_NAME', 'BRANCH_CODE']
+EMPTY_LABEL = '(KOSONG)'
+
+
+def build_summary(df, rule_names, rows, rule_ids, group_cols=GROUP_COLUMNS):
+    """
+    Hitung jumlah error per RULE x PARTNER_NAME x BRANCH_CODE dalam satu groupby.
+    `rows` dan `rule_ids` adalah posisi baris di `df` dan index rule (urutan
+    `rule_names`) untuk setiap error yang tercatat.
+    Error rate = jumlah baris yang gagal rule / jumlah baris yang dicek di grup itu.
+    """
+    keys = pd.DataFrame(index=df.index)
+    for col in group_cols:
+        values = df[col].astype(object) if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        keys[col] = values.where(values.notna() & (values.astype(str).str.strip() != ''), EMPTY_LABEL)
+    keys = keys.reset_index(drop=True)
+
+    checked = keys.groupby(group_cols, sort=False).size().rename('JUMLAH_DICEK').reset_index()
+
+    rows = np.asarray(rows, dtype=np.int64)
+    rule_ids = np.asarray(rule_ids, dtype=np.int64)
+    errors = keys.iloc[rows].reset_index(drop=True)
+    errors['RULE'] = pd.Categorical.from_codes(rule_ids, categories=list(rule_names))
+    errors['ROW'] = rows
+
+    summary = (
+        errors.groupby(['RULE'] + group_cols, sort=True, observed=True)['ROW']
+        .agg(JUMLAH_ERROR='size', JUMLAH_BARIS_ERROR='nunique')
+        .reset_index()
+    )
+    summary = summary.merge(checked, on=group_cols, how='left')
+    summary['ERROR_RATE'] = (summary['JUMLAH_BARIS_ERROR'] / summary['JUMLAH_DICEK']).round(4)
+    summary['RULE'] = summary['RULE'].astype(str)
+    return summary
+
+
+def write_summary_json(path, validator, summary, rows_checked):
+    """Simpan ringkasan ke JSON agar bisa dibaca monitoring tanpa membuka Excel."""
+    per_rule = summary.groupby('RULE', sort=False)[['JUMLAH_ERROR', 'JUMLAH_BARIS_ERROR']].sum()
+    payload = {
+        'validator': validator,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'rows_checked': int(rows_checked),
+        'total_errors': int(summary['JUMLAH_ERROR'].sum()),
+        'rules': {
+            rule: {
+                'errors': int(r['JUMLAH_ERROR']),
+                'rows_with_error': int(r['JUMLAH_BARIS_ERROR']),
+                'error_rate': round(int(r['JUMLAH_BARIS_ERROR']) / rows_checked, 4) if rows_checked else 0.0,
+            }
+            for rule, r in per_rule.iterrows()
+        },
+        'groups': json.loads(summary.to_json(orient='records')),
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)